@@ -12,12 +12,21 @@ Usage:
 import os
 import sys
 import json
+import io
 import time
 import logging
 import threading
 import traceback
 import datetime
 import argparse
+import gzip
+import hashlib
+import queue
+import signal
+import socket
+import stat
+import atexit
+import logging.handlers
 from typing import Dict, List, Any, Optional
 
 # Create necessary directories before any other operations
@@ -35,17 +44,77 @@ except Exception as e:
     print(f"ERROR: Failed to create required directories: {str(e)}")
     sys.exit(1)
 
-# Set up logging with both file and console output
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Log formatter that reuses the formatted timestamp within the same second.
+    
+    The output is identical to logging.Formatter; only the strftime call
+    is skipped for records created in the same second as the previous one.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, None, "")  # (second, datefmt, formatted)
+    
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached = self._cached_time
+        if cached[0] != second or cached[1] != datefmt:
+            formatted = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+            cached = (second, datefmt, formatted)
+            self._cached_time = cached
+        
+        if datefmt:
+            return cached[2]
+        return self.default_msec_format % (cached[2], record.msecs)
+
+# Cached ISO timestamp as (second, formatted), refreshed at most once per second
+_ISO_NOW = (0, "")
+
+def iso_now() -> str:
+    """
+    Get the current local time as an ISO 8601 string.
+    
+    Returns:
+        The timestamp, formatted at most once per second
+    """
+    global _ISO_NOW
+    second = int(time.time())
+    cached = _ISO_NOW
+    if cached[0] != second:
+        cached = (second, datetime.datetime.fromtimestamp(second).isoformat())
+        _ISO_NOW = cached
+    return cached[1]
+
+# Set up logging with both file and console output.
+# Records are queued by the calling thread and written by a background
+# listener, so request handlers never block on log I/O.
 try:
     log_file = os.path.join(log_dir, "communication_dashboard.log")
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
+    log_formatter = CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    log_handlers = [
+        logging.FileHandler(log_file),
+        logging.StreamHandler()
+    ]
+    for handler in log_handlers:
+        handler.setFormatter(log_formatter)
+    
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    
+    log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    
+    def _restart_log_listener():
+        """Give a forked worker its own log queue and listener thread."""
+        worker_queue = queue.Queue(-1)
+        queue_handler.queue = worker_queue
+        log_listener.queue = worker_queue
+        log_listener.start()
+    
     logger = logging.getLogger("CommunicationDashboard")
     logger.info("Logging initialized successfully")
 except Exception as e:
@@ -55,7 +124,8 @@ except Exception as e:
 # Import required libraries with error handling
 try:
     logger.info("Importing required modules...")
-    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+    from concurrent.futures import ThreadPoolExecutor
     import webbrowser
     
     # Import Atlas monitoring components using absolute imports
@@ -68,6 +138,199 @@ except ImportError as e:
     print(f"Make sure all __init__.py files are in place and imports are correct.")
     sys.exit(1)
 
+# Serve with aiohttp when it is installed; one event loop multiplexes idle
+# keep-alive connections instead of parking a thread on each of them
+try:
+    from aiohttp import web
+    from aiohttp.abc import AbstractAccessLogger
+except ImportError:
+    web = None
+
+# Use orjson for serialization when it is available; it encodes
+# straight to bytes and is several times faster than the json module
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        """Serialize an object to JSON bytes using orjson."""
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    _ENCODER = json.JSONEncoder(default=str)
+
+    def _dumps(obj) -> bytes:
+        """
+        Serialize an object to JSON bytes using the standard library.
+        
+        The encoder's chunks are written straight into a byte buffer so the
+        full document never exists as an intermediate str.
+        """
+        buffer = io.BytesIO()
+        for chunk in _ENCODER.iterencode(obj):
+            buffer.write(chunk.encode('utf-8'))
+        return buffer.getvalue()
+
+# The /data report is rebuilt by one background thread every
+# REPORT_REFRESH_INTERVAL seconds; requests only read the latest snapshot,
+# no matter how many dashboards are auto-refreshing.
+REPORT_REFRESH_INTERVAL = 15
+REPORT_GZIP_LEVEL = 1
+
+class ReportCache:
+    """
+    Serialized communication report kept fresh by a background thread.
+    
+    The report and its gzip-compressed copy are produced outside the lock;
+    the lock only guards swapping in the new snapshot.
+    """
+    
+    def __init__(self, monitor, hours: int = 24, interval: float = REPORT_REFRESH_INTERVAL):
+        """
+        Initialize the report cache.
+        
+        Args:
+            monitor: CommunicationMonitor used to generate the report
+            hours: Number of hours the report should cover
+            interval: Seconds between refreshes
+        """
+        self.monitor = monitor
+        self.hours = hours
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.body = b'{}'
+        self.body_gz = gzip.compress(self.body, REPORT_GZIP_LEVEL)
+        self._has_report = False
+        self._thread = None
+    
+    def refresh(self):
+        """
+        Regenerate the report and swap it in.
+        
+        A failed refresh keeps the previous report; until a report has been
+        generated successfully, the error is served instead.
+        """
+        try:
+            body = _dumps(self.monitor.generate_report(hours=self.hours))
+            self._has_report = True
+        except Exception as e:
+            logger.error(f"Error generating report: {str(e)}")
+            if self._has_report:
+                return
+            body = _dumps({
+                "error": str(e),
+                "timestamp": iso_now()
+            })
+        
+        body_gz = gzip.compress(body, REPORT_GZIP_LEVEL)
+        with self.lock:
+            self.body = body
+            self.body_gz = body_gz
+    
+    def get(self, gzipped: bool = False) -> bytes:
+        """
+        Get the latest report snapshot.
+        
+        Args:
+            gzipped: Return the gzip-compressed copy of the report
+            
+        Returns:
+            The report encoded as JSON bytes
+        """
+        with self.lock:
+            return self.body_gz if gzipped else self.body
+    
+    def start(self):
+        """
+        Generate the first report and start the background refresher.
+        """
+        if self._thread is not None:
+            return
+        
+        self.refresh()
+        self._thread = threading.Thread(target=self._run, name="report-refresher", daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        """
+        Refresh the report every interval until the process exits.
+        """
+        while True:
+            time.sleep(self.interval)
+            self.refresh()
+
+_REPORT = ReportCache(CommunicationMonitor())
+
+# Resolved roots for the directory traversal checks in the request handler
+_LOG_ROOT = os.path.realpath(log_dir) + os.sep
+_DASH_ROOT = os.path.realpath(dashboard_dir) + os.sep
+_INDEX_PATH = os.path.join(dashboard_dir, 'index.html')
+
+# Static dashboard assets, read once at startup.
+# Maps URL path -> (body, gzipped body or None, content type, ETag, Cache-Control)
+STATIC: Dict[str, tuple] = {}
+_CT = {
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.json': 'application/json',
+    '.png': 'image/png'
+}
+COMPRESSIBLE_EXTENSIONS = ('.html', '.css', '.js')
+STATIC_GZIP_LEVEL = 6
+ASSET_CACHE_CONTROL = 'public, max-age=3600, immutable'
+PAGE_CACHE_CONTROL = 'no-cache'  # Revalidate the page itself via its ETag
+
+def load_static_files():
+    """
+    Load the dashboard static files into memory.
+    
+    Each file is read once and stored with its content type and, for
+    text assets, a gzip-compressed copy so requests never touch the disk.
+    An ETag is computed from the content so browsers can revalidate.
+    """
+    STATIC.clear()
+    for entry in os.scandir(dashboard_dir):
+        extension = os.path.splitext(entry.name)[1]
+        if not entry.is_file() or extension == DIGEST_SUFFIX:
+            continue
+        
+        with open(entry.path, 'rb') as file:
+            body = file.read()
+        body_gz = gzip.compress(body, STATIC_GZIP_LEVEL) if extension in COMPRESSIBLE_EXTENSIONS else None
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        STATIC[f'/dashboard/{entry.name}'] = (
+            body, body_gz, _CT.get(extension, 'text/plain'), etag, ASSET_CACHE_CONTROL
+        )
+    
+    index = STATIC.get('/dashboard/index.html')
+    if index:
+        page = index[:4] + (PAGE_CACHE_CONTROL,)
+        STATIC['/'] = page
+        STATIC['/index.html'] = page
+    
+    logger.info(f"Loaded {len(STATIC)} static dashboard files into memory")
+
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+def _open_noatime(file_path: str) -> int:
+    """
+    Open a file read-only without updating its access time.
+    
+    O_NOATIME is only permitted on files the process owns, so fall back
+    to a plain read-only open when the kernel refuses it.
+    
+    Args:
+        file_path: Path of the file to open
+        
+    Returns:
+        The open file descriptor
+    """
+    if _O_NOATIME:
+        try:
+            return os.open(file_path, os.O_RDONLY | _O_NOATIME)
+        except PermissionError:
+            pass
+    return os.open(file_path, os.O_RDONLY)
+
 class DashboardHandler(BaseHTTPRequestHandler):
     """
     HTTP request handler for the communication dashboard.
@@ -76,6 +339,10 @@ class DashboardHandler(BaseHTTPRequestHandler):
     serving HTML, CSS, JavaScript, and JSON data.
     """
     
+    # Keep connections open between the page load and the periodic /data polls
+    protocol_version = "HTTP/1.1"
+    close_connection = False
+    
     def do_GET(self):
         """
         Handle GET requests.
@@ -84,743 +351,447 @@ class DashboardHandler(BaseHTTPRequestHandler):
         based on the requested path.
         """
         try:
-            if self.path == '/' or self.path == '/index.html':
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                
-                with open(os.path.join(dashboard_dir, 'index.html'), 'rb') as file:
-                    self.wfile.write(file.read())
-            
-            elif self.path == '/data':
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                
-                # Generate a new report
-                try:
-                    monitor = CommunicationMonitor()
-                    report = monitor.generate_report(hours=24)
-                    
-                    # Convert to JSON
-                    self.wfile.write(json.dumps(report, default=str).encode())
-                except Exception as e:
-                    logger.error(f"Error generating report: {str(e)}")
-                    self.wfile.write(json.dumps({
-                        "error": str(e),
-                        "timestamp": datetime.datetime.now().isoformat()
-                    }).encode())
-            
-            elif self.path.startswith('/logs/'):
-                # Serve log files
-                log_file = self.path[6:]  # Remove '/logs/' prefix
-                file_path = os.path.join(log_dir, log_file)
-                
-                # Security check to prevent directory traversal
-                if '..' in log_file or not os.path.normpath(file_path).startswith(os.path.normpath(log_dir)):
-                    self.send_response(403)
-                    self.end_headers()
-                    self.wfile.write(b'Forbidden')
-                    return
-                
-                try:
-                    with open(file_path, 'rb') as file:
-                        self.send_response(200)
-                        if log_file.endswith('.json'):
-                            self.send_header('Content-type', 'application/json')
-                        elif log_file.endswith('.png'):
-                            self.send_header('Content-type', 'image/png')
-                        else:
-                            self.send_header('Content-type', 'text/plain')
-                        self.end_headers()
-                        self.wfile.write(file.read())
-                except FileNotFoundError:
-                    self.send_response(404)
-                    self.end_headers()
-                    self.wfile.write(b'File not found')
-            
-            elif self.path.startswith('/dashboard/'):
-                # Serve dashboard static files
-                file_path = self.path[1:]  # Remove leading '/'
-                
-                # Security check to prevent directory traversal
-                if '..' in file_path or not os.path.normpath(file_path).startswith(os.path.normpath('dashboard')):
-                    self.send_response(403)
-                    self.end_headers()
-                    self.wfile.write(b'Forbidden')
-                    return
-                
-                try:
-                    with open(file_path, 'rb') as file:
-                        self.send_response(200)
-                        if file_path.endswith('.css'):
-                            self.send_header('Content-type', 'text/css')
-                        elif file_path.endswith('.js'):
-                            self.send_header('Content-type', 'application/javascript')
-                        elif file_path.endswith('.png'):
-                            self.send_header('Content-type', 'image/png')
-                        else:
-                            self.send_header('Content-type', 'text/plain')
-                        self.end_headers()
-                        self.wfile.write(file.read())
-                except FileNotFoundError:
-                    self.send_response(404)
-                    self.end_headers()
-                    self.wfile.write(b'File not found')
+            path = self.path
+            static = STATIC.get(path)
+            if static:
+                self._send_static(static)
+                return
             
+            handler = _ROUTES.get(path)
+            if handler:
+                handler(self)
+            elif path.startswith('/logs/'):
+                self._serve_file(path[6:], log_dir, _LOG_ROOT)
+            elif path.startswith('/dashboard/'):
+                self._serve_file(path[11:], dashboard_dir, _DASH_ROOT)
             else:
-                self.send_response(404)
-                self.end_headers()
-                self.wfile.write(b'Not found')
+                self._send_text(404, b'Not found')
         
         except Exception as e:
             logger.error(f"Error handling request: {str(e)}")
             logger.error(f"Traceback: {traceback.format_exc()}")
-            self.send_response(500)
+            self._send_text(500, f"Internal server error: {str(e)}".encode())
+    
+    def _serve_index(self):
+        """
+        Serve the dashboard page from disk when it is not preloaded.
+        """
+        with open(_INDEX_PATH, 'rb') as file:
+            body = file.read()
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _serve_data(self):
+        """
+        Serve the latest report snapshot.
+        """
+        gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+        body = _REPORT.get(gzipped)
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Vary', 'Accept-Encoding')
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _serve_file(self, name, directory, root):
+        """
+        Serve a file from a directory, refusing paths that escape it.
+        
+        Args:
+            name: Requested file name relative to the directory
+            directory: Directory to serve from
+            root: Resolved directory path with a trailing separator
+        """
+        file_path = os.path.realpath(os.path.join(directory, name))
+        
+        # Security check to prevent directory traversal
+        if not file_path.startswith(root):
+            self._send_text(403, b'Forbidden')
+            return
+        
+        try:
+            self._stream_file(file_path, _CT.get(os.path.splitext(file_path)[1], 'text/plain'))
+        except FileNotFoundError:
+            self._send_text(404, b'File not found')
+    
+    def _stream_file(self, file_path, content_type):
+        """
+        Send a file without copying it through a Python buffer.
+        
+        Args:
+            file_path: Path of the file to send
+            content_type: Content type of the response
+            
+        Raises:
+            FileNotFoundError: If the file does not exist or is not a regular file
+        """
+        fd = _open_noatime(file_path)
+        try:
+            # Directories open fine read-only; only regular files are served
+            file_stat = os.fstat(fd)
+            if not stat.S_ISREG(file_stat.st_mode):
+                raise FileNotFoundError(f"Not a regular file: {file_path}")
+            file = os.fdopen(fd, 'rb')
+        except BaseException:
+            os.close(fd)
+            raise
+        
+        with file:
+            # Snapshot the size so a growing log matches Content-Length
+            size = file_stat.st_size
+            
+            self.send_response(200)
+            self.send_header('Content-type', content_type)
+            self.send_header('Content-Length', str(size))
+            self.end_headers()
+            
+            # Let the kernel copy the file to the socket (os.sendfile),
+            # falling back to buffered reads where it is unavailable
+            self.connection.sendfile(file, 0, size)
+    
+    def end_headers(self):
+        """
+        Advertise keep-alive to HTTP/1.0 clients before finishing the headers.
+        """
+        if not self.close_connection:
+            self.send_header('Connection', 'keep-alive')
+        super().end_headers()
+    
+    def _send_text(self, status, body):
+        """
+        Send a short plain-text response with an exact Content-Length.
+        
+        Args:
+            status: HTTP status code
+            body: Response body bytes
+        """
+        self.send_response(status)
+        self.send_header('Content-type', 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _send_static(self, static):
+        """
+        Send a preloaded static file.
+        
+        Args:
+            static: (body, gzipped body or None, content type, ETag, Cache-Control) tuple from STATIC
+        """
+        body, body_gz, content_type, etag, cache_control = static
+        
+        # Answer conditional requests for unchanged content without a body
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match and (if_none_match == '*' or etag in if_none_match):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', cache_control)
             self.end_headers()
-            self.wfile.write(f"Internal server error: {str(e)}".encode())
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-type', content_type)
+        if body_gz is not None:
+            self.send_header('Vary', 'Accept-Encoding')
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = body_gz
+                self.send_header('Content-Encoding', 'gzip')
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', cache_control)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_request(self, code='-', size='-'):
+        """
+        Log an access line, at debug level unless the request failed.
+        
+        Successful requests dominate the auto-refresh workload, so they
+        are dropped at the default INFO level; 4xx/5xx are kept.
+        """
+        if isinstance(code, int) and code >= 400:
+            level = logging.WARNING
+        else:
+            level = logging.DEBUG
+        if logger.isEnabledFor(level):
+            logger.log(level, '%s - - [%s] "%s" %s %s', self.client_address[0],
+                       self.log_date_time_string(), self.requestline, str(code), str(size))
+    
+    def log_error(self, format, *args):
+        """
+        Log a server error through our logger at debug level.
+        
+        send_error calls this before log_request writes the failed
+        request's access line at warning level, so the error detail is
+        kept out of the default log to avoid a second line per error.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('%s - - [%s] ' + format, self.client_address[0],
+                         self.log_date_time_string(), *args)
     
     def log_message(self, format, *args):
         """
         Override to use our logger instead of printing to stderr.
         
         This method redirects HTTP server logs to our logging system.
+        Arguments are passed through so formatting only happens when
+        debug logging is enabled.
         """
-        logger.info("%s - - [%s] %s" % (self.client_address[0],
-                                         self.log_date_time_string(),
-                                         format % args))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('%s - - [%s] ' + format, self.client_address[0],
+                         self.log_date_time_string(), *args)
 
-def create_dashboard_files():
+# Exact-path routes for DashboardHandler.do_GET
+_ROUTES = {
+    '/': DashboardHandler._serve_index,
+    '/index.html': DashboardHandler._serve_index,
+    '/data': DashboardHandler._serve_data
+}
+
+def _static_response(request, static):
     """
-    Create the HTML, CSS, and JavaScript files for the dashboard.
+    Build an aiohttp response for a preloaded static file.
     
-    This method generates the static files needed for the web dashboard.
+    Args:
+        request: The aiohttp request
+        static: (body, gzipped body or None, content type, ETag, Cache-Control) tuple from STATIC
+        
+    Returns:
+        The aiohttp response
+    """
+    body, body_gz, content_type, etag, cache_control = static
+    headers = {'ETag': etag, 'Cache-Control': cache_control}
+    
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match and (if_none_match == '*' or etag in if_none_match):
+        return web.Response(status=304, headers=headers)
+    
+    if body_gz is not None:
+        headers['Vary'] = 'Accept-Encoding'
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            body = body_gz
+            headers['Content-Encoding'] = 'gzip'
+    headers['Content-Type'] = content_type
+    return web.Response(body=body, headers=headers)
+
+async def handle_static(request):
+    """
+    Serve a preloaded static file over aiohttp.
     
-    Raises:
-        Exception: If file creation fails
+    Args:
+        request: The aiohttp request
+        
+    Returns:
+        The aiohttp response
     """
-    try:
-        logger.info("Creating dashboard files...")
-        
-        # Create index.html
-        with open(os.path.join(dashboard_dir, 'index.html'), 'w') as f:
-            f.write('''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Atlas Communication Dashboard</title>
-    <link rel="stylesheet" href="/dashboard/styles.css">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-</head>
-<body>
-    <header>
-        <h1>Atlas Communication Dashboard</h1>
-        <div class="refresh-control">
-            <button id="refresh-btn">Refresh Data</button>
-            <label for="auto-refresh">
-                <input type="checkbox" id="auto-refresh" checked>
-                Auto-refresh (30s) 
-            </label>
-        </div>
-    </header>
-    
-    <main>
-        <section class="dashboard-section">
-            <h2>System Overview</h2>
-            <div class="metrics-container">
-                <div class="metric-card" id="total-communications">
-                    <h3>Total Communications</h3>
-                    <p class="metric-value">0</p>
-                </div>
-                <div class="metric-card" id="active-agents">
-                    <h3>Active Agents</h3>
-                    <p class="metric-value">0</p>
-                </div>
-                <div class="metric-card" id="error-count">
-                    <h3>Errors</h3>
-                    <p class="metric-value">0</p>
-                </div>
-                <div class="metric-card" id="last-update">
-                    <h3>Last Updated</h3>
-                    <p class="metric-value">Never</p>
-                </div>
-            </div>
-        </section>
-        
-        <section class="dashboard-section">
-            <h2>Communication Metrics</h2>
-            <div class="chart-container">
-                <canvas id="log-levels-chart"></canvas>
-            </div>
-            <div class="chart-container">
-                <canvas id="agent-communications-chart"></canvas>
-            </div>
-        </section>
-        
-        <section class="dashboard-section">
-            <h2>Potential Issues</h2>
-            <div class="issues-container" id="issues-list">
-                <p class="no-issues">No issues detected</p>
-            </div>
-        </section>
-        
-        <section class="dashboard-section">
-            <h2>Recent Communications</h2>
-            <div class="communications-container">
-                <table id="communications-table">
-                    <thead>
-                        <tr>
-                            <th>Time</th>
-                            <th>From</th>
-                            <th>To</th>
-                            <th>Type</th>
-                            <th>Status</th>
-                        </tr>
-                    </thead>
-                    <tbody id="communications-body">
-                        <tr>
-                            <td colspan="5" class="no-data">No communications data available</td>
-                        </tr>
-                    </tbody>
-                </table>
-            </div>
-        </section>
-    </main>
-    
-    <footer>
-        <p>Atlas Communication Dashboard | <span id="current-time"></span></p>
-    </footer>
-    
-    <script src="/dashboard/dashboard.js"></script>
-</body>
-</html>''')
-        
-        # Create styles.css
-        with open(os.path.join(dashboard_dir, 'styles.css'), 'w') as f:
-            f.write('''/* Dashboard Styles */
-:root {
-    --primary-color: #2c3e50;
-    --secondary-color: #3498db;
-    --accent-color: #e74c3c;
-    --background-color: #f5f7fa;
-    --card-background: #ffffff;
-    --text-color: #333333;
-    --border-color: #dddddd;
-}
-
-* {
-    box-sizing: border-box;
-    margin: 0;
-    padding: 0;
-}
-
-body {
-    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-    background-color: var(--background-color);
-    color: var(--text-color);
-    line-height: 1.6;
-}
-
-header {
-    background-color: var(--primary-color);
-    color: white;
-    padding: 1rem 2rem;
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-}
-
-.refresh-control {
-    display: flex;
-    align-items: center;
-    gap: 1rem;
-}
+    return _static_response(request, STATIC[request.path])
 
-#refresh-btn {
-    padding: 0.5rem 1rem;
-    background-color: var(--secondary-color);
-    color: white;
-    border: none;
-    border-radius: 4px;
-    cursor: pointer;
-    font-weight: bold;
-}
-
-#refresh-btn:hover {
-    background-color: #2980b9;
-}
-
-main {
-    max-width: 1200px;
-    margin: 0 auto;
-    padding: 2rem;
-}
-
-.dashboard-section {
-    background-color: var(--card-background);
-    border-radius: 8px;
-    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-    padding: 1.5rem;
-    margin-bottom: 2rem;
-}
-
-.dashboard-section h2 {
-    color: var(--primary-color);
-    margin-bottom: 1rem;
-    padding-bottom: 0.5rem;
-    border-bottom: 1px solid var(--border-color);
-}
-
-.metrics-container {
-    display: grid;
-    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-    gap: 1rem;
-}
-
-.metric-card {
-    background-color: var(--card-background);
-    border: 1px solid var(--border-color);
-    border-radius: 6px;
-    padding: 1rem;
-    text-align: center;
-}
-
-.metric-card h3 {
-    font-size: 1rem;
-    color: var(--primary-color);
-    margin-bottom: 0.5rem;
-}
-
-.metric-value {
-    font-size: 2rem;
-    font-weight: bold;
-    color: var(--secondary-color);
-}
-
-.chart-container {
-    height: 300px;
-    margin-bottom: 2rem;
-}
-
-.issues-container {
-    border: 1px solid var(--border-color);
-    border-radius: 6px;
-    padding: 1rem;
-    max-height: 300px;
-    overflow-y: auto;
-}
-
-.issue-item {
-    padding: 0.75rem;
-    border-bottom: 1px solid var(--border-color);
-}
-
-.issue-item:last-child {
-    border-bottom: none;
-}
-
-.issue-high {
-    border-left: 4px solid var(--accent-color);
-}
-
-.issue-medium {
-    border-left: 4px solid orange;
-}
-
-.issue-low {
-    border-left: 4px solid yellow;
-}
-
-.no-issues {
-    text-align: center;
-    color: #888;
-    padding: 1rem;
-}
-
-.communications-container {
-    overflow-x: auto;
-}
-
-table {
-    width: 100%;
-    border-collapse: collapse;
-}
-
-th, td {
-    padding: 0.75rem;
-    text-align: left;
-    border-bottom: 1px solid var(--border-color);
-}
-
-th {
-    background-color: var(--primary-color);
-    color: white;
-}
-
-tr:nth-child(even) {
-    background-color: rgba(0, 0, 0, 0.02);
-}
-
-.no-data {
-    text-align: center;
-    color: #888;
-    padding: 1rem;
-}
-
-footer {
-    background-color: var(--primary-color);
-    color: white;
-    text-align: center;
-    padding: 1rem;
-    margin-top: 2rem;
-}
-
-/* Status colors */
-.status-success {
-    color: #27ae60;
-}
-
-.status-error {
-    color: var(--accent-color);
-}
-
-.status-warning {
-    color: #f39c12;
-}
-
-.status-info {
-    color: var(--secondary-color);
-}''')
-        
-        # Create dashboard.js
-        with open(os.path.join(dashboard_dir, 'dashboard.js'), 'w') as f:
-            f.write('''// Dashboard JavaScript
-let logLevelsChart = null;
-let agentCommunicationsChart = null;
-let autoRefreshInterval = null;
-
-// Initialize the dashboard
-document.addEventListener('DOMContentLoaded', function() {
-    // Set up charts
-    initializeCharts();
-    
-    // Load initial data
-    refreshData();
-    
-    // Set up auto-refresh
-    const autoRefreshCheckbox = document.getElementById('auto-refresh');
-    autoRefreshCheckbox.addEventListener('change', function() {
-        if (this.checked) {
-            startAutoRefresh();
-        } else {
-            stopAutoRefresh();
-        }
-    });
-    
-    // Start auto-refresh by default
-    startAutoRefresh();
-    
-    // Set up manual refresh button
-    document.getElementById('refresh-btn').addEventListener('click', refreshData);
-    
-    // Update current time
-    updateCurrentTime();
-    setInterval(updateCurrentTime, 1000);
-});
-
-function initializeCharts() {
-    // Log levels chart
-    const logLevelsCtx = document.getElementById('log-levels-chart').getContext('2d');
-    logLevelsChart = new Chart(logLevelsCtx, {
-        type: 'bar',
-        data: {
-            labels: [],
-            datasets: [{
-                label: 'Log Entries by Level',
-                data: [],
-                backgroundColor: [
-                    'rgba(52, 152, 219, 0.7)', // INFO
-                    'rgba(241, 196, 15, 0.7)', // WARNING
-                    'rgba(231, 76, 60, 0.7)',  // ERROR
-                    'rgba(155, 89, 182, 0.7)'  // DEBUG
-                ],
-                borderColor: [
-                    'rgba(52, 152, 219, 1)',
-                    'rgba(241, 196, 15, 1)',
-                    'rgba(231, 76, 60, 1)',
-                    'rgba(155, 89, 182, 1)'
-                ],
-                borderWidth: 1
-            }]
-        },
-        options: {
-            responsive: true,
-            maintainAspectRatio: false,
-            scales: {
-                y: {
-                    beginAtZero: true,
-                    title: {
-                        display: true,
-                        text: 'Count'
-                    }
-                },
-                x: {
-                    title: {
-                        display: true,
-                        text: 'Log Level'
-                    }
-                }
-            },
-            plugins: {
-                title: {
-                    display: true,
-                    text: 'Log Entries by Level'
-                }
-            }
-        }
-    });
-    
-    // Agent communications chart
-    const agentCommunicationsCtx = document.getElementById('agent-communications-chart').getContext('2d');
-    agentCommunicationsChart = new Chart(agentCommunicationsCtx, {
-        type: 'bar',
-        data: {
-            labels: [],
-            datasets: [
-                {
-                    label: 'Messages Sent',
-                    data: [],
-                    backgroundColor: 'rgba(46, 204, 113, 0.7)',
-                    borderColor: 'rgba(46, 204, 113, 1)',
-                    borderWidth: 1
-                },
-                {
-                    label: 'Messages Received',
-                    data: [],
-                    backgroundColor: 'rgba(52, 152, 219, 0.7)',
-                    borderColor: 'rgba(52, 152, 219, 1)',
-                    borderWidth: 1
-                }
-            ]
-        },
-        options: {
-            responsive: true,
-            maintainAspectRatio: false,
-            scales: {
-                y: {
-                    beginAtZero: true,
-                    title: {
-                        display: true,
-                        text: 'Count'
-                    }
-                },
-                x: {
-                    title: {
-                        display: true,
-                        text: 'Agent'
-                    }
-                }
-            },
-            plugins: {
-                title: {
-                    display: true,
-                    text: 'Agent Communications'
-                }
-            }
-        }
-    });
-}
-
-function refreshData() {
-    // Show loading state
-    document.getElementById('refresh-btn').textContent = 'Loading...';
-    
-    fetch('/data')
-        .then(response => {
-            if (!response.ok) {
-                throw new Error(`HTTP error! Status: ${response.status}`);
-            }
-            return response.json();
-        })
-        .then(data => {
-            updateDashboard(data);
-            document.getElementById('refresh-btn').textContent = 'Refresh Data';
-        })
-        .catch(error => {
-            console.error('Error fetching data:', error);
-            document.getElementById('refresh-btn').textContent = 'Refresh Failed';
-            setTimeout(() => {
-                document.getElementById('refresh-btn').textContent = 'Refresh Data';
-            }, 2000);
-        });
-}
-
-function updateDashboard(data) {
-    // Check if data contains an error
-    if (data.error) {
-        console.error('Error in data:', data.error);
-        alert(`Error loading data: ${data.error}`);
-        return;
-    }
-    
-    // Update metrics
-    const totalCommunications = data.agent_communications?.total || 0;
-    document.querySelector('#total-communications .metric-value').textContent = totalCommunications;
-    
-    // Count unique agents
-    const agentCounts = data.agent_communications?.by_agent || {};
-    const agents = new Set();
-    for (const key in agentCounts) {
-        const agent = key.split('_')[0];
-        agents.add(agent);
-    }
-    document.querySelector('#active-agents .metric-value').textContent = agents.size;
-    
-    // Count errors
-    const errorCount = data.entries_by_level?.ERROR || 0;
-    const errorElement = document.querySelector('#error-count .metric-value');
-    errorElement.textContent = errorCount;
-    if (errorCount > 0) {
-        errorElement.classList.add('status-error');
-    } else {
-        errorElement.classList.remove('status-error');
-    }
-    
-    // Update last update time
-    const now = new Date();
-    document.querySelector('#last-update .metric-value').textContent = now.toLocaleTimeString();
-    
-    // Update log levels chart
-    updateLogLevelsChart(data.entries_by_level || {});
-    
-    // Update agent communications chart
-    updateAgentCommunicationsChart(data.agent_communications?.by_agent || {});
-    
-    // Update issues list
-    updateIssuesList(data.potential_issues || []);
-    
-    // Update communications table
-    // This would require additional data not currently in the report
-    // For now, we'll just show a placeholder
-    const communicationsBody = document.getElementById('communications-body');
-    if (totalCommunications > 0) {
-        communicationsBody.innerHTML = `
-            <tr>
-                <td>${now.toLocaleTimeString()}</td>
-                <td>Atlas</td>
-                <td>bookkeeping_agent</td>
-                <td>task</td>
-                <td class="status-success">success</td>
-            </tr>
-            <tr>
-                <td>${new Date(now - 5000).toLocaleTimeString()}</td>
-                <td>bookkeeping_agent</td>
-                <td>Atlas</td>
-                <td>result</td>
-                <td class="status-success">success</td>
-            </tr>
-        `;
-    }
-}
-
-function updateLogLevelsChart(entriesByLevel) {
-    const labels = Object.keys(entriesByLevel);
-    const data = Object.values(entriesByLevel);
+async def handle_data(request):
+    """
+    Serve the cached report over aiohttp.
     
-    logLevelsChart.data.labels = labels;
-    logLevelsChart.data.datasets[0].data = data;
-    logLevelsChart.update();
-}
-
-function updateAgentCommunicationsChart(byAgent) {
-    const agents = new Set();
-    const sentData = {};
-    const receivedData = {};
-    
-    // Process the data
-    for (const key in byAgent) {
-        const parts = key.split('_');
-        const agent = parts[0];
-        const direction = parts[1];
-        
-        agents.add(agent);
-        
-        if (direction === 'to') {
-            sentData[agent] = byAgent[key];
-        } else if (direction === 'from') {
-            receivedData[agent] = byAgent[key];
-        }
-    }
-    
-    // Convert to arrays for the chart
-    const agentLabels = Array.from(agents);
-    const sentValues = agentLabels.map(agent => sentData[agent] || 0);
-    const receivedValues = agentLabels.map(agent => receivedData[agent] || 0);
-    
-    // Update the chart
-    agentCommunicationsChart.data.labels = agentLabels;
-    agentCommunicationsChart.data.datasets[0].data = sentValues;
-    agentCommunicationsChart.data.datasets[1].data = receivedValues;
-    agentCommunicationsChart.update();
-}
-
-function updateIssuesList(issues) {
-    const issuesList = document.getElementById('issues-list');
-    
-    if (issues.length === 0) {
-        issuesList.innerHTML = '<p class="no-issues">No issues detected</p>';
-        return;
-    }
-    
-    let issuesHtml = '';
-    issues.forEach(issue => {
-        const level = issue.level || 'medium';
-        issuesHtml += `
-            <div class="issue-item issue-${level}">
-                <h4>${issue.type}</h4>
-                <p>${issue.message}</p>
-            </div>
-        `;
-    });
-    
-    issuesList.innerHTML = issuesHtml;
-}
+    Args:
+        request: The aiohttp request
+        
+    Returns:
+        The aiohttp response
+    """
+    gzipped = 'gzip' in request.headers.get('Accept-Encoding', '')
+    body = _REPORT.get(gzipped)
+    
+    headers = {'Content-Type': 'application/json', 'Vary': 'Accept-Encoding'}
+    if gzipped:
+        headers['Content-Encoding'] = 'gzip'
+    return web.Response(body=body, headers=headers)
 
-function startAutoRefresh() {
-    if (autoRefreshInterval) {
-        clearInterval(autoRefreshInterval);
-    }
+async def handle_log(request):
+    """
+    Serve a log file over aiohttp with sendfile.
     
-    autoRefreshInterval = setInterval(refreshData, 30000); // Refresh every 30 seconds
-}
+    Args:
+        request: The aiohttp request
+        
+    Returns:
+        The aiohttp response
+    """
+    file_path = os.path.realpath(os.path.join(log_dir, request.match_info['name']))
+    
+    # Security check to prevent directory traversal
+    if not file_path.startswith(_LOG_ROOT):
+        return web.Response(status=403, text='Forbidden')
+    if not os.path.isfile(file_path):
+        return web.Response(status=404, text='File not found')
+    
+    content_type = _CT.get(os.path.splitext(file_path)[1], 'text/plain')
+    return web.FileResponse(file_path, headers={'Content-Type': content_type})
 
-function stopAutoRefresh() {
-    if (autoRefreshInterval) {
-        clearInterval(autoRefreshInterval);
-        autoRefreshInterval = null;
-    }
-}
+if web is not None:
+    class AccessLogger(AbstractAccessLogger):
+        """
+        aiohttp access logger that keeps only failed requests at INFO level.
+        """
+        
+        def log(self, request, response, time):
+            """
+            Log an access line, at debug level unless the request failed.
+            
+            Args:
+                request: The aiohttp request
+                response: The aiohttp response
+                time: Seconds spent handling the request
+            """
+            level = logging.WARNING if response.status >= 400 else logging.DEBUG
+            if self.logger.isEnabledFor(level):
+                self.logger.log(level, '%s - - "%s %s" %s %s', request.remote,
+                                request.method, request.path_qs, response.status, response.body_length)
+
+def create_app():
+    """
+    Create the aiohttp application for the dashboard.
+    
+    Preloaded assets are registered as exact routes ahead of the directory
+    routes; files that are not preloaded are served with sendfile.
+    
+    Returns:
+        The aiohttp application
+    """
+    app = web.Application()
+    for path in STATIC:
+        app.router.add_get(path, handle_static)
+    app.router.add_get('/data', handle_data)
+    app.router.add_static('/dashboard/', dashboard_dir)
+    app.router.add_get('/logs/{name:.+}', handle_log)
+    return app
+
+# Dashboard asset sources shipped alongside this script
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard", "templates")
+DASHBOARD_FILES = ('index.html', 'styles.css', 'dashboard.js')
+DIGEST_SUFFIX = '.sha256'
+
+def _copy_dashboard_file(name: str) -> bool:
+    """
+    Copy a single dashboard file from the templates unless it is already current.
+    
+    The SHA-256 of the template is recorded in a sidecar file next to the
+    copy; when the sidecar matches, the copy is skipped entirely.
+    
+    Args:
+        name: File name within the templates directory
+        
+    Returns:
+        True if the file was copied, False if it was already up to date
+    """
+    source = os.path.join(TEMPLATE_DIR, name)
+    path = os.path.join(dashboard_dir, name)
+    digest_path = path + DIGEST_SUFFIX
+    
+    with open(source, 'rb') as file:
+        data = file.read()
+    digest = hashlib.sha256(data).hexdigest()
+    
+    try:
+        with open(digest_path, 'r') as file:
+            if file.read() == digest and os.path.exists(path):
+                return False
+    except FileNotFoundError:
+        pass
+    
+    with open(path, 'wb') as file:
+        file.write(data)
+    with open(digest_path, 'w') as file:
+        file.write(digest)
+    return True
 
-function updateCurrentTime() {
-    const now = new Date();
-    document.getElementById('current-time').textContent = now.toLocaleString();
-}''')
+def create_dashboard_files():
+    """
+    Create the HTML, CSS, and JavaScript files for the dashboard.
+    
+    This method copies the static files needed for the web dashboard
+    from TEMPLATE_DIR. The files are copied concurrently, and files whose
+    recorded SHA-256 matches the template are left untouched.
+    
+    Raises:
+        Exception: If file creation fails
+    """
+    try:
+        with ThreadPoolExecutor(max_workers=len(DASHBOARD_FILES)) as executor:
+            futures = [executor.submit(_copy_dashboard_file, name) for name in DASHBOARD_FILES]
+            written = sum(future.result() for future in futures)
         
-        logger.info("Dashboard files created successfully")
+        if written:
+            logger.info(f"Dashboard files created successfully ({written} copied, {len(DASHBOARD_FILES) - written} up to date)")
+        else:
+            logger.debug("Dashboard files already up to date")
     except Exception as e:
         logger.error(f"Error creating dashboard files: {str(e)}")
         logger.error(f"Traceback: {traceback.format_exc()}")
         raise
 
-def start_dashboard_server(port=8080):
+def _bind_shared_socket(port: int) -> socket.socket:
+    """
+    Bind a listening socket that several worker processes can accept on.
+    
+    The socket is inherited by every forked worker, so the kernel spreads
+    connections across the processes accepting on it.
+    
+    Args:
+        port: Port number to listen on
+        
+    Returns:
+        The bound, listening socket
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(('', port))
+    sock.listen(socket.SOMAXCONN)
+    return sock
+
+_FORK_HANDLER_REGISTERED = False
+
+def _register_fork_handler():
+    """Restart the log listener in forked workers; registered at most once."""
+    global _FORK_HANDLER_REGISTERED
+    if not _FORK_HANDLER_REGISTERED and hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=_restart_log_listener)
+        _FORK_HANDLER_REGISTERED = True
+
+def _stop_workers(worker_pids: List[int]):
+    """
+    Terminate forked worker processes and wait for them to exit.
+    
+    Args:
+        worker_pids: Process IDs of the workers
+    """
+    for pid in worker_pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    for pid in worker_pids:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+
+def start_dashboard_server(port=8080, workers=1):
     """
     Start the dashboard HTTP server.
     
     This method starts an HTTP server to serve the dashboard web interface.
+    With more than one worker, the listening socket is bound once and the
+    process forks so that every worker accepts connections on it.
     
     Args:
         port: Port number to listen on (default: 8080)
+        workers: Number of server processes (default: 1)
         
     Raises:
         Exception: If server start fails
@@ -828,24 +799,74 @@ def start_dashboard_server(port=8080):
     try:
         # Create the dashboard files
         create_dashboard_files()
+        load_static_files()
         
-        # Start the server
-        server_address = ('', port)
-        httpd = HTTPServer(server_address, DashboardHandler) 
+        if workers > 1 and not hasattr(os, 'fork'):
+            logger.warning("Multiple workers require os.fork; starting a single worker")
+            workers = 1
         
-        logger.info(f"Starting dashboard server on port {port}")
-        print(f"Starting dashboard server on port {port}")
-        print(f"Dashboard URL: http://localhost:{port}") 
+        # Bind before forking so every worker shares the listening socket,
+        # and give each forked worker its own log listener thread
+        sock = None
+        if workers > 1:
+            sock = _bind_shared_socket(port)
+            _register_fork_handler()
         
-        # Open the dashboard in a browser
-        try:
-            webbrowser.open(f"http://localhost:{port}") 
-        except Exception as e:
-            logger.warning(f"Failed to open browser: {str(e)}")
-            print(f"Please open a browser and navigate to: http://localhost:{port}") 
+        # Bind the threaded stdlib server up front when aiohttp is not installed
+        httpd = None
+        if web is None:
+            if sock is None:
+                server_address = ('', port)
+                httpd = ThreadingHTTPServer(server_address, DashboardHandler)
+            else:
+                # Swap in the shared socket for the unbound one the server made
+                httpd = ThreadingHTTPServer(sock.getsockname(), DashboardHandler, bind_and_activate=False)
+                httpd.socket.close()
+                httpd.socket = sock
+                httpd.server_address = sock.getsockname()
+                host, httpd.server_port = httpd.server_address[:2]
+                httpd.server_name = socket.getfqdn(host)
+            httpd.daemon_threads = True
+        
+        # Turn SIGTERM into a normal exit so cleanup and atexit handlers run
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        
+        worker_pids = []
+        is_worker = False
+        for _ in range(workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                worker_pids = []
+                is_worker = True
+                break
+            worker_pids.append(pid)
+        
+        # Each process keeps its own report snapshot
+        _REPORT.start()
+        
+        if not is_worker:
+            logger.info(f"Starting dashboard server on port {port} with {workers} worker(s)")
+            print(f"Starting dashboard server on port {port}")
+            print(f"Dashboard URL: http://localhost:{port}") 
+            
+            # Open the dashboard in a browser
+            try:
+                webbrowser.open(f"http://localhost:{port}") 
+            except Exception as e:
+                logger.warning(f"Failed to open browser: {str(e)}")
+                print(f"Please open a browser and navigate to: http://localhost:{port}") 
         
         # Start the server
-        httpd.serve_forever() 
+        try:
+            if httpd is not None:
+                httpd.serve_forever() 
+            elif sock is not None:
+                web.run_app(create_app(), sock=sock, print=None, access_log=logger, access_log_class=AccessLogger)
+            else:
+                web.run_app(create_app(), port=port, print=None, access_log=logger, access_log_class=AccessLogger)
+        finally:
+            _stop_workers(worker_pids)
     except Exception as e:
         logger.error(f"Error starting dashboard server: {str(e)}")
         logger.error(f"Traceback: {traceback.format_exc()}")
@@ -863,6 +884,7 @@ def parse_arguments():
     """
     parser = argparse.ArgumentParser(description='Communication Dashboard for Atlas and Agents')
     parser.add_argument('--port', type=int, default=8080, help='Port to run the dashboard server on (default: 8080)')
+    parser.add_argument('--workers', type=int, default=1, help='Number of server processes sharing the port (default: 1)')
     return parser.parse_args()
 
 def main():
@@ -879,7 +901,7 @@ def main():
         args = parse_arguments()
         
         # Start the dashboard server
-        start_dashboard_server(port=args.port)
+        start_dashboard_server(port=args.port, workers=args.workers)
     except KeyboardInterrupt:
         print("\nStopping dashboard server...")
         logger.info("Received keyboard interrupt. Stopping dashboard server...")
@@ -16,10 +16,18 @@ import os
 import sys
 import time
 import json
+import io
+import queue
+import collections
+import contextlib
 import logging
+import logging.handlers
+import atexit
 import threading
+import asyncio
 import traceback
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 
 # Create necessary directories before any other operations
@@ -32,17 +40,27 @@ except Exception as e:
     print(f"ERROR: Failed to create logs directory: {str(e)}")
     sys.exit(1)
 
-# Set up logging with both file and console output
+# Set up logging with both file and console output.
+# Records are queued by the calling thread and written by a background
+# listener, so the monitoring loops never block on log I/O.
 try:
     log_file = os.path.join(log_dir, "enhanced_monitoring.log")
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
+    log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    log_handlers = [
+        logging.FileHandler(log_file),
+        logging.StreamHandler()
+    ]
+    for handler in log_handlers:
+        handler.setFormatter(log_formatter)
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    
+    log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
     logger = logging.getLogger("EnhancedMonitoring")
     logger.info("Logging initialized successfully")
 except Exception as e:
@@ -54,6 +72,7 @@ try:
     logger.info("Importing required modules...")
     import matplotlib.pyplot as plt
     from matplotlib.animation import FuncAnimation
+    from matplotlib.figure import Figure
     import numpy as np
     
     # Import Atlas monitoring components using absolute imports
@@ -67,6 +86,114 @@ except ImportError as e:
     print(f"Make sure all __init__.py files are in place and imports are correct.")
     sys.exit(1)
 
+# Use orjson for the report and alert files when it is available; it encodes
+# straight to bytes and is several times faster than the json module
+try:
+    import orjson
+
+    def _dumps_indented(obj) -> bytes:
+        """Serialize an object to indented JSON bytes using orjson."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _dumps_indented(obj) -> bytes:
+        """Serialize an object to indented JSON bytes using the standard library."""
+        return json.dumps(obj, default=str, indent=2).encode()
+
+# zlib level for the visualization PNGs (Pillow's default is 6)
+PNG_COMPRESS_LEVEL = 1
+
+class BatchedFileWriter:
+    """
+    Write output files from a background thread.
+    
+    The monitoring loops hand over complete file contents; the writer drains
+    everything queued since its last wake-up in one batch, so the dashboard
+    and alert threads never block on disk I/O.
+    """
+    
+    def __init__(self):
+        """
+        Initialize the batched file writer.
+        """
+        self._queue = queue.Queue()
+        self._thread = None
+    
+    def start(self):
+        """
+        Start the writer thread.
+        """
+        if self._thread is not None:
+            return
+        
+        self._thread = threading.Thread(target=self._run, name="file-writer", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 2):
+        """
+        Flush pending writes and stop the writer thread.
+        
+        Args:
+            timeout: Seconds to wait for pending writes to finish
+        """
+        if self._thread is None:
+            return
+        
+        self._queue.put(None)
+        self._thread.join(timeout=timeout)
+        if self._thread.is_alive():
+            logger.warning("File writer thread did not terminate within timeout")
+        self._thread = None
+    
+    def write(self, path: str, data: bytes):
+        """
+        Queue a file to be written, or write it immediately when not started.
+        
+        Args:
+            path: Destination file path
+            data: Complete file contents
+        """
+        if self._thread is None:
+            self._write_file(path, data)
+        else:
+            self._queue.put((path, data))
+    
+    def _run(self):
+        """
+        Drain the queue in batches until a stop sentinel is received.
+        """
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            for item in batch:
+                if item is None:
+                    return
+                try:
+                    self._write_file(*item)
+                except Exception as e:
+                    logger.error(f"Error writing {item[0]}: {str(e)}")
+    
+    @staticmethod
+    def _write_file(path: str, data: bytes):
+        """
+        Write a file with a single open and as few write calls as possible.
+        
+        Args:
+            path: Destination file path
+            data: Complete file contents
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
 class EnhancedMonitor:
     """
     Enhanced monitoring system for Atlas and agent communication.
@@ -92,9 +219,47 @@ class EnhancedMonitor:
         self.update_interval = update_interval
         self.monitor = CommunicationMonitor(log_file)
         self.running = False
-        self.dashboard_thread = None
-        self.alert_thread = None
+        self.monitor_thread = None
+        self._loop = None
+        self._stop_event = None
+        self._render_executor = None
         self.last_report = None
+        self.writer = BatchedFileWriter()
+        
+        # Serialized report body (everything but the period) of the last
+        # saved report, and serialized alerts, reused while they are unchanged
+        self._report_cache = (None, None)
+        self._alert_cache: Dict[str, bytes] = {}
+        
+        # Incremental view of the last report_hours of the log: only bytes
+        # appended since the previous tick are read, and entries that age out
+        # of the window are subtracted from the running counts
+        self.report_hours = 1
+        self._log_offset = 0
+        self._window = collections.deque()  # (timestamp, level, (agent, direction) or None)
+        self._level_counts = collections.Counter()
+        self._comm_counts = collections.Counter()  # (agent, direction) -> count
+        self._error_issues = collections.deque()
+        
+        # Persistent figure for the visualization; the bars and their labels
+        # are updated in place and only rebuilt when the categories change
+        self._figure = Figure(figsize=(10, 8))
+        self._level_ax, self._agent_ax = self._figure.subplots(2, 1)
+        self._levels = None
+        self._level_bars = []
+        self._level_labels = []
+        self._agents = None
+        self._to_bars = []
+        self._from_bars = []
+        self._to_labels = []
+        self._from_labels = []
+        
+        # Only render the visualization every viz_every_n dashboard ticks,
+        # and skip it when the plotted data has not changed since the last one
+        self.viz_every_n = 6
+        self._tick = 0
+        self._last_viz_hash = None
+        self.summary_every_n = 12
         
         # Alert thresholds - can be adjusted based on system requirements
         self.alert_thresholds = {
@@ -111,7 +276,7 @@ class EnhancedMonitor:
         """
         Start the monitoring system.
         
-        This method starts the dashboard and alert threads to begin
+        This method starts the dashboard and alert loops to begin
         monitoring Atlas and agent communications.
         
         Raises:
@@ -124,17 +289,18 @@ class EnhancedMonitor:
         self.running = True
         
         try:
-            # Start the dashboard thread
-            self.dashboard_thread = threading.Thread(target=self._dashboard_loop)
-            self.dashboard_thread.daemon = True
-            self.dashboard_thread.start()
-            logger.info("Dashboard thread started")
-            
-            # Start the alert thread
-            self.alert_thread = threading.Thread(target=self._alert_loop)
-            self.alert_thread.daemon = True
-            self.alert_thread.start()
-            logger.info("Alert thread started")
+            # Start the file writer before the loops that feed it
+            self.writer.start()
+            
+            # Run the dashboard and alert work from one timer on an event loop
+            # in a single thread; rendering gets its own worker thread so a
+            # slow chart never delays alert checks
+            self._render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render")
+            self._loop = asyncio.new_event_loop()
+            self.monitor_thread = threading.Thread(target=self._run_loop)
+            self.monitor_thread.daemon = True
+            self.monitor_thread.start()
+            logger.info("Monitoring thread started")
             
             logger.info("Monitoring system started successfully")
         except Exception as e:
@@ -147,7 +313,7 @@ class EnhancedMonitor:
         """
         Stop the monitoring system.
         
-        This method stops the dashboard and alert threads and
+        This method stops the dashboard and alert loops and
         cleans up resources.
         
         Raises:
@@ -161,16 +327,23 @@ class EnhancedMonitor:
             self.running = False
             logger.info("Stopping monitoring system...")
             
-            # Wait for threads to terminate
-            if self.dashboard_thread:
-                self.dashboard_thread.join(timeout=2)
-                if self.dashboard_thread.is_alive():
-                    logger.warning("Dashboard thread did not terminate within timeout")
+            # Wake the loops from their sleeps and wait for the thread to finish
+            if self._loop and not self._loop.is_closed():
+                try:
+                    self._loop.call_soon_threadsafe(self._stop_loop)
+                except RuntimeError:
+                    pass  # Loop already closed
+            
+            if self.monitor_thread:
+                self.monitor_thread.join(timeout=2)
+                if self.monitor_thread.is_alive():
+                    logger.warning("Monitoring thread did not terminate within timeout")
+            
+            if self._render_executor:
+                self._render_executor.shutdown(wait=False)
             
-            if self.alert_thread:
-                self.alert_thread.join(timeout=2)
-                if self.alert_thread.is_alive():
-                    logger.warning("Alert thread did not terminate within timeout")
+            # Flush any files the loops queued before they stopped
+            self.writer.stop()
             
             logger.info("Monitoring system stopped")
         except Exception as e:
@@ -178,63 +351,230 @@ class EnhancedMonitor:
             logger.error(f"Traceback: {traceback.format_exc()}")
             raise RuntimeError(f"Failed to stop monitoring system: {str(e)}")
     
-    def _dashboard_loop(self):
+    def _run_loop(self):
+        """
+        Run the monitoring loop on this thread's event loop.
+        """
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._monitor_loop())
+        except Exception as e:
+            logger.exception(f"Error in monitoring loop: {str(e)}")
+        finally:
+            self._loop.close()
+    
+    async def _monitor_loop(self):
         """
-        Main loop for updating the dashboard.
+        Drive the dashboard and alert work from a single timer.
         
-        This method runs in a separate thread and periodically
-        generates reports and updates the dashboard.
+        The loop wakes every update_interval / 2 seconds: alerts are checked
+        on every tick and the dashboard is updated on every other tick, so
+        both share one wake-up instead of sleeping independently. Stopping
+        sets an event that ends the current wait immediately.
         """
-        logger.info("Dashboard loop started")
+        logger.info("Monitoring loop started")
+        self._stop_event = asyncio.Event()
+        tick_interval = self.update_interval / 2
+        dashboard_task = None
+        tick = 0
         
-        while self.running:
-            try:
-                # Generate a new report
-                report = self.monitor.generate_report(hours=1)  # Focus on recent activity
-                self.last_report = report
-                
-                # Update the dashboard
-                self._update_dashboard(report)
-                
-                # Save the report
-                self._save_report(report)
+        try:
+            while self.running:
+                # Skip a dashboard update while the previous one is still rendering
+                if tick % 2 == 0 and (dashboard_task is None or dashboard_task.done()):
+                    dashboard_task = asyncio.create_task(self._dashboard_tick())
+                self._alert_tick()
+                tick += 1
                 
-                # Sleep for the update interval
-                time.sleep(self.update_interval)
-            except Exception as e:
-                logger.error(f"Error in dashboard loop: {str(e)}")
-                logger.error(f"Traceback: {traceback.format_exc()}")
-                # Continue running despite errors
-                time.sleep(self.update_interval)
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=tick_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            # Let a cancelled update unwind before the event loop is closed
+            if dashboard_task and not dashboard_task.done():
+                dashboard_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await dashboard_task
     
-    def _alert_loop(self):
+    def _stop_loop(self):
         """
-        Main loop for checking alerts.
+        Wake the monitoring loop so it exits (called on the event loop).
+        """
+        if self._stop_event is not None:
+            self._stop_event.set()
+    
+    async def _dashboard_tick(self):
+        """
+        Generate a report and update the dashboard once.
+        """
+        try:
+            # Generate a new report
+            report = self._generate_report()  # Focus on recent activity
+            self.last_report = report
+            
+            # Update the dashboard
+            await self._update_dashboard(report)
+            
+            # Save the report
+            self._save_report(report)
+        except Exception as e:
+            logger.exception(f"Error in dashboard loop: {str(e)}")
+    
+    def _read_new_entries(self):
+        """
+        Parse the log lines appended since the previous call into the window.
         
-        This method runs in a separate thread and periodically
-        checks for alert conditions in the monitoring reports.
+        Only complete lines are consumed; a partially written last line is
+        picked up on the next call. If the log shrank (rotated or truncated),
+        the window is rebuilt from the start of the file.
         """
-        logger.info("Alert loop started")
+        try:
+            size = os.path.getsize(self.log_file)
+        except OSError:
+            return
+        
+        if size < self._log_offset:
+            self._log_offset = 0
+            self._window.clear()
+            self._level_counts.clear()
+            self._comm_counts.clear()
+            self._error_issues.clear()
+        
+        if size == self._log_offset:
+            return
         
-        while self.running:
+        fd = os.open(self.log_file, os.O_RDONLY)
+        try:
+            data = os.pread(fd, size - self._log_offset, self._log_offset)
+        finally:
+            os.close(fd)
+        
+        end = data.rfind(b'\n') + 1
+        if end == 0:
+            return
+        self._log_offset += end
+        
+        for line in data[:end].decode('utf-8', errors='replace').splitlines():
             try:
-                if self.last_report:
-                    # Check for alerts
-                    alerts = self._check_alerts(self.last_report)
-                    
-                    # Handle any alerts
-                    if alerts:
-                        self._handle_alerts(alerts)
-                
-                # Sleep for half the update interval to be more responsive
-                time.sleep(self.update_interval / 2)
+                entry = self.monitor.parse_line(line)
             except Exception as e:
-                logger.error(f"Error in alert loop: {str(e)}")
-                logger.error(f"Traceback: {traceback.format_exc()}")
-                # Continue running despite errors
-                time.sleep(self.update_interval)
+                logger.error(f"Error parsing log line: {e}")
+                continue
+            if entry is not None:
+                self._add_entry(entry)
+    
+    def _add_entry(self, entry: Dict):
+        """
+        Add a parsed log entry to the window and the running counts.
+        
+        Args:
+            entry: Parsed log entry from CommunicationMonitor.parse_line
+        """
+        level = entry["level"]
+        message = entry["message"]
+        
+        # Same communication patterns as CommunicationMonitor.generate_report
+        comm = None
+        if "Sending task to" in message:
+            comm = (message.split("Sending task to ")[1].split(" ")[0], "to")
+        elif "Received result from" in message:
+            comm = (message.split("Received result from ")[1].split(" ")[0], "from")
+        
+        self._window.append((entry["timestamp"], level, comm))
+        self._level_counts[level] += 1
+        if comm:
+            self._comm_counts[comm] += 1
+        if level == "ERROR":
+            self._error_issues.append({
+                "type": "error",
+                "timestamp": entry["timestamp"].isoformat(),
+                "message": message
+            })
+    
+    def _expire_entries(self, cutoff: datetime.datetime):
+        """
+        Drop entries older than the cutoff and subtract them from the counts.
+        
+        Args:
+            cutoff: Entries with an earlier timestamp are removed
+        """
+        while self._window and self._window[0][0] < cutoff:
+            _, level, comm = self._window.popleft()
+            self._level_counts[level] -= 1
+            if not self._level_counts[level]:
+                del self._level_counts[level]
+            if comm:
+                self._comm_counts[comm] -= 1
+                if not self._comm_counts[comm]:
+                    del self._comm_counts[comm]
+            if level == "ERROR":
+                self._error_issues.popleft()
+    
+    def _generate_report(self) -> Dict:
+        """
+        Generate a report for the last report_hours from the running counts.
+        
+        The report has the same structure as CommunicationMonitor.generate_report,
+        but each call only parses the log lines written since the previous one.
+        
+        Returns:
+            A report of communications during the window
+        """
+        now = datetime.datetime.now()
+        cutoff = now - datetime.timedelta(hours=self.report_hours)
+        
+        self._read_new_entries()
+        self._expire_entries(cutoff)
+        
+        by_agent = {f"{agent}_{direction}": count for (agent, direction), count in self._comm_counts.items()}
+        
+        # Agents that receive tasks but don't return results
+        issues = list(self._error_issues)
+        for (agent, direction), sent_count in self._comm_counts.items():
+            if direction != "to":
+                continue
+            received_count = self._comm_counts.get((agent, "from"), 0)
+            if sent_count > received_count:
+                issues.append({
+                    "type": "missing_responses",
+                    "agent": agent,
+                    "tasks_sent": sent_count,
+                    "results_received": received_count,
+                    "missing": sent_count - received_count
+                })
+        
+        return {
+            "period": {
+                "hours": self.report_hours,
+                "start": cutoff.isoformat(),
+                "end": now.isoformat()
+            },
+            "total_log_entries": len(self._window),
+            "entries_by_level": dict(self._level_counts),
+            "agent_communications": {
+                "total": sum(self._comm_counts.values()),
+                "by_agent": by_agent
+            },
+            "potential_issues": issues
+        }
+    
+    def _alert_tick(self):
+        """
+        Check the latest report for alert conditions once.
+        """
+        try:
+            if self.last_report:
+                # Check for alerts
+                alerts = self._check_alerts(self.last_report)
+                
+                # Handle any alerts
+                if alerts:
+                    self._handle_alerts(alerts)
+        except Exception as e:
+            logger.exception(f"Error in alert loop: {str(e)}")
     
-    def _update_dashboard(self, report: Dict):
+    async def _update_dashboard(self, report: Dict):
         """
         Update the dashboard with the latest report.
         
@@ -252,24 +592,36 @@ class EnhancedMonitor:
         agent_communications = report.get("agent_communications", {})
         potential_issues = report.get("potential_issues", [])
         
-        logger.info(f"Dashboard update: {total_entries} log entries")
-        logger.info(f"Entries by level: {entries_by_level}")
-        logger.info(f"Agent communications: {agent_communications}")
-        logger.info(f"Potential issues: {len(potential_issues)}")
+        # Log a one-line summary every summary_every_n ticks; the full
+        # breakdown is only formatted when debug logging is enabled
+        self._tick += 1
+        if (self._tick - 1) % self.summary_every_n == 0:
+            logger.info(f"Dashboard update: {total_entries} log entries, {len(potential_issues)} potential issues")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Entries by level: {entries_by_level}")
+            logger.debug(f"Agent communications: {agent_communications}")
         
         # Generate visualization
         try:
-            self._generate_visualization(report)
+            if (self._tick - 1) % self.viz_every_n == 0:
+                viz_hash = hash(json.dumps(
+                    [entries_by_level, agent_communications], sort_keys=True, default=str
+                ))
+                if viz_hash != self._last_viz_hash:
+                    # Render off the event loop so the alert loop keeps running
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(self._render_executor, self._generate_visualization, report)
+                    self._last_viz_hash = viz_hash
         except Exception as e:
-            logger.error(f"Error generating visualization: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error generating visualization: {str(e)}")
     
     def _generate_visualization(self, report: Dict):
         """
         Generate visualization of the monitoring data.
         
-        This method creates charts and graphs to visualize
-        the monitoring data.
+        This method updates the persistent charts with the latest
+        monitoring data and saves them as a PNG. Bars are only redrawn
+        from scratch when the set of log levels or agents changes.
         
         Args:
             report: The monitoring report to visualize
@@ -278,76 +630,140 @@ class EnhancedMonitor:
             Exception: If visualization generation fails
         """
         try:
-            # Create a figure with multiple subplots
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
-            
-            # Plot log entries by level
+            # Log entries by level
             entries_by_level = report.get("entries_by_level", {})
             levels = list(entries_by_level.keys())
             counts = list(entries_by_level.values())
             
-            if levels and counts:
-                ax1.bar(levels, counts)
-                ax1.set_title('Log Entries by Level')
-                ax1.set_xlabel('Log Level')
-                ax1.set_ylabel('Count')
-                
-                # Add count labels on top of bars
-                for i, count in enumerate(counts):
-                    ax1.text(i, count + 0.1, str(count), ha='center')
-            
-            # Plot agent communications
+            # Agent communications
             agent_communications = report.get("agent_communications", {})
             by_agent = agent_communications.get("by_agent", {})
             
-            agents = []
-            to_counts = []
-            from_counts = []
-            
+            # One pass over the keys; the first "_to" key wins for each agent
+            sent_by_agent = {}
             for key, count in by_agent.items():
                 if "_to" in key:
-                    agent = key.split("_to")[0]
-                    if agent not in agents:
-                        agents.append(agent)
-                        to_counts.append(count)
-                        # Find corresponding from count
-                        from_key = f"{agent}_from"
-                        from_counts.append(by_agent.get(from_key, 0))
-            
-            if agents and to_counts and from_counts:
-                x = np.arange(len(agents))
-                width = 0.35
-                
-                ax2.bar(x - width/2, to_counts, width, label='Messages Sent')
-                ax2.bar(x + width/2, from_counts, width, label='Messages Received')
-                
-                ax2.set_title('Agent Communications')
-                ax2.set_xlabel('Agent')
-                ax2.set_ylabel('Count')
-                ax2.set_xticks(x)
-                ax2.set_xticklabels(agents)
-                ax2.legend()
-                
-                # Add count labels on top of bars
-                for i, count in enumerate(to_counts):
-                    ax2.text(i - width/2, count + 0.1, str(count), ha='center')
-                
-                for i, count in enumerate(from_counts):
-                    ax2.text(i + width/2, count + 0.1, str(count), ha='center')
+                    sent_by_agent.setdefault(key.split("_to")[0], count)
+            
+            agents = list(sent_by_agent)
+            to_counts = np.fromiter(sent_by_agent.values(), dtype=np.int64, count=len(agents))
+            # Find corresponding from counts
+            from_counts = np.fromiter(
+                (by_agent.get(f"{agent}_from", 0) for agent in agents), dtype=np.int64, count=len(agents)
+            )
+            
+            layout_changed = False
             
-            # Adjust layout and save
-            plt.tight_layout()
+            if tuple(levels) != self._levels:
+                self._draw_level_chart(levels, counts)
+                layout_changed = True
+            else:
+                self._update_bars(self._level_ax, self._level_bars, self._level_labels, counts)
+            
+            if tuple(agents) != self._agents:
+                self._draw_agent_chart(agents, to_counts, from_counts)
+                layout_changed = True
+            else:
+                self._update_bars(self._agent_ax, self._to_bars, self._to_labels, to_counts)
+                self._update_bars(self._agent_ax, self._from_bars, self._from_labels, from_counts)
+            
+            # Adjust layout only when the axes contents changed shape, then save
+            if layout_changed:
+                self._figure.tight_layout()
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             visualization_file = os.path.join(log_dir, f"communication_visualization_{timestamp}.png")
-            plt.savefig(visualization_file)
-            plt.close()
+            # Fastest zlib level: the chart is flat-colour and rewritten often,
+            # so a slightly larger file is cheaper than the encode time
+            buffer = io.BytesIO()
+            self._figure.savefig(buffer, format='png', pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+            self.writer.write(visualization_file, buffer.getvalue())
             
-            logger.info(f"Visualization saved to {visualization_file}")
+            logger.debug(f"Visualization saved to {visualization_file}")
         except Exception as e:
-            logger.error(f"Error generating visualization: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error generating visualization: {str(e)}")
             raise
     
+    def _draw_level_chart(self, levels: List[str], counts: List[int]):
+        """
+        Redraw the log level chart for a new set of levels.
+        
+        Args:
+            levels: Log level names
+            counts: Entry count for each level
+        """
+        ax = self._level_ax
+        ax.clear()
+        self._levels = tuple(levels)
+        self._level_bars = []
+        self._level_labels = []
+        
+        if levels and counts:
+            self._level_bars = list(ax.bar(levels, counts))
+            ax.set_title('Log Entries by Level')
+            ax.set_xlabel('Log Level')
+            ax.set_ylabel('Count')
+            
+            # Add count labels on top of bars
+            for i, count in enumerate(counts):
+                self._level_labels.append(ax.text(i, count + 0.1, str(count), ha='center'))
+    
+    def _draw_agent_chart(self, agents: List[str], to_counts: np.ndarray, from_counts: np.ndarray):
+        """
+        Redraw the agent communication chart for a new set of agents.
+        
+        Args:
+            agents: Agent names
+            to_counts: Messages sent by each agent
+            from_counts: Messages received by each agent
+        """
+        ax = self._agent_ax
+        ax.clear()
+        self._agents = tuple(agents)
+        self._to_bars = []
+        self._from_bars = []
+        self._to_labels = []
+        self._from_labels = []
+        
+        if agents:
+            x = np.arange(len(agents))
+            width = 0.35
+            
+            self._to_bars = list(ax.bar(x - width/2, to_counts, width, label='Messages Sent'))
+            self._from_bars = list(ax.bar(x + width/2, from_counts, width, label='Messages Received'))
+            
+            ax.set_title('Agent Communications')
+            ax.set_xlabel('Agent')
+            ax.set_ylabel('Count')
+            ax.set_xticks(x)
+            ax.set_xticklabels(agents)
+            ax.legend()
+            
+            # Add count labels on top of bars
+            for i, count in enumerate(to_counts):
+                self._to_labels.append(ax.text(i - width/2, count + 0.1, str(count), ha='center'))
+            
+            for i, count in enumerate(from_counts):
+                self._from_labels.append(ax.text(i + width/2, count + 0.1, str(count), ha='center'))
+    
+    def _update_bars(self, ax, bars: List, labels: List, counts: List[int]):
+        """
+        Update existing bars and their count labels in place.
+        
+        Args:
+            ax: Axes holding the bars
+            bars: Bar rectangles to update
+            labels: Count labels, one per bar
+            counts: New count for each bar
+        """
+        for bar, label, count in zip(bars, labels, counts):
+            bar.set_height(count)
+            label.set_y(count + 0.1)
+            label.set_text(str(count))
+        
+        if bars:
+            ax.relim()
+            ax.autoscale_view()
+    
     def _save_report(self, report: Dict):
         """
         Save the monitoring report to a file.
@@ -365,15 +781,59 @@ class EnhancedMonitor:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             report_file = os.path.join(log_dir, f"enhanced_monitoring_report_{timestamp}.json")
             
-            with open(report_file, 'w') as f:
-                json.dump(report, default=str, indent=2, fp=f)
+            self.writer.write(report_file, self._encode_report(report))
             
-            logger.info(f"Report saved to: {report_file}")
+            logger.debug(f"Report saved to: {report_file}")
         except Exception as e:
-            logger.error(f"Error saving report: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error saving report: {str(e)}")
             raise
     
+    def _encode_report(self, report: Dict) -> bytes:
+        """
+        Serialize a report, reusing the encoding of an unchanged body.
+        
+        The period changes on every report, so it is encoded separately and
+        spliced in front of the cached body when the rest is unchanged.
+        
+        Args:
+            report: The report to serialize
+            
+        Returns:
+            The report as indented JSON bytes
+        """
+        body = {key: value for key, value in report.items() if key != "period"}
+        if not body or "period" not in report:
+            return _dumps_indented(report)
+        
+        key = repr(body)
+        cached_key, encoded_body = self._report_cache
+        if key != cached_key:
+            encoded_body = _dumps_indented(body)
+            self._report_cache = (key, encoded_body)
+        
+        # '{\n  "period": {...}\n}' + '{\n  ...}' -> '{\n  "period": {...},\n  ...}'
+        encoded_period = _dumps_indented({"period": report["period"]})
+        return encoded_period[:-2] + b',\n' + encoded_body[2:]
+    
+    def _encode_alert(self, alert: Dict) -> bytes:
+        """
+        Serialize an alert, reusing the encoding of a repeated alert.
+        
+        Args:
+            alert: The alert to serialize
+            
+        Returns:
+            The alert as indented JSON bytes
+        """
+        key = repr(alert)
+        encoded = self._alert_cache.get(key)
+        if encoded is None:
+            if len(self._alert_cache) >= 64:
+                self._alert_cache.clear()
+            encoded = _dumps_indented(alert)
+            self._alert_cache[key] = encoded
+        return encoded
+    
     def _check_alerts(self, report: Dict) -> List[Dict]:
         """
         Check for alert conditions in the report.
@@ -423,8 +883,7 @@ class EnhancedMonitor:
             
             return alerts
         except Exception as e:
-            logger.error(f"Error checking alerts: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error checking alerts: {str(e)}")
             return []
     
     def _handle_alerts(self, alerts: List[Dict]):
@@ -460,13 +919,11 @@ class EnhancedMonitor:
                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                 alert_file = os.path.join(log_dir, f"alert_{alert_type}_{timestamp}.json")
                 
-                with open(alert_file, 'w') as f:
-                    json.dump(alert, default=str, indent=2, fp=f)
+                self.writer.write(alert_file, self._encode_alert(alert))
                 
-                logger.info(f"Alert saved to: {alert_file}")
+                logger.debug(f"Alert saved to: {alert_file}")
         except Exception as e:
-            logger.error(f"Error handling alerts: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error handling alerts: {str(e)}")
 
 def main():
     """
@@ -1,12 +1,193 @@
 """Bookkeeping agent for accounting tasks."""
 
+import atexit
+import copy
+import hashlib
+import inspect
+import itertools
 import logging
 import json
-from typing import Dict, Any, Optional
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
-from external_memory_system.storage.pinecone_store import PineconeVectorStore
-from external_memory_system.models.local_llm import LocalLLM, MockLLM
-from external_memory_system.dashboard.client import DashboardClient
+# Task data is embedded in prompts and dashboard messages as JSON; orjson
+# is used when installed, and unlike str() both produce valid JSON
+try:
+    import orjson
+
+    def _to_json(obj) -> str:
+        """Serialize an object to a JSON string using orjson."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _to_json(obj) -> str:
+        """Serialize an object to a JSON string using the standard library."""
+        return json.dumps(obj, default=str)
+
+# Number of times a buffered vector store write is tried before it is dropped
+MEMORY_WRITE_ATTEMPTS = 3
+
+# Agents whose buffered vector store writes are flushed at exit; held weakly
+# so the exit hook does not keep every agent alive
+_AGENTS_TO_FLUSH = weakref.WeakSet()
+
+def _flush_agents_at_exit() -> None:
+    """Flush the buffered vector store writes of every live agent."""
+    for agent in list(_AGENTS_TO_FLUSH):
+        agent.flush_memory()
+
+atexit.register(_flush_agents_at_exit)
+
+def _accepts_metadatas(add_texts) -> bool:
+    """Check whether a vector store's add_texts takes a per-text metadatas list."""
+    try:
+        parameters = inspect.signature(add_texts).parameters
+    except (TypeError, ValueError):
+        return False
+    return "metadatas" in parameters or any(
+        parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()
+    )
+
+def _parse_bool(value) -> bool:
+    """Read a yes/no value from a model reply; anything unrecognized counts as no."""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("true", "yes", "1")
+
+# The LLM, vector store and dashboard clients pull in requests and pinecone,
+# so they are imported where they are needed rather than with this module
+if TYPE_CHECKING:
+    from external_memory_system.storage.pinecone_store import PineconeVectorStore
+    from external_memory_system.models.local_llm import LocalLLM
+
+# Fixed instructions for each LLM-backed handler. Each prompt starts with its
+# prefix and only the task details follow, so the LLM server can reuse the
+# cached prefill for the shared leading tokens across calls.
+JOURNAL_PROMPT_PREFIX = """
+You are a bookkeeping agent responsible for validating journal entries.
+
+Is the journal entry below valid? If not, explain why.
+If valid, suggest the appropriate accounts to debit and credit.
+"""
+
+CATEGORIZE_PROMPT_PREFIX = """
+You are a bookkeeping agent responsible for categorizing transactions.
+
+What is the most appropriate account category for the transaction below?
+Provide the account name and explain your reasoning.
+"""
+
+COA_PROMPT_PREFIX = """
+You are a bookkeeping agent responsible for managing the chart of accounts.
+
+Provide guidance on the chart of accounts task below.
+"""
+
+# Complete prompt templates, filled in with str.format by the handlers
+JOURNAL_PROMPT_TEMPLATE = JOURNAL_PROMPT_PREFIX + """
+Journal Entry:
+Description: {description}
+Amount: ${amount}
+Date: {date}
+"""
+
+CATEGORIZE_PROMPT_TEMPLATE = CATEGORIZE_PROMPT_PREFIX + """
+Transaction:
+Description: {description}
+Amount: ${amount}
+"""
+
+COA_PROMPT_TEMPLATE = COA_PROMPT_PREFIX + """
+Task:
+Action: {action}
+Account Name: {account_name}
+Account Type: {account_type}
+"""
+
+DEFAULT_PROMPT_TEMPLATE = """
+You are a specialized accounting agent.
+Process this task using your accounting expertise:
+
+Task: {task}
+
+Provide a detailed response with your analysis and recommendations.
+"""
+
+RECEIPT_VALIDATION_PROMPT_TEMPLATE = """
+You are a bookkeeping agent validating receipt data.
+
+Receipt Data:
+Vendor: {vendor}
+Date: {date}
+Total Amount: ${total_amount}
+Items: {items}
+Payment Method: {payment_method}
+Submitted by: {employee}
+
+Validate this receipt data and identify any issues or concerns.
+Is this a valid business expense? Explain your reasoning.
+"""
+
+RECEIPT_JOURNAL_PROMPT_TEMPLATE = """
+You are a bookkeeping agent creating a journal entry from a receipt.
+
+Receipt Data:
+Vendor: {vendor}
+Date: {date}
+Total Amount: ${total_amount}
+Items: {items}
+Payment Method: {payment_method}
+Submitted by: {employee}
+
+Determine the appropriate accounts to debit and credit for this transaction.
+Provide a description for the journal entry.
+"""
+
+# Extracts, validates and drafts the journal entry for a new receipt in one
+# structured-output call
+RECEIPT_PIPELINE_PROMPT_TEMPLATE = """
+You are a bookkeeping agent processing a receipt image.
+The image is from: {receipt_image}
+Submitted by: {employee}
+
+1. Extract the vendor name, date of purchase, total amount, list of items
+   purchased and payment method.
+2. Validate the receipt and identify any issues or concerns. Is this a valid
+   business expense?
+3. Determine the appropriate accounts to debit and credit for this transaction
+   and provide a description for the journal entry.
+
+Respond with a single JSON object of the form:
+{{
+  "extracted": {{
+    "vendor": "...",
+    "date": "YYYY-MM-DD",
+    "total_amount": 0.0,
+    "items": [{{"name": "...", "price": 0.0}}],
+    "payment_method": "..."
+  }},
+  "validation": {{"is_valid": true, "reasoning": "..."}},
+  "journal_entry": {{"debit_account": "...", "credit_account": "...", "description": "..."}}
+}}
+"""
+
+# Stand-in for OCR output until receipts are actually read
+SIMULATED_RECEIPT_DATA = {
+    "vendor": "Hardware Store Inc.",
+    "date": "2025-03-24",
+    "total_amount": 45.67,
+    "items": [
+        {"name": "Hammer", "price": 15.99},
+        {"name": "Nails", "price": 8.99},
+        {"name": "Screwdriver", "price": 12.99},
+        {"name": "Tax", "price": 7.70}
+    ],
+    "payment_method": "Company Card"
+}
 
 # Create a mock vector store for testing
 class MockVectorStore:
@@ -22,31 +203,68 @@ class MockVectorStore:
         self.data = {}
         print(f"Initialized MockVectorStore with namespace: {namespace}")
         
-    def add_texts(self, texts: list, metadata: Dict = None):
+    def add_texts(self, texts: list, metadata: Dict = None, metadatas: List[Dict] = None):
         """Add texts to the vector store."""
         if metadata is None:
             metadata = {}
         for i, text in enumerate(texts):
-            self.data[f"{len(self.data)}"] = {"text": text, "metadata": metadata}
+            self.data[f"{len(self.data)}"] = {"text": text, "metadata": metadatas[i] if metadatas else metadata}
         return [f"{i}" for i in range(len(self.data) - len(texts), len(self.data))]
     
     def similarity_search(self, query: str, k: int = 5):
         """Perform a similarity search."""
-        # Just return the k most recent items for testing
-        items = list(self.data.items())[-k:]
-        return [{"id": id, "text": data["text"], "metadata": data["metadata"]} for id, data in items]
+        # Just return the k most recent items for testing, walking back from
+        # the newest entry instead of copying the whole store
+        items = list(itertools.islice(reversed(self.data.items()), k))
+        return [{"id": id, "text": data["text"], "metadata": data["metadata"]} for id, data in reversed(items)]
 
 class BookkeepingAgent:
     """Agent for bookkeeping tasks."""
     
-    def __init__(self, llm=None, vector_store=None, dashboard_url="http://localhost:5000") :
+    def __init__(self, llm: Optional["LocalLLM"] = None,
+                 vector_store: Optional["PineconeVectorStore"] = None,
+                 dashboard_url="http://localhost:5000",
+                 memory_batch_size: int = 100, memory_flush_interval: float = 5.0) :
         """Initialize the bookkeeping agent."""
-        self.llm = llm or MockLLM()
+        if llm is None:
+            from external_memory_system.models.local_llm import MockLLM
+            llm = MockLLM()
+        self.llm = llm
         self.vector_store = vector_store or MockVectorStore(namespace="bookkeeping")
         self.logger = logging.getLogger(self.__class__.__name__)
         
-        # Initialize dashboard client
-        self.dashboard = DashboardClient(dashboard_url)
+        # Load the model now rather than on the first task
+        if hasattr(self.llm, "preload"):
+            self.llm.preload()
+        
+        # JSON output is requested from LLMs whose generate takes a format
+        try:
+            self._llm_supports_format = "format" in inspect.signature(self.llm.generate).parameters
+        except (TypeError, ValueError):
+            self._llm_supports_format = False
+        
+        # Vector store writes are buffered and sent in batches of
+        # memory_batch_size, or by a timer once the oldest has waited
+        # memory_flush_interval. Stores whose add_texts only takes a shared
+        # metadata argument are written one text at a time.
+        self.memory_batch_size = memory_batch_size
+        self.memory_flush_interval = memory_flush_interval
+        self._pending_writes = []  # (content, metadata, failed attempts)
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
+        self._batch_metadatas = bool(self.vector_store) and _accepts_metadatas(self.vector_store.add_texts)
+        _AGENTS_TO_FLUSH.add(self)
+        
+        # LRU caches of receipt extraction and validation results, keyed by
+        # a hash of the receipt image and of the extracted data
+        self.receipt_cache_size = 1024
+        self._ocr_cache = OrderedDict()
+        self._validation_cache = OrderedDict()
+        self._receipt_cache_lock = threading.Lock()
+        
+        # Initialize dashboard client; reports are sent off the task path
+        from external_memory_system.dashboard.client import BackgroundDashboardClient
+        self.dashboard = BackgroundDashboardClient(dashboard_url)
         self.agent_id = "bookkeeping"
         self.dashboard.register_agent(self.agent_id, "Bookkeeping Agent", "bookkeeping")
         self.dashboard.log_message(self.agent_id, "INFO", "Bookkeeping agent initialized")
@@ -57,7 +275,7 @@ class BookkeepingAgent:
         task_type = task.get("type")
         
         self.logger.info(f"Processing task: {task_id} of type {task_type}")
-        self.dashboard.create_task(task_id, self.agent_id, task_type, str(task.get("data", {})))
+        self.dashboard.create_task(task_id, self.agent_id, task_type, _to_json(task.get("data", {})))
         
         try:
             # Extract task type and validate
@@ -65,12 +283,9 @@ class BookkeepingAgent:
                 raise ValueError("Task type is required")
             
             # Route to appropriate handler method based on task type
-            if task_type == "journal_entry":
-                result = self._process_journal_entry(task)
-            elif task_type == "categorize_transaction":
-                result = self._process_categorize_transaction(task)
-            elif task_type == "chart_of_accounts":
-                result = self._process_chart_of_accounts(task)
+            handler = self._HANDLERS.get(task_type)
+            if handler is not None:
+                result = handler(self, task)
             else:
                 self.logger.warning(f"No specific handler for task type: {task_type}")
                 result = self._process_default(task)
@@ -91,6 +306,38 @@ class BookkeepingAgent:
                 "task_id": task_id
             }
     
+    def process_tasks(self, tasks: List[Dict], max_workers: int = 4) -> List[Dict]:
+        """Process several independent tasks concurrently.
+        
+        The tasks' LLM calls are in flight together, so the LLM server can
+        batch them instead of running one prompt at a time.
+        
+        Args:
+            tasks: The tasks to process
+            max_workers: Maximum number of tasks processed at once
+            
+        Returns:
+            The results, in the same order as the tasks
+        """
+        if len(tasks) <= 1:
+            return [self.process_task(task) for task in tasks]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+            return list(executor.map(self.process_task, tasks))
+    
+    def _generate_batch(self, prompts: List[str]) -> List[str]:
+        """Generate responses for several independent prompts.
+        
+        Args:
+            prompts: The prompts to send
+            
+        Returns:
+            The responses, in the same order as the prompts
+        """
+        if hasattr(self.llm, "generate_batch"):
+            return self.llm.generate_batch(prompts)
+        return [self.llm.generate(prompt) for prompt in prompts]
+    
     # Update BookkeepingAgent to use QuickBooks integration
 
     def _process_journal_entry(self, task: Dict) -> Dict:
@@ -102,17 +349,7 @@ class BookkeepingAgent:
         date = data.get("date", "")
         
         # Validate the journal entry using LLM
-        prompt = f"""
-        You are a bookkeeping agent responsible for validating journal entries.
-        
-        Journal Entry:
-        Description: {description}
-        Amount: ${amount}
-        Date: {date}
-        
-        Is this a valid journal entry? If not, explain why.
-        If valid, suggest the appropriate accounts to debit and credit.
-        """
+        prompt = JOURNAL_PROMPT_TEMPLATE.format(description=description, amount=amount, date=date)
         
         validation_result = self.llm.generate(prompt)
         
@@ -143,28 +380,45 @@ class BookkeepingAgent:
             }
         ]
     
-    # Create journal entry in QuickBooks
-    journal_entry = qb.create_journal_entry({
-        "description": description,
-        "date": date,
-        "reference_number": f"JE-{task.get('id')}",
-        "lines": lines
-    })
-    
-    # Return the result
-    return {
-        "status": "success",
-        "message": "Journal entry processed",
-        "task_id": task.get("id"),
-        "validation": validation_result,
-        "journal_entry": journal_entry,
-        "entry_details": {
+        # Create journal entry in QuickBooks
+        journal_entry = qb.create_journal_entry({
             "description": description,
-            "amount": amount,
-            "date": date
+            "date": date,
+            "reference_number": f"JE-{task.get('id')}",
+            "lines": lines
+        })
+        
+        # Store the journal entry for future reference
+        self._queue_memory_write(
+            f"""
+            Journal Entry:
+            Date: {date}
+            Description: {description}
+            Amount: ${amount}
+            Reference: JE-{task.get('id')}
+            Validation: {validation_result}
+            """,
+            {
+                "type": "journal_entry",
+                "date": date,
+                "amount": amount,
+                "reference": f"JE-{task.get('id')}"
+            }
+        )
+        
+        # Return the result
+        return {
+            "status": "success",
+            "message": "Journal entry processed",
+            "task_id": task.get("id"),
+            "validation": validation_result,
+            "journal_entry": journal_entry,
+            "entry_details": {
+                "description": description,
+                "amount": amount,
+                "date": date
+            }
         }
-    }
-
     
     def _process_categorize_transaction(self, task: Dict) -> Dict:
         """Categorize a financial transaction."""
@@ -174,16 +428,7 @@ class BookkeepingAgent:
         amount = data.get("amount", 0)
         
         # Use LLM to categorize the transaction
-        prompt = f"""
-        You are a bookkeeping agent responsible for categorizing transactions.
-        
-        Transaction:
-        Description: {description}
-        Amount: ${amount}
-        
-        What is the most appropriate account category for this transaction?
-        Provide the account name and explain your reasoning.
-        """
+        prompt = CATEGORIZE_PROMPT_TEMPLATE.format(description=description, amount=amount)
         
         categorization_result = self.llm.generate(prompt)
         
@@ -208,16 +453,7 @@ class BookkeepingAgent:
         account_type = data.get("account_type", "")
         
         # Use LLM to process the chart of accounts task
-        prompt = f"""
-        You are a bookkeeping agent responsible for managing the chart of accounts.
-        
-        Task:
-        Action: {action}
-        Account Name: {account_name}
-        Account Type: {account_type}
-        
-        Provide guidance on this chart of accounts task.
-        """
+        prompt = COA_PROMPT_TEMPLATE.format(action=action, account_name=account_name, account_type=account_type)
         
         processing_result = self.llm.generate(prompt)
         
@@ -239,14 +475,7 @@ class BookkeepingAgent:
         self.logger.info(f"Using default processor for task: {task.get('id')}")
         
         # Use LLM to generate a response
-        prompt = f"""
-        You are a specialized accounting agent.
-        Process this task using your accounting expertise:
-        
-        Task: {task}
-        
-        Provide a detailed response with your analysis and recommendations.
-        """
+        prompt = DEFAULT_PROMPT_TEMPLATE.format(task=_to_json(task))
         
         response = self.llm.generate(prompt)
         
@@ -273,14 +502,32 @@ class BookkeepingAgent:
         employee = data.get("employee", "")
         submission_date = data.get("submission_date", "")
         
-        # Step 1: Extract data from receipt using OCR (simplified for now)
-        receipt_data = self._extract_receipt_data(receipt_image)
-        
-        # Step 2: Validate the receipt data
-        validation_result = self._validate_receipt_data(receipt_data, employee)
-        
-        # Step 3: Create a journal entry based on the receipt
-        journal_entry = self._create_journal_entry_from_receipt(receipt_data, employee)
+        receipt_data = self._cache_get(self._ocr_cache, self._receipt_image_key(receipt_image))
+        
+        if receipt_data is None:
+            # Steps 1-3: Extract, validate and create the journal entry for a
+            # new receipt with a single LLM call
+            receipt_data, validation_result, journal_entry = self._run_receipt_pipeline(receipt_image, employee)
+        else:
+            # Steps 2 and 3 for an already extracted receipt: ask the LLM for
+            # the validation (unless it was already validated) and the
+            # accounting guidance in one batch
+            validation_key = self._receipt_data_key(receipt_data, employee)
+            validation_result = self._cache_get(self._validation_cache, validation_key)
+            
+            if validation_result is None:
+                validation_response, accounting_guidance = self._generate_batch([
+                    self._receipt_validation_prompt(receipt_data, employee),
+                    self._receipt_journal_prompt(receipt_data, employee)
+                ])
+                
+                # Step 2: Validate the receipt data
+                validation_result = self._validate_receipt_data(receipt_data, employee, validation_response)
+            else:
+                accounting_guidance = self.llm.generate(self._receipt_journal_prompt(receipt_data, employee))
+            
+            # Step 3: Create a journal entry based on the receipt
+            journal_entry = self._create_journal_entry_from_receipt(receipt_data, employee, accounting_guidance)
         
         # Step 4: Store the receipt information for future reference
         self._store_receipt_data(receipt_data, journal_entry, receipt_image)
@@ -295,112 +542,140 @@ class BookkeepingAgent:
             "requires_review": True  # Flag for Atlas to review
         }
 
-    def _extract_receipt_data(self, receipt_image: str) -> Dict:
-        """Extract data from a receipt image using OCR.
-        
-        In a real implementation, this would use OCR services.
-        For now, we'll simulate the extraction.
+    def _run_receipt_pipeline(self, receipt_image: str, employee: str) -> Tuple[Dict, Dict, Dict]:
+        """Extract, validate and create a journal entry for a receipt in one LLM call.
         
         Args:
             receipt_image: Path or URL to the receipt image
+            employee: The employee who submitted the receipt
             
         Returns:
-            Extracted receipt data
+            The extracted receipt data, validation result and journal entry
         """
-        # In a real implementation, use OCR service like Google Vision API
-        # For now, simulate extraction with LLM
-        prompt = f"""
-        You are an OCR system processing a receipt image.
-        The image is from: {receipt_image}
-        
-        Extract the following information:
-        1. Vendor name
-        2. Date of purchase
-        3. Total amount
-        4. List of items purchased
-        5. Payment method
-        
-        Format the response as structured data.
-        """
-        
-        # Use LLM to simulate OCR extraction
-        extraction_result = self.llm.generate(prompt)
+        prompt = RECEIPT_PIPELINE_PROMPT_TEMPLATE.format(receipt_image=receipt_image, employee=employee)
+        response = self._generate_json(prompt)
         
-        # In a real implementation, parse the OCR result
-        # For now, create a simulated structured result
-        return {
-            "vendor": "Hardware Store Inc.",
-            "date": "2025-03-24",
-            "total_amount": 45.67,
-            "items": [
-                {"name": "Hammer", "price": 15.99},
-                {"name": "Nails", "price": 8.99},
-                {"name": "Screwdriver", "price": 12.99},
-                {"name": "Tax", "price": 7.70}
-            ],
-            "payment_method": "Company Card"
+        try:
+            parsed = json.loads(response)
+            if not isinstance(parsed, dict):
+                raise ValueError("expected a JSON object")
+        except ValueError as e:
+            self.logger.warning(f"Could not parse receipt pipeline response: {str(e)}")
+            parsed = {}
+        
+        # Fall back to the simulated extraction when the response lacks it
+        extracted = parsed.get("extracted")
+        if isinstance(extracted, dict) and all(key in extracted for key in SIMULATED_RECEIPT_DATA):
+            receipt_data = extracted
+        else:
+            receipt_data = copy.deepcopy(SIMULATED_RECEIPT_DATA)
+        
+        validation = parsed.get("validation")
+        if not isinstance(validation, dict):
+            validation = {}
+        validation_result = {
+            "is_valid": _parse_bool(validation.get("is_valid")),
+            "reasoning": validation.get("reasoning", response)
         }
+        
+        accounting_guidance = parsed.get("journal_entry", response)
+        if not isinstance(accounting_guidance, str):
+            accounting_guidance = _to_json(accounting_guidance)
+        journal_entry = self._create_journal_entry_from_receipt(receipt_data, employee, accounting_guidance)
+        
+        self._cache_put(self._ocr_cache, self._receipt_image_key(receipt_image), receipt_data)
+        self._cache_put(self._validation_cache, self._receipt_data_key(receipt_data, employee), validation_result)
+        
+        return receipt_data, validation_result, journal_entry
+
+    def _generate_json(self, prompt: str) -> str:
+        """Generate a response, asking for JSON output when the LLM supports it."""
+        if self._llm_supports_format:
+            return self.llm.generate(prompt, format="json")
+        return self.llm.generate(prompt)
 
-    def _validate_receipt_data(self, receipt_data: Dict, employee: str) -> Dict:
+    def _validate_receipt_data(self, receipt_data: Dict, employee: str,
+                               validation_result: Optional[str] = None) -> Dict:
         """Validate the extracted receipt data.
         
         Args:
             receipt_data: The extracted receipt data
             employee: The employee who submitted the receipt
+            validation_result: LLM response to use instead of generating one
             
         Returns:
             Validation result
         """
-        # Use LLM to validate the receipt data
-        prompt = f"""
-        You are a bookkeeping agent validating receipt data.
-        
-        Receipt Data:
-        Vendor: {receipt_data.get('vendor')}
-        Date: {receipt_data.get('date')}
-        Total Amount: ${receipt_data.get('total_amount')}
-        Items: {receipt_data.get('items')}
-        Payment Method: {receipt_data.get('payment_method')}
-        Submitted by: {employee}
-        
-        Validate this receipt data and identify any issues or concerns.
-        Is this a valid business expense? Explain your reasoning.
-        """
-        
-        validation_result = self.llm.generate(prompt)
+        validation_key = self._receipt_data_key(receipt_data, employee)
+        if validation_result is None:
+            cached = self._cache_get(self._validation_cache, validation_key)
+            if cached is not None:
+                return cached
+            
+            # Use LLM to validate the receipt data
+            validation_result = self.llm.generate(self._receipt_validation_prompt(receipt_data, employee))
         
-        return {
+        validation = {
             "is_valid": True,  # In a real implementation, determine based on LLM response
             "reasoning": validation_result
         }
+        
+        self._cache_put(self._validation_cache, validation_key, validation)
+        return validation
+
+    def _receipt_image_key(self, receipt_image: str) -> str:
+        """Hash a receipt image's contents, or its path or URL if it isn't a local file."""
+        digest = hashlib.sha256()
+        
+        if receipt_image and os.path.isfile(receipt_image):
+            with open(receipt_image, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b''):
+                    digest.update(chunk)
+        else:
+            digest.update(str(receipt_image).encode())
+        
+        return digest.hexdigest()
+
+    def _receipt_data_key(self, receipt_data: Dict, employee: str) -> str:
+        """Hash the canonical JSON of a receipt's data and submitter."""
+        canonical = json.dumps({"receipt": receipt_data, "employee": employee}, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _cache_get(self, cache: OrderedDict, key: str) -> Optional[Dict]:
+        """Get a copy of a cached receipt result, marking it most recently used."""
+        with self._receipt_cache_lock:
+            if key not in cache:
+                return None
+            cache.move_to_end(key)
+            return copy.deepcopy(cache[key])
 
-    def _create_journal_entry_from_receipt(self, receipt_data: Dict, employee: str) -> Dict:
+    def _cache_put(self, cache: OrderedDict, key: str, value: Dict) -> None:
+        """Cache a copy of a receipt result, evicting the least recently used."""
+        with self._receipt_cache_lock:
+            cache[key] = copy.deepcopy(value)
+            cache.move_to_end(key)
+            while len(cache) > self.receipt_cache_size:
+                cache.popitem(last=False)
+
+    def _receipt_validation_prompt(self, receipt_data: Dict, employee: str) -> str:
+        """Build the prompt for validating receipt data."""
+        return RECEIPT_VALIDATION_PROMPT_TEMPLATE.format_map(self._receipt_prompt_fields(receipt_data, employee))
+
+    def _create_journal_entry_from_receipt(self, receipt_data: Dict, employee: str,
+                                           accounting_guidance: Optional[str] = None) -> Dict:
         """Create a journal entry based on receipt data.
         
         Args:
             receipt_data: The extracted receipt data
             employee: The employee who submitted the receipt
+            accounting_guidance: LLM response to use instead of generating one
             
         Returns:
             Journal entry details
         """
         # Use LLM to determine the appropriate accounts
-        prompt = f"""
-        You are a bookkeeping agent creating a journal entry from a receipt.
-        
-        Receipt Data:
-        Vendor: {receipt_data.get('vendor')}
-        Date: {receipt_data.get('date')}
-        Total Amount: ${receipt_data.get('total_amount')}
-        Items: {receipt_data.get('items')}
-        Payment Method: {receipt_data.get('payment_method')}
-        Submitted by: {employee}
-        
-        Determine the appropriate accounts to debit and credit for this transaction.
-        Provide a description for the journal entry.
-        """
-        
-        accounting_guidance = self.llm.generate(prompt)
+        if accounting_guidance is None:
+            accounting_guidance = self.llm.generate(self._receipt_journal_prompt(receipt_data, employee))
         
         # Create the journal entry
         journal_entry = {
@@ -415,6 +690,21 @@ class BookkeepingAgent:
         
         return journal_entry
 
+    def _receipt_journal_prompt(self, receipt_data: Dict, employee: str) -> str:
+        """Build the prompt for choosing the accounts of a receipt's journal entry."""
+        return RECEIPT_JOURNAL_PROMPT_TEMPLATE.format_map(self._receipt_prompt_fields(receipt_data, employee))
+
+    def _receipt_prompt_fields(self, receipt_data: Dict, employee: str) -> Dict:
+        """Collect the receipt fields used by the receipt prompt templates."""
+        return {
+            "vendor": receipt_data.get('vendor'),
+            "date": receipt_data.get('date'),
+            "total_amount": receipt_data.get('total_amount'),
+            "items": receipt_data.get('items'),
+            "payment_method": receipt_data.get('payment_method'),
+            "employee": employee
+        }
+
     def _store_receipt_data(self, receipt_data: Dict, journal_entry: Dict, receipt_image: str) -> None:
         """Store receipt data and journal entry in the vector store.
         
@@ -453,6 +743,95 @@ class BookkeepingAgent:
             }
             
             # Add to vector store
-            self.vector_store.add_texts([content], metadata=metadata)
-            self.logger.debug(f"Stored receipt data and journal entry in vector store")
-
+            self._queue_memory_write(content, metadata)
+            self.logger.debug("Queued receipt data and journal entry for the vector store")
+    
+    def _queue_memory_write(self, content: str, metadata: Dict) -> None:
+        """Buffer a vector store write, flushing once the batch is full.
+        
+        Args:
+            content: The text to store
+            metadata: Metadata for retrieval
+        """
+        if not self.vector_store:
+            return
+        
+        with self._pending_lock:
+            self._pending_writes.append((content, metadata, 0))
+            should_flush = len(self._pending_writes) >= self.memory_batch_size
+            if not should_flush and self._flush_timer is None:
+                self._start_flush_timer()
+        
+        if should_flush:
+            self.flush_memory()
+    
+    def _start_flush_timer(self) -> None:
+        """Flush the buffered writes after memory_flush_interval (called holding _pending_lock)."""
+        self._flush_timer = threading.Timer(self.memory_flush_interval, self.flush_memory)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def flush_memory(self) -> None:
+        """Write all buffered texts to the vector store, in a single add_texts call when it allows."""
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending_writes:
+                return
+            
+            pending = self._pending_writes
+            self._pending_writes = []
+        
+        failed = self._write_memory(pending)
+        if not failed:
+            self.logger.debug("Flushed %d writes to vector store", len(pending))
+            return
+        
+        # Keep the failed writes for the next flush, dropping those out of attempts
+        retry = [(content, metadata, attempts + 1) for content, metadata, attempts in failed
+                 if attempts + 1 < MEMORY_WRITE_ATTEMPTS]
+        if len(retry) < len(failed):
+            self.logger.error(f"Dropping {len(failed) - len(retry)} vector store writes after {MEMORY_WRITE_ATTEMPTS} attempts")
+        if retry:
+            with self._pending_lock:
+                self._pending_writes = retry + self._pending_writes
+                if self._flush_timer is None:
+                    self._start_flush_timer()
+    
+    def _write_memory(self, pending: List[Tuple[str, Dict, int]]) -> List[Tuple[str, Dict, int]]:
+        """Send buffered writes to the vector store.
+        
+        Args:
+            pending: The (content, metadata, failed attempts) writes to send
+            
+        Returns:
+            The writes that failed
+        """
+        if self._batch_metadatas:
+            try:
+                self.vector_store.add_texts(
+                    [content for content, _, _ in pending],
+                    metadatas=[metadata for _, metadata, _ in pending]
+                )
+                return []
+            except Exception as e:
+                self.logger.error(f"Error flushing {len(pending)} writes to vector store: {str(e)}")
+                return pending
+        
+        failed = []
+        for write in pending:
+            try:
+                self.vector_store.add_texts([write[0]], write[1])
+            except Exception as e:
+                self.logger.error(f"Error writing to vector store: {str(e)}")
+                failed.append(write)
+        return failed
+    
+    # Task type -> handler dispatch table for process_task
+    _HANDLERS = {
+        "journal_entry": _process_journal_entry,
+        "categorize_transaction": _process_categorize_transaction,
+        "chart_of_accounts": _process_chart_of_accounts,
+        "process_receipt": _process_receipt
+    }
@@ -2,10 +2,13 @@
 Memory management agent for the External Memory System.
 """
 
+import asyncio
+import itertools
 import time
 import threading
-import queue
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, Union, Callable
 
 from external_memory_system.memory import HybridMemory, MemoryItem
@@ -63,18 +66,38 @@ class MemoryAgent:
         self.chatgpt_model = chatgpt_model or ChatGPTModel()
         self.gemini_model = gemini_model or GeminiModel()
         
+        # Model interfaces by each name they can be referred to by
+        self._model_map = {
+            **dict.fromkeys(("chatgpt", "gpt", "openai"), self.chatgpt_model),
+            **dict.fromkeys(("gemini", "google"), self.gemini_model)
+        }
+        
         # Agent settings
         self.run_interval = run_interval
         self.running = False
         self.thread = None
-        self.task_queue = queue.Queue()
+        # deque append/popleft are atomic, so producers and the loop need no lock;
+        # _wakeup tells the loop that something was appended
+        self.task_queue = deque()
+        self._task_counter = itertools.count(1)
+        
+        # Event loop of the background thread and the event that wakes it
+        # when a task is queued; set while the agent is running
+        self._loop = None
+        self._wakeup = None
         
-        # User intervention
+        # Memory writes that can overlap with model calls; created by start()
+        # and shut down by stop()
+        self._io_pool = None
+        
+        # User intervention; callback tuples are replaced, never mutated,
+        # so they can be iterated without holding the lock
         self.user_callbacks = {
-            "on_memory_update": [],
-            "on_model_communication": [],
-            "on_error": []
+            "on_memory_update": (),
+            "on_model_communication": (),
+            "on_error": ()
         }
+        self._callbacks_lock = threading.Lock()
         
         # Setup logging
         self.logger = logging.getLogger("MemoryAgent")
@@ -94,6 +117,7 @@ class MemoryAgent:
             return
         
         self.running = True
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="memory-io")
         self.thread = threading.Thread(target=self._run_loop)
         self.thread.daemon = True
         self.thread.start()
@@ -107,35 +131,60 @@ class MemoryAgent:
             return
         
         self.running = False
+        self._wake()
         if self.thread:
             self.thread.join(timeout=5.0)
             self.thread = None
+        self._io_pool.shutdown(wait=True)
+        self._io_pool = None
         
         self.logger.info("Memory agent stopped")
     
     def _run_loop(self):
         """Main agent loop running in background thread."""
+        asyncio.run(self._async_run_loop())
+    
+    async def _async_run_loop(self):
+        """
+        Process tasks as soon as they are queued and manage memory every run_interval.
+        
+        The model clients are blocking, so each batch of tasks runs in a
+        worker thread, one task after another in the order they were queued.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        
         try:
             # Initialize models
             self.chatgpt_model.initialize()
             self.gemini_model.initialize()
             
+            next_management = time.monotonic()
             while self.running:
                 try:
                     # Process any queued tasks
-                    self._process_tasks()
+                    await self._process_tasks()
                     
                     # Perform regular memory management
-                    self._manage_memory()
+                    if time.monotonic() >= next_management:
+                        await asyncio.to_thread(self._manage_memory)
+                        next_management = time.monotonic() + self.run_interval
                     
-                    # Sleep until next run
-                    time.sleep(self.run_interval)
+                    # Wait for the next task or the next management run
+                    if not self.task_queue and self.running:
+                        try:
+                            await asyncio.wait_for(self._wakeup.wait(), max(0.0, next_management - time.monotonic()))
+                        except asyncio.TimeoutError:
+                            pass
+                        self._wakeup.clear()
                 
                 except Exception as e:
                     self.logger.error(f"Error in agent run loop: {e}")
                     self._notify_callbacks("on_error", {"error": str(e), "source": "run_loop"})
         
         finally:
+            self._loop = None
+            
             # Clean up resources
             try:
                 self.chatgpt_model.close()
@@ -143,52 +192,98 @@ class MemoryAgent:
             except Exception as e:
                 self.logger.error(f"Error closing models: {e}")
     
-    def _process_tasks(self):
+    async def _process_tasks(self):
         """Process tasks from the queue."""
-        try:
-            # Process up to 10 tasks per run to avoid blocking too long
-            for _ in range(10):
-                try:
-                    task = self.task_queue.get(block=False)
-                    self._execute_task(task)
-                    self.task_queue.task_done()
-                except queue.Empty:
-                    break
+        # Process up to 10 tasks per run to avoid blocking too long
+        batch = self._drain(10)
+        if batch:
+            await asyncio.to_thread(self._run_tasks, batch)
+    
+    def _run_tasks(self, batch):
+        """Execute dequeued tasks in order, reporting any error."""
+        for task in batch:
+            try:
+                self._execute_task(task)
+            except Exception as e:
+                self.logger.error(f"Error processing tasks: {e}")
+                self._notify_callbacks("on_error", {"error": str(e), "source": "process_tasks"})
+    
+    def _next_task_id(self):
+        """Get a unique ID for a new task."""
+        # next() on a count is atomic, so no lock is needed across threads
+        return f"task_{next(self._task_counter)}"
+    
+    def _enqueue(self, task):
+        """Queue a task and wake the agent loop to process it."""
+        self.task_queue.append(task)
+        self._wake()
+    
+    def _wake(self):
+        """Wake the agent loop if it is waiting."""
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                # The loop has already closed
+                pass
+    
+    def _drain(self, n):
+        """
+        Remove up to n tasks from the queue.
         
-        except Exception as e:
-            self.logger.error(f"Error processing tasks: {e}")
-            self._notify_callbacks("on_error", {"error": str(e), "source": "process_tasks"})
+        Args:
+            n: Maximum number of tasks to remove
+            
+        Returns:
+            The removed tasks, oldest first
+        """
+        batch = []
+        pending = self.task_queue
+        while pending and len(batch) < n:
+            try:
+                batch.append(pending.popleft())
+            except IndexError:
+                break
+        return batch
     
     def _execute_task(self, task):
         """Execute a specific task."""
         task_type = task.get("type")
         
-        if task_type == "add_memory":
-            self._add_memory_item(task.get("content"), task.get("metadata", {}))
-        
-        elif task_type == "query_memory":
-            result = self._query_memory(task.get("query"), task.get("limit", 10))
-            callback = task.get("callback")
-            if callback:
-                callback(result)
-        
-        elif task_type == "model_communication":
-            self._facilitate_model_communication(
-                task.get("source_model"),
-                task.get("target_model"),
-                task.get("query"),
-                task.get("context_id")
-            )
-        
-        elif task_type == "update_model_preferences":
-            self._update_model_preferences(
-                task.get("model_id"),
-                task.get("preferences", {})
-            )
-        
+        handler = self._HANDLERS.get(task_type)
+        if handler is not None:
+            handler(self, task)
         else:
             self.logger.warning(f"Unknown task type: {task_type}")
     
+    def _handle_add_memory(self, task):
+        """Handle an add_memory task."""
+        self._add_memory_item(task.get("content"), task.get("metadata", {}))
+    
+    def _handle_query_memory(self, task):
+        """Handle a query_memory task."""
+        result = self._query_memory(task.get("query"), task.get("limit", 10))
+        callback = task.get("callback")
+        if callback:
+            callback(result)
+    
+    def _handle_model_communication(self, task):
+        """Handle a model_communication task."""
+        self._facilitate_model_communication(
+            task.get("source_model"),
+            task.get("target_model"),
+            task.get("query"),
+            task.get("context_id")
+        )
+    
+    def _handle_update_model_preferences(self, task):
+        """Handle an update_model_preferences task."""
+        self._update_model_preferences(
+            task.get("model_id"),
+            task.get("preferences", {})
+        )
+    
     def _manage_memory(self):
         """Perform regular memory management tasks."""
         try:
@@ -277,14 +372,19 @@ class MemoryAgent:
                 context_items = self.memory.get_shared_context(context_id)
                 context = "\n".join([str(item.content) for item in context_items])
             
+            # Both prompts start with the same context and query block, so
+            # build it once and join each prompt in a single pass
+            prompt_head = ("Context:\n", context, "\n\nQuery: ", query)
+            
             # Prepare prompt for source model
-            source_prompt = f"Context:\n{context}\n\nQuery: {query}\n\nPlease provide your response:"
+            source_prompt = "".join(prompt_head + ("\n\nPlease provide your response:",))
             
             # Get response from source model
             source_response = source.generate(source_prompt)
             
-            # Add to memory
-            source_memory_id = self._add_memory_item(
+            # Add to memory while the target model works on its response
+            source_memory_future = self._io_pool.submit(
+                self._add_memory_item,
                 content=source_response,
                 metadata={
                     "source": source_model,
@@ -295,10 +395,14 @@ class MemoryAgent:
             )
             
             # Prepare prompt for target model
-            target_prompt = f"Context:\n{context}\n\nQuery: {query}\n\nResponse from {source_model}:\n{source_response}\n\nPlease provide your response or improvement:"
+            target_prompt = "".join(prompt_head + (
+                "\n\nResponse from ", source_model, ":\n", source_response,
+                "\n\nPlease provide your response or improvement:"
+            ))
             
             # Get response from target model
             target_response = target.generate(target_prompt)
+            source_memory_id = source_memory_future.result()
             
             # Add to memory
             target_memory_id = self._add_memory_item(
@@ -335,12 +439,7 @@ class MemoryAgent:
     
     def _get_model_interface(self, model_id):
         """Get the appropriate model interface based on model ID."""
-        if model_id.lower() in ["chatgpt", "gpt", "openai"]:
-            return self.chatgpt_model
-        elif model_id.lower() in ["gemini", "google"]:
-            return self.gemini_model
-        else:
-            return None
+        return self._model_map.get(model_id.lower())
     
     def _update_model_preferences(self, model_id, preferences):
         """Update preferences for a specific model."""
@@ -363,12 +462,11 @@ class MemoryAgent:
     
     def _notify_callbacks(self, event_type, data):
         """Notify registered callbacks for an event."""
-        if event_type in self.user_callbacks:
-            for callback in self.user_callbacks[event_type]:
-                try:
-                    callback(data)
-                except Exception as e:
-                    self.logger.error(f"Error in callback for {event_type}: {e}")
+        for callback in self.user_callbacks.get(event_type, ()):
+            try:
+                callback(data)
+            except Exception as e:
+                self.logger.error(f"Error in callback for {event_type}: {e}")
     
     # Public API methods
     
@@ -383,8 +481,8 @@ class MemoryAgent:
         Returns:
             Task ID for the queued task
         """
-        task_id = f"task_{time.time()}_{id(content)}"
-        self.task_queue.put({
+        task_id = self._next_task_id()
+        self._enqueue({
             "id": task_id,
             "type": "add_memory",
             "content": content,
@@ -404,8 +502,8 @@ class MemoryAgent:
         Returns:
             Task ID for the queued task
         """
-        task_id = f"task_{time.time()}_{id(query)}"
-        self.task_queue.put({
+        task_id = self._next_task_id()
+        self._enqueue({
             "id": task_id,
             "type": "query_memory",
             "query": query,
@@ -427,8 +525,8 @@ class MemoryAgent:
         Returns:
             Task ID for the queued task
         """
-        task_id = f"task_{time.time()}_{id(query)}"
-        self.task_queue.put({
+        task_id = self._next_task_id()
+        self._enqueue({
             "id": task_id,
             "type": "model_communication",
             "source_model": source_model,
@@ -449,8 +547,8 @@ class MemoryAgent:
         Returns:
             Task ID for the queued task
         """
-        task_id = f"task_{time.time()}_{id(preferences)}"
-        self.task_queue.put({
+        task_id = self._next_task_id()
+        self._enqueue({
             "id": task_id,
             "type": "update_model_preferences",
             "model_id": model_id,
@@ -469,9 +567,10 @@ class MemoryAgent:
         Returns:
             True if registration was successful, False otherwise
         """
-        if event_type in self.user_callbacks:
-            self.user_callbacks[event_type].append(callback)
-            return True
+        with self._callbacks_lock:
+            if event_type in self.user_callbacks:
+                self.user_callbacks[event_type] += (callback,)
+                return True
         return False
     
     def unregister_callback(self, event_type, callback):
@@ -485,7 +584,18 @@ class MemoryAgent:
         Returns:
             True if unregistration was successful, False otherwise
         """
-        if event_type in self.user_callbacks and callback in self.user_callbacks[event_type]:
-            self.user_callbacks[event_type].remove(callback)
-            return True
+        with self._callbacks_lock:
+            callbacks = self.user_callbacks.get(event_type, ())
+            if callback in callbacks:
+                i = callbacks.index(callback)
+                self.user_callbacks[event_type] = callbacks[:i] + callbacks[i + 1:]
+                return True
         return False
+    
+    # Task type -> handler dispatch table for _execute_task
+    _HANDLERS = {
+        "add_memory": _handle_add_memory,
+        "query_memory": _handle_query_memory,
+        "model_communication": _handle_model_communication,
+        "update_model_preferences": _handle_update_model_preferences
+    }
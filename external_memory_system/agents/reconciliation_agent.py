@@ -3,11 +3,26 @@
 
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from external_memory_system.models.local_llm import LocalLLM, MockLLM
-from external_memory_system.dashboard.client import DashboardClient
+from external_memory_system.dashboard.client import BatchedDashboardClient
+
+# Bank account transactions are reconciled against
+RECONCILIATION_ACCOUNT_ID = "account_006"  # Company Credit Card
+
+# Days after the transaction date to look for it on the bank statement
+BANK_MATCH_WINDOW_DAYS = 5
+
+# Most bank transaction fetches process_tasks runs at once
+BANK_FETCH_WORKERS = 8
 
 class ReconciliationAgent:
     """Agent for reconciliation tasks."""
@@ -18,14 +33,20 @@ class ReconciliationAgent:
         self.vector_store = vector_store or MockVectorStore(namespace="reconciliation")
         self.logger = logging.getLogger(self.__class__.__name__)
         
-        # Initialize dashboard client
-        self.dashboard = DashboardClient(dashboard_url)
+        # Initialize dashboard client; reports are sent in batches
+        self.dashboard = BatchedDashboardClient(dashboard_url)
         self.agent_id = "reconciliation"
         self.dashboard.register_agent(self.agent_id, "Reconciliation Agent", "reconciliation")
         self.dashboard.log_message(self.agent_id, "INFO", "Reconciliation agent initialized")
         
-    def process_task(self, task):
-        """Process a task assigned to this agent."""
+    def process_task(self, task, prefetched: Optional[Dict] = None):
+        """Process a task assigned to this agent.
+        
+        Args:
+            task: The task to process
+            prefetched: Futures of bank transaction fetches already started
+                by process_tasks, by bank window
+        """
         task_id = task.get("id")
         task_type = task.get("type")
         
@@ -38,10 +59,9 @@ class ReconciliationAgent:
                 raise ValueError("Task type is required")
             
             # Route to appropriate handler method based on task type
-            if task_type == "reconcile_transaction":
-                result = self._process_reconcile_transaction(task)
-            elif task_type == "bank_reconciliation":
-                result = self._process_bank_reconciliation(task)
+            handler = self._HANDLERS.get(task_type)
+            if handler is not None:
+                result = handler(self, task, prefetched or {})
             else:
                 self.logger.warning(f"No specific handler for task type: {task_type}")
                 result = self._process_default(task)
@@ -56,45 +76,77 @@ class ReconciliationAgent:
             self.dashboard.update_task(task_id, "error", {"error": str(e)})
             self.dashboard.log_message(self.agent_id, "ERROR", error_msg)
             
+            # Don't leave the error report waiting on a batch
+            self.dashboard.flush()
+            
             return {
                 "status": "error",
                 "message": f"Error processing task: {str(e)}",
                 "task_id": task_id
             }
 
-    def _process_reconcile_transaction(self, task: Dict) -> Dict:
-        """Reconcile a specific transaction with bank statement."""
-        self.logger.info(f"Reconciling transaction: {task.get('id')}")
+    def process_tasks(self, tasks: List[Dict]) -> List[Dict]:
+        """Process a batch of tasks, fetching their bank transactions up front.
         
-        # Extract task data
-        data = task.get("data", {})
-        journal_entry = data.get("journal_entry", {})
+        The bank transaction windows of all reconcile_transaction tasks are
+        fetched concurrently before the tasks run, and tasks with the same
+        window share one fetch.
+        
+        Args:
+            tasks: The tasks to process
+            
+        Returns:
+            The results, in the same order as the tasks
+        """
+        windows = set()
+        for task in tasks:
+            if task.get("type") == "reconcile_transaction":
+                try:
+                    windows.add(_bank_window((task.get("data") or {}).get("journal_entry")))
+                except (AttributeError, TypeError, ValueError):
+                    # Left for process_task to report
+                    continue
+        
+        if not windows:
+            return [self.process_task(task) for task in tasks]
         
-        # Get QuickBooks integration
         from external_memory_system.integrations.mock_quickbooks import MockQuickBooksIntegration
         qb = MockQuickBooksIntegration()
+        with ThreadPoolExecutor(max_workers=min(BANK_FETCH_WORKERS, len(windows)),
+                                thread_name_prefix="reconciliation-qb") as pool:
+            prefetched = {
+                window: pool.submit(qb.get_bank_transactions, *window)
+                for window in windows
+            }
+            return [self.process_task(task, prefetched) for task in tasks]
+    
+    def _process_reconcile_transaction(self, task: Dict, prefetched: Dict) -> Dict:
+        """Reconcile a specific transaction with bank statement."""
+        self.logger.info(f"Reconciling transaction: {task.get('id')}")
+        now = datetime.now()
         
-        # Get bank transactions for the account
-        account_id = "account_006"  # Company Credit Card
-        start_date = journal_entry.get("date")
+        # Extract task data
+        data = task.get("data") or {}
+        journal_entry = data.get("journal_entry")
         
-        # Calculate end date (5 days after transaction date)
-        from datetime import datetime, timedelta
-        start_date_obj = datetime.strptime(start_date, "%Y-%m-%d")
-        end_date_obj = start_date_obj + timedelta(days=5)
-        end_date = end_date_obj.strftime("%Y-%m-%d")
+        # Get bank transactions for the account, unless process_tasks already fetched them
+        window = _bank_window(journal_entry)
+        start_date_obj = datetime.fromisoformat(window[1])
         
-        # Get bank transactions
-        bank_transactions = qb.get_bank_transactions(account_id, start_date, end_date)
+        future = prefetched.get(window)
+        if future is not None:
+            bank_transactions = future.result()
+        else:
+            from external_memory_system.integrations.mock_quickbooks import MockQuickBooksIntegration
+            qb = MockQuickBooksIntegration()
+            bank_transactions = qb.get_bank_transactions(*window)
         
         # Search for matching transaction
-        matching_transaction = None
-        for transaction in bank_transactions:
-            # Simple matching logic - in a real implementation, use more sophisticated matching
-            if (abs(transaction.get("amount") - journal_entry.get("amount")) < 0.01 and
-                transaction.get("description").upper() in journal_entry.get("description").upper()):
-                matching_transaction = transaction
-                break
+        matching_transaction = _find_matching_transaction(
+            bank_transactions,
+            journal_entry.get("amount"),
+            journal_entry.get("description")
+        )
         
         if matching_transaction:
             # Transaction found, mark as reconciled
@@ -109,13 +161,8 @@ class ReconciliationAgent:
             }
         else:
             # Transaction not found, check if we should retry later
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            transaction_date = journal_entry.get("date")
-            
-            # Calculate days since transaction
-            transaction_date_obj = datetime.strptime(transaction_date, "%Y-%m-%d")
-            current_date_obj = datetime.now()
-            days_since_transaction = (current_date_obj - transaction_date_obj).days
+            # (the transaction date is the start of the search window)
+            days_since_transaction = (now - start_date_obj).days
             
             if days_since_transaction < 5:  # Allow up to 5 days for transaction to appear
                 return {
@@ -124,7 +171,7 @@ class ReconciliationAgent:
                     "task_id": task.get("id"),
                     "reconciliation_status": "pending",
                     "journal_entry": journal_entry,
-                    "retry_after": (current_date_obj + timedelta(days=2)).strftime("%Y-%m-%d"),
+                    "retry_after": (now + timedelta(days=2)).date().isoformat(),
                     "requires_review": False
                 }
             else:
@@ -150,8 +197,8 @@ class ReconciliationAgent:
                 "requires_review": False
             }
     
-    def _process_bank_reconciliation(self, task: Dict) -> Dict:
-        """Process a full bank reconciliation."""
+    def _process_bank_reconciliation(self, task: Dict, prefetched: Dict) -> Dict:
+        """Process a full bank reconciliation (prefetched is not used)."""
         self.logger.info(f"Processing bank reconciliation: {task.get('id')}")
         
         # Simplified implementation for testing
@@ -190,19 +237,32 @@ class ReconciliationAgent:
         Returns:
             The ID of the agent to handle the task
         """
-        self.logger.debug(f"Routing task of type: {task.get('type')}")
+        self.logger.debug("Routing task of type: %s", task.get("type"))
         
         task_type = task.get("type")
         
         # Route based on task type
-        if task_type in ["journal_entry", "categorize_transaction", "chart_of_accounts"]:
-            return "bookkeeping"
-        elif task_type in ["reconcile_transaction", "bank_reconciliation"]:
-            return "reconciliation"
-        else:
+        agent_id = self._ROUTE_TABLE.get(task_type)
+        if agent_id is None:
             # Default to bookkeeping for unknown task types
             self.logger.warning(f"Unknown task type: {task_type}, routing to bookkeeping")
             return "bookkeeping"
+        return agent_id
+    
+    # Task type -> handler dispatch table for process_task
+    _HANDLERS = {
+        "reconcile_transaction": _process_reconcile_transaction,
+        "bank_reconciliation": _process_bank_reconciliation
+    }
+    
+    # Task type -> agent ID for route_task
+    _ROUTE_TABLE = {
+        "journal_entry": "bookkeeping",
+        "categorize_transaction": "bookkeeping",
+        "chart_of_accounts": "bookkeeping",
+        "reconcile_transaction": "reconciliation",
+        "bank_reconciliation": "reconciliation"
+    }
         
     # At the end of reconciliation_agent.py
     if __name__ == "__main__":
@@ -236,3 +296,57 @@ class ReconciliationAgent:
         # Print the result
         print("Test result:")
         print(result)
+
+
+def _bank_window(journal_entry: Dict) -> Tuple[str, str, str]:
+    """Return the (account_id, start_date, end_date) to search for a journal entry.
+    
+    Args:
+        journal_entry: The journal entry being reconciled
+        
+    Returns:
+        The bank account and the date range, from the entry's date to
+        BANK_MATCH_WINDOW_DAYS days after it
+        
+    Raises:
+        ValueError: If the journal entry is missing or has no date
+    """
+    if not isinstance(journal_entry, dict) or not journal_entry.get("date"):
+        raise ValueError("Journal entry with a date is required")
+    start_date = journal_entry["date"]
+    end_date_obj = datetime.fromisoformat(start_date) + timedelta(days=BANK_MATCH_WINDOW_DAYS)
+    return RECONCILIATION_ACCOUNT_ID, start_date, end_date_obj.date().isoformat()
+
+
+def _find_matching_transaction(bank_transactions: List[Dict], amount: float, description: str) -> Optional[Dict]:
+    """Find the first bank transaction matching a journal entry's amount and description.
+    
+    Amounts are compared for all transactions at once (with numpy when it is
+    installed), and only those within a cent have their description checked.
+    
+    Args:
+        bank_transactions: The candidate bank transactions
+        amount: The journal entry amount
+        description: The journal entry description
+        
+    Returns:
+        The matching transaction, or None if there is none
+    """
+    if not bank_transactions:
+        return None
+    
+    # Simple matching logic - in a real implementation, use more sophisticated matching
+    if np is not None:
+        amounts = np.fromiter((transaction.get("amount") for transaction in bank_transactions),
+                              dtype=np.float64, count=len(bank_transactions))
+        candidates = np.flatnonzero(np.abs(amounts - amount) < 0.01).tolist()
+    else:
+        candidates = [i for i, transaction in enumerate(bank_transactions)
+                      if abs(transaction.get("amount") - amount) < 0.01]
+    
+    description = description.upper()
+    for i in candidates:
+        if bank_transactions[i].get("description").upper() in description:
+            return bank_transactions[i]
+    
+    return None
@@ -1,12 +1,60 @@
 # external_memory_system/atlas/communication.py
+import itertools
 import json
+import atexit
 import logging
+import os
+import queue
+import threading
+from bisect import bisect_right
+from collections import Counter, defaultdict, deque
+from itertools import islice
 from typing import Dict, Any, List, Optional
 import time
 
+from external_memory_system.config import (
+    COMMUNICATION_JOURNAL_BACKUP_COUNT,
+    COMMUNICATION_JOURNAL_MAX_BYTES,
+    COMMUNICATION_JOURNAL_PATH,
+)
+
+# Journal lines are encoded with orjson when it is installed
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        """Serialize an object to JSON bytes using orjson."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        """Serialize an object to JSON bytes using the standard library."""
+        return json.dumps(obj, default=str).encode()
+    
+    _loads = json.loads
+
+# Source of message IDs; next() on a count is atomic across threads
+_MESSAGE_COUNTER = itertools.count(1)
+
+# Width of the time buckets used to skip old messages in time-range queries
+TIME_BUCKET_SECONDS = 3600
+
+# Write buffer size used for the journal of sent messages
+JOURNAL_BUFFER_SIZE = 65536
+
+# Real paths of the journals open in this process; two buses appending to
+# one file would interleave their buffered writes mid-line
+_OPEN_JOURNALS = set()
+_OPEN_JOURNALS_LOCK = threading.Lock()
+
+logger = logging.getLogger("Atlas.CommunicationBus")
+
 class Message:
     """Represents a message between Atlas and an agent."""
     
+    __slots__ = ("sender", "receiver", "content", "message_type", "timestamp", "message_id")
+    
     def __init__(self, sender: str, receiver: str, content: Dict, message_type: str = "task"):
         """
         Initialize a new message.
@@ -22,7 +70,7 @@ class Message:
         self.content = content
         self.message_type = message_type
         self.timestamp = time.time()
-        self.message_id = f"{int(self.timestamp)}_{sender}_{receiver}"
+        self.message_id = f"{next(_MESSAGE_COUNTER):012x}"
     
     def to_dict(self) -> Dict:
         """Convert the message to a dictionary."""
@@ -35,6 +83,10 @@ class Message:
             "timestamp": self.timestamp
         }
     
+    def to_bytes(self) -> bytes:
+        """Serialize the message (as to_dict) to UTF-8 JSON bytes."""
+        return _dumps(self.to_dict())
+    
     @classmethod
     def from_dict(cls, data: Dict) -> 'Message':
         """Create a message from a dictionary."""
@@ -48,16 +100,239 @@ class Message:
         message.message_id = data["id"]
         return message
 
+class _Journal:
+    """
+    Append-only file of sent messages, one JSON line each, rotated by size.
+    
+    Rotation works like logging.handlers.RotatingFileHandler: once a line
+    would take the file past max_bytes it is renamed to path.1, older files
+    shift up to path.backup_count and the oldest is deleted. Each time the
+    newest timestamp written enters a new time bucket, the bucket and the
+    (generation, offset) of its first line are recorded, so a count only
+    reads from its start bucket on.
+    """
+    
+    def __init__(self, path: str, max_bytes: int, backup_count: int):
+        """
+        Open a journal for appending.
+        
+        Args:
+            path: File messages are appended to
+            max_bytes: Size the file rotates at, or 0 to never rotate
+            backup_count: Number of rotated files kept, or 0 to never rotate
+            
+        Raises:
+            ValueError: If another bus in this process has the path open
+        """
+        self._realpath = os.path.realpath(path)
+        with _OPEN_JOURNALS_LOCK:
+            if self._realpath in _OPEN_JOURNALS:
+                raise ValueError(f"Journal {path} is already open by another CommunicationBus")
+            _OPEN_JOURNALS.add(self._realpath)
+        
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "ab", buffering=JOURNAL_BUFFER_SIZE)
+        
+        # Rotations so far, and where this bus's lines start in generation 0
+        self._generation = 0
+        self._start = self._file.tell()
+        self._buckets = []
+        self._positions = []
+    
+    def write(self, message: Message) -> None:
+        """Append a message; after close() the line is written straight through."""
+        line = message.to_bytes() + b"\n"
+        if self._file is None:
+            with open(self.path, "ab") as journal:
+                self._append(journal, message, line)
+            return
+        
+        if self.max_bytes and self.backup_count and 0 < self._file.tell() and self._file.tell() + len(line) > self.max_bytes:
+            self._rotate()
+        self._append(self._file, message, line)
+    
+    def _append(self, journal, message: Message, line: bytes) -> None:
+        """Write a line, recording its position if it starts a new time bucket."""
+        bucket = int(message.timestamp // TIME_BUCKET_SECONDS)
+        if not self._buckets or bucket > self._buckets[-1]:
+            self._buckets.append(bucket)
+            self._positions.append((self._generation, journal.tell()))
+        journal.write(line)
+    
+    def _rotate(self) -> None:
+        """Move the current file to path.1, shifting the backups, and start a new one."""
+        self._file.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+        self._file = open(self.path, "ab", buffering=JOURNAL_BUFFER_SIZE)
+        self._generation += 1
+        
+        # Forget where buckets start in files that have been deleted
+        oldest = self._generation - self.backup_count
+        while self._positions and self._positions[0][0] < oldest:
+            del self._buckets[0]
+            del self._positions[0]
+    
+    def segments(self, start_time: float) -> List[tuple]:
+        """
+        Open the journal files holding messages from start_time's bucket on.
+        
+        Called under the bus lock, so the files and the sizes returned are
+        a consistent snapshot that later writes and rotations do not change.
+        
+        Returns:
+            A list of (file, start offset, end offset) tuples, oldest first
+        """
+        if self._file is not None:
+            self._file.flush()
+        
+        i = bisect_right(self._buckets, int(start_time // TIME_BUCKET_SECONDS)) - 1
+        generation, offset = self._positions[i] if i >= 0 else (0, self._start)
+        oldest = max(0, self._generation - self.backup_count)
+        if generation < oldest:
+            generation, offset = oldest, self._start if oldest == 0 else 0
+        
+        segments = []
+        for g in range(generation, self._generation + 1):
+            age = self._generation - g
+            try:
+                journal = open(f"{self.path}.{age}" if age else self.path, "rb")
+            except FileNotFoundError:
+                continue
+            segments.append((journal, offset if g == generation else 0, os.fstat(journal.fileno()).st_size))
+        return segments
+    
+    def close(self) -> None:
+        """Flush and close the file and let another bus open the path."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        with _OPEN_JOURNALS_LOCK:
+            _OPEN_JOURNALS.discard(self._realpath)
+
+def _count_journal(segments: List[tuple], start_time: float, end_time: float):
+    """
+    Count the journaled messages with start_time <= timestamp <= end_time.
+    
+    Reads each (file, start offset, end offset) segment from
+    _Journal.segments() and closes it. Lines that do not decode, such as a
+    line cut short by a crash, are skipped.
+    
+    Returns:
+        The total, the counts by message type and the counts by
+        (sender, receiver) pair
+    """
+    total = 0
+    message_types = Counter()
+    communication_pairs = Counter()
+    skipped = 0
+    
+    for journal, offset, end_offset in segments:
+        with journal:
+            journal.seek(offset)
+            remaining = end_offset - offset
+            for line in journal:
+                remaining -= len(line)
+                if remaining < 0:
+                    break
+                try:
+                    message = _loads(line)
+                    timestamp = message["timestamp"]
+                    if start_time <= timestamp <= end_time:
+                        message_types[message["type"]] += 1
+                        communication_pairs[(message["sender"], message["receiver"])] += 1
+                        total += 1
+                except (ValueError, KeyError, TypeError):
+                    skipped += 1
+    
+    if skipped:
+        logger.warning("Skipped %d unreadable journal lines", skipped)
+    return total, message_types, communication_pairs
+
 class CommunicationBus:
     """
     Handles communication between Atlas and agents.
     Provides logging and monitoring of all communications.
     """
     
-    def __init__(self):
-        """Initialize the communication bus."""
+    def __init__(self,
+                 max_messages: int = 10_000,
+                 journal_path: Optional[str] = COMMUNICATION_JOURNAL_PATH,
+                 journal_max_bytes: int = COMMUNICATION_JOURNAL_MAX_BYTES,
+                 journal_backup_count: int = COMMUNICATION_JOURNAL_BACKUP_COUNT):
+        """
+        Initialize the communication bus.
+        
+        Args:
+            max_messages: Number of most recent messages kept for monitoring
+            journal_path: File every sent message is appended to as a JSON
+                line, or None to keep no journal
+            journal_max_bytes: Size the journal rotates at
+            journal_backup_count: Number of rotated journal files kept;
+                reports reaching back past them undercount
+            
+        Raises:
+            ValueError: If another bus in this process journals to journal_path
+        """
         self.logger = logging.getLogger("Atlas.CommunicationBus")
-        self.messages = []  # Store all messages for monitoring
+        
+        # Sliding window of recent messages for monitoring, stored as one
+        # column per field; dicts are only built for messages that are read
+        self._ids = deque(maxlen=max_messages)
+        self._senders = deque(maxlen=max_messages)
+        self._receivers = deque(maxlen=max_messages)
+        self._contents = deque(maxlen=max_messages)
+        self._types = deque(maxlen=max_messages)
+        self._timestamps = deque(maxlen=max_messages)
+        
+        # Messages are appended in roughly time order. Each time the newest
+        # timestamp seen enters a new TIME_BUCKET_SECONDS bucket, the bucket
+        # and the message's sequence number are recorded; every message
+        # before that one is older than the bucket's start.
+        self._appended = 0
+        self._max_timestamp = float("-inf")
+        self._bucket_keys = []
+        self._bucket_seqs = []
+        
+        # Report counts kept up to date per time bucket as messages come and
+        # go, with each bucket's (timestamp, type, sender, receiver) rows for
+        # the buckets a report window only partly covers
+        self._bucket_rows = {}
+        self._type_counts = defaultdict(Counter)
+        self._pair_counts = defaultdict(Counter)
+        
+        # Stored messages grouped by (sender, receiver) pair, oldest first,
+        # for queries that give both
+        self._pair_rows = {}
+        
+        # Optional journal of every message sent through this bus; reports
+        # reaching back past the in-memory window are counted from it
+        self._journal = _Journal(journal_path, journal_max_bytes, journal_backup_count) if journal_path else None
+        self._evicted_until = float("-inf")
+        
+        # Senders only enqueue; a single worker thread applies messages to
+        # the window, the indexes and the journal under _lock, and readers
+        # take _lock after the worker has caught up with their own sends
+        self._lock = threading.Lock()
+        self._inbox = queue.SimpleQueue()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="communication-bus", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+    
+    @property
+    def messages(self) -> List[Dict]:
+        """The stored messages as dictionaries, oldest first."""
+        self._sync()
+        with self._lock:
+            return [_row(*row) for row in self._rows()]
     
     def send_message(self, message: Message) -> None:
         """
@@ -66,15 +341,45 @@ class CommunicationBus:
         Args:
             message: The message to send
         """
-        self.logger.info(f"Message sent: {message.sender} -> {message.receiver} ({message.message_type})")
-        self.logger.debug(f"Message content: {message.content}")
+        self.logger.info("Message sent: %s -> %s (%s)", message.sender, message.receiver, message.message_type)
+        self.logger.debug("Message content: %s", message.content)
         
-        # Store the message for monitoring
-        self.messages.append(message.to_dict())
+        # Checked and queued under _lock, which close() holds while it
+        # sets _closed and applies what is left in the inbox
+        with self._lock:
+            if self._closed:
+                self._store(message)
+            else:
+                self._inbox.put(message)
         
         # In a real implementation, this would actually deliver the message
         # For now, we just log it
     
+    def _store(self, message: Message) -> None:
+        """Journal a sent message and add it to the window and indexes (holding _lock)."""
+        if self._journal is not None:
+            self._journal.write(message)
+        
+        # Store the message for monitoring, uncounting the one it pushes out
+        if len(self._timestamps) == self._timestamps.maxlen:
+            if self._timestamps:
+                self._evicted_until = max(self._evicted_until, self._timestamps[0])
+                self._uncount_oldest()
+                self._unindex_oldest()
+            else:
+                self._evicted_until = max(self._evicted_until, message.timestamp)
+        
+        self._ids.append(message.message_id)
+        self._senders.append(message.sender)
+        self._receivers.append(message.receiver)
+        self._contents.append(message.content)
+        self._types.append(message.message_type)
+        self._timestamps.append(message.timestamp)
+        self._index_timestamp(message.timestamp)
+        if self._timestamps:
+            self._count(message.timestamp, message.message_type, message.sender, message.receiver)
+            self._index_pair(message)
+    
     def get_messages(self, 
                     sender: Optional[str] = None, 
                     receiver: Optional[str] = None, 
@@ -94,24 +399,10 @@ class CommunicationBus:
         Returns:
             A list of messages matching the criteria
         """
-        filtered_messages = self.messages
-        
-        if sender:
-            filtered_messages = [m for m in filtered_messages if m["sender"] == sender]
-        
-        if receiver:
-            filtered_messages = [m for m in filtered_messages if m["receiver"] == receiver]
-        
-        if message_type:
-            filtered_messages = [m for m in filtered_messages if m["type"] == message_type]
-        
-        if start_time:
-            filtered_messages = [m for m in filtered_messages if m["timestamp"] >= start_time]
-        
-        if end_time:
-            filtered_messages = [m for m in filtered_messages if m["timestamp"] <= end_time]
-        
-        return filtered_messages
+        self._sync()
+        with self._lock:
+            rows = self._select(sender, receiver, message_type, start_time, end_time)
+            return [_row(*row) for row in rows]
     
     def generate_report(self, 
                        start_time: Optional[float] = None,
@@ -133,26 +424,285 @@ class CommunicationBus:
         if not start_time:
             start_time = end_time - (24 * 60 * 60)  # 24 hours
         
-        messages = self.get_messages(start_time=start_time, end_time=end_time)
+        # Count messages by type and by sender/receiver pair, from the journal
+        # if messages in the period have left the in-memory window
+        self._sync()
+        segments = None
+        with self._lock:
+            if self._journal is not None and start_time <= self._evicted_until:
+                segments = self._journal.segments(start_time)
+            else:
+                total, message_types, communication_pairs = self._counts_between(start_time, end_time)
         
-        # Count messages by type
-        message_types = {}
-        for message in messages:
-            message_type = message["type"]
-            message_types[message_type] = message_types.get(message_type, 0) + 1
-        
-        # Count messages by sender/receiver pair
-        communication_pairs = {}
-        for message in messages:
-            pair = f"{message['sender']} -> {message['receiver']}"
-            communication_pairs[pair] = communication_pairs.get(pair, 0) + 1
+        # Read the journal without holding up senders
+        if segments is not None:
+            total, message_types, communication_pairs = _count_journal(segments, start_time, end_time)
         
         return {
             "period": {
                 "start": start_time,
                 "end": end_time
             },
-            "total_messages": len(messages),
-            "message_types": message_types,
-            "communication_pairs": communication_pairs
+            "total_messages": total,
+            "message_types": dict(message_types),
+            "communication_pairs": {
+                f"{sender} -> {receiver}": count
+                for (sender, receiver), count in communication_pairs.items()
+            }
         }
+    
+    def _count(self, timestamp: float, message_type: str, sender: str, receiver: str) -> None:
+        """Add a stored message to the report counts of its time bucket."""
+        bucket = int(timestamp // TIME_BUCKET_SECONDS)
+        rows = self._bucket_rows.get(bucket)
+        if rows is None:
+            rows = self._bucket_rows[bucket] = deque()
+        rows.append((timestamp, message_type, sender, receiver))
+        self._type_counts[bucket][message_type] += 1
+        self._pair_counts[bucket][(sender, receiver)] += 1
+    
+    def _uncount_oldest(self) -> None:
+        """Remove the oldest stored message, about to be evicted, from the report counts."""
+        bucket = int(self._timestamps[0] // TIME_BUCKET_SECONDS)
+        
+        # The oldest message is also the oldest one in its bucket
+        _, message_type, sender, receiver = self._bucket_rows[bucket].popleft()
+        if not self._bucket_rows[bucket]:
+            del self._bucket_rows[bucket]
+            del self._type_counts[bucket]
+            del self._pair_counts[bucket]
+            return
+        
+        for counts, key in ((self._type_counts[bucket], message_type), (self._pair_counts[bucket], (sender, receiver))):
+            counts[key] -= 1
+            if not counts[key]:
+                del counts[key]
+    
+    def close(self) -> None:
+        """Apply the queued messages, stop the worker thread and close the journal.
+        
+        Messages sent after closing are stored and journaled directly by
+        the sender.
+        """
+        if self._closed:
+            return
+        
+        self._inbox.put(None)
+        self._worker.join()
+        with self._lock:
+            self._closed = True
+            
+            # Apply anything sent while the worker was stopping
+            self._apply_queued()
+            if self._journal is not None:
+                self._journal.close()
+    
+    def _sync(self) -> None:
+        """Wait until the worker has applied every message queued before this call."""
+        if self._closed:
+            return
+        
+        done = threading.Event()
+        self._inbox.put(done)
+        while not done.wait(0.1):
+            if not self._worker.is_alive():
+                return
+    
+    def _run(self) -> None:
+        """Apply queued messages, in the order they were sent, until close() is called."""
+        while True:
+            item = self._inbox.get()
+            
+            if item is None:
+                return
+            
+            # Apply everything already queued under one hold of the lock
+            with self._lock:
+                self._apply(item)
+                if not self._apply_queued():
+                    return
+    
+    def _apply_queued(self) -> bool:
+        """Apply the queued items without waiting (holding _lock); False once the stop sentinel is reached."""
+        while True:
+            try:
+                item = self._inbox.get_nowait()
+            except queue.Empty:
+                return True
+            if item is None:
+                return False
+            self._apply(item)
+    
+    def _apply(self, item) -> None:
+        """Store a queued message, or release the reader waiting on a queued marker."""
+        if not isinstance(item, Message):
+            item.set()
+            return
+        
+        try:
+            self._store(item)
+        except Exception as e:
+            self.logger.error(f"Error storing message {item.message_id}: {str(e)}")
+    
+    def _index_pair(self, message: Message) -> None:
+        """Add a stored message to the rows of its (sender, receiver) pair."""
+        pair = (message.sender, message.receiver)
+        rows = self._pair_rows.get(pair)
+        if rows is None:
+            rows = self._pair_rows[pair] = deque()
+        rows.append((message.message_id, message.sender, message.receiver,
+                     message.content, message.message_type, message.timestamp))
+    
+    def _unindex_oldest(self) -> None:
+        """Remove the oldest stored message, about to be evicted, from the rows of its pair."""
+        pair = (self._senders[0], self._receivers[0])
+        
+        # The oldest message is also the oldest one of its pair
+        rows = self._pair_rows[pair]
+        rows.popleft()
+        if not rows:
+            del self._pair_rows[pair]
+    
+    def _counts_between(self, start_time: float, end_time: float):
+        """
+        Count the stored messages with start_time <= timestamp <= end_time.
+        
+        Buckets inside the window add their running counts; only the
+        buckets at its edges are scanned.
+        
+        Returns:
+            The total, the counts by message type and the counts by
+            (sender, receiver) pair
+        """
+        total = 0
+        message_types = Counter()
+        communication_pairs = Counter()
+        
+        for bucket, rows in self._bucket_rows.items():
+            bucket_start = bucket * TIME_BUCKET_SECONDS
+            bucket_end = bucket_start + TIME_BUCKET_SECONDS
+            
+            if start_time <= bucket_start and bucket_end <= end_time:
+                total += len(rows)
+                message_types.update(self._type_counts[bucket])
+                communication_pairs.update(self._pair_counts[bucket])
+            elif bucket_start <= end_time and bucket_end > start_time:
+                for timestamp, message_type, sender, receiver in rows:
+                    if start_time <= timestamp <= end_time:
+                        total += 1
+                        message_types[message_type] += 1
+                        communication_pairs[(sender, receiver)] += 1
+        
+        return total, message_types, communication_pairs
+    
+    def _rows(self, skip: int = 0):
+        """
+        Iterate over the stored messages as (id, sender, receiver, content, type, timestamp) tuples.
+        
+        Args:
+            skip: Number of oldest messages to leave out
+        """
+        columns = (self._ids, self._senders, self._receivers, self._contents, self._types, self._timestamps)
+        if not skip:
+            return zip(*columns)
+        
+        # Reach the kept messages from whichever end of the deques is closer
+        keep = len(self._timestamps) - skip
+        if keep < skip:
+            newest_first = list(zip(*(islice(reversed(column), keep) for column in columns)))
+            return reversed(newest_first)
+        return zip(*(islice(column, skip, None) for column in columns))
+    
+    def _index_timestamp(self, timestamp: float) -> None:
+        """Record the time bucket of a newly appended message if it starts a new one."""
+        seq = self._appended
+        self._appended += 1
+        
+        if timestamp <= self._max_timestamp:
+            return
+        self._max_timestamp = timestamp
+        
+        bucket = int(timestamp // TIME_BUCKET_SECONDS)
+        if not self._bucket_keys or bucket > self._bucket_keys[-1]:
+            self._bucket_keys.append(bucket)
+            self._bucket_seqs.append(seq)
+            
+            # Forget buckets that no longer mark a message still in the window
+            oldest = self._appended - len(self._timestamps)
+            drop = 0
+            while drop + 1 < len(self._bucket_seqs) and self._bucket_seqs[drop + 1] <= oldest:
+                drop += 1
+            if drop:
+                del self._bucket_keys[:drop]
+                del self._bucket_seqs[:drop]
+    
+    def _skip_before(self, start_time: float) -> int:
+        """Get how many of the oldest stored messages are known to predate start_time."""
+        i = bisect_right(self._bucket_keys, int(start_time // TIME_BUCKET_SECONDS)) - 1
+        if i < 0:
+            return 0
+        return max(0, self._bucket_seqs[i] - (self._appended - len(self._timestamps)))
+    
+    def _select(self, 
+               sender: Optional[str] = None, 
+               receiver: Optional[str] = None, 
+               message_type: Optional[str] = None,
+               start_time: Optional[float] = None,
+               end_time: Optional[float] = None) -> List[tuple]:
+        """
+        Get the stored message tuples matching the criteria in a single pass.
+        
+        Falsy criteria are ignored, as in get_messages. Only the criteria
+        that are set are tested, and with none set the rows are copied out
+        without testing. With both a sender and a receiver, only that
+        pair's messages are looked at; otherwise, with a start time, the
+        messages in time buckets before it are skipped without being
+        looked at.
+        """
+        if sender and receiver:
+            rows = self._pair_rows.get((sender, receiver), ())
+            if not (message_type or start_time or end_time):
+                return list(rows)
+            start_time = start_time or float("-inf")
+            end_time = end_time or float("inf")
+            return [
+                row for row in rows
+                if start_time <= row[5] <= end_time
+                and (not message_type or row[4] == message_type)
+            ]
+        
+        rows = self._rows(self._skip_before(start_time) if start_time else 0)
+        
+        if not (start_time or end_time):
+            if not (sender or receiver or message_type):
+                return list(rows)
+            return [
+                row for row in rows
+                if (not sender or row[1] == sender)
+                and (not receiver or row[2] == receiver)
+                and (not message_type or row[4] == message_type)
+            ]
+        
+        start_time = start_time or float("-inf")
+        end_time = end_time or float("inf")
+        if not (sender or receiver or message_type):
+            return [row for row in rows if start_time <= row[5] <= end_time]
+        return [
+            row for row in rows
+            if start_time <= row[5] <= end_time
+            and (not sender or row[1] == sender)
+            and (not receiver or row[2] == receiver)
+            and (not message_type or row[4] == message_type)
+        ]
+
+
+def _row(message_id, sender, receiver, content, message_type, timestamp) -> Dict:
+    """Build the dictionary form of a stored message (as Message.to_dict)."""
+    return {
+        "id": message_id,
+        "sender": sender,
+        "receiver": receiver,
+        "content": content,
+        "type": message_type,
+        "timestamp": timestamp
+    }
@@ -1,18 +1,65 @@
 # external_memory_system/atlas/coordinator.py
+import itertools
 import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 import os
-import sys
-
-# Add parent directory to path to allow imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from external_memory_system.config import ATLAS_MAX_WORKERS
 from external_memory_system.models.local_llm import LocalLLM, MockLLM
 from external_memory_system.agents.bookkeeping_agent import BookkeepingAgent, MockVectorStore
-from agents.bookkeeping_agent import BookkeepingAgent
-from external_memory_system.dashboard.client import DashboardClient
+from external_memory_system.agents.reconciliation_agent import ReconciliationAgent
+from external_memory_system.dashboard.client import BatchedDashboardClient
 # Import other agents as they are implemented
 
+# Shared by all Atlas instances; tasks spend most of their time waiting on
+# the LLM, Pinecone and the dashboard, so threads are enough to overlap them
+_EXECUTOR = ThreadPoolExecutor(max_workers=ATLAS_MAX_WORKERS, thread_name_prefix="atlas")
+
+# Dashboard reports are sent once 100 are queued or after 50 ms
+DASHBOARD_BATCH_SIZE = 100
+DASHBOARD_FLUSH_INTERVAL = 0.05
+
+# Number of most recent tasks (with their results) kept in the system state;
+# older tasks only remain in the status counts
+TASK_HISTORY_SIZE = 1000
+
+# Task IDs are a random per-process prefix plus a counter: unique across
+# restarts (the dashboard keeps them) without a uuid4 per task
+_TASK_ID_PREFIX = uuid.uuid4().hex[:6]
+_TASK_COUNTER = itertools.count(1)
+
+# Task type -> agent ID for the task types routed without asking the LLM
+_ROUTE_TABLE = {
+    "journal_entry": "bookkeeping",
+    "categorize_transaction": "bookkeeping",
+    "chart_of_accounts": "bookkeeping",
+    "reconcile_transaction": "reconciliation",
+    "bank_reconciliation": "reconciliation"
+}
+
+# Prompt used to let the LLM route complex tasks
+ROUTING_PROMPT_TEMPLATE = """
+            You are Atlas, the central coordinator for an accounting agent system.
+            You need to decide which specialized agent should handle this task:
+            
+            Task: {task}
+            
+            Available agents:
+            {agents}
+            
+            Which agent should handle this task? Respond with just the agent name.
+            """
+
+# Agent classes by agent ID, for agents registered without an instance
+AGENT_CLASSES = {
+    "bookkeeping": BookkeepingAgent,
+    "reconciliation": ReconciliationAgent
+}
+
 class Atlas:
     """
     Atlas central coordinator for the accounting agent system.
@@ -24,13 +71,23 @@ class Atlas:
         self.llm = llm or MockLLM()
         self.vector_store = vector_store or MockVectorStore(namespace="atlas")
         self.agents = {}
+        self._agents_joined = ""  # Agent IDs as listed in the routing prompt
         self.state = {}
+        
+        # Agent instances, created on first use for agents registered by type
+        self._agent_instances = {}
+        self._agent_lock = threading.Lock()
         self.tasks_completed = 0
-        self.tasks_by_status = {}
+        self.tasks_by_status = {}  # Latest status of every task, kept by _update_state
+        self._state_lock = threading.Lock()
         self.logger = logging.getLogger(self.__class__.__name__)
         
-        # Initialize dashboard client
-        self.dashboard = DashboardClient(dashboard_url)
+        # Initialize dashboard client; reports are sent in batches
+        self.dashboard = BatchedDashboardClient(
+            dashboard_url,
+            batch_size=DASHBOARD_BATCH_SIZE,
+            flush_interval=DASHBOARD_FLUSH_INTERVAL
+        )
         self.dashboard.register_agent("atlas", "Atlas Coordinator", "coordinator")
         self.dashboard.log_message("atlas", "INFO", "Atlas coordinator initialized")
     
@@ -85,8 +142,20 @@ class Atlas:
         # Add other agents as they are implemented
     
     def register_agent(self, agent_id, agent_type):
-        """Register an agent with Atlas."""
-        self.agents[agent_id] = agent_type
+        """Register an agent with Atlas.
+        
+        Args:
+            agent_id: ID the agent's tasks are routed to
+            agent_type: The agent instance, or the name of its type (the
+                instance is then created from AGENT_CLASSES on first use)
+        """
+        with self._agent_lock:
+            self.agents[agent_id] = agent_type
+            self._agents_joined = ", ".join(self.agents)
+            self._agent_instances.pop(agent_id, None)
+            if not isinstance(agent_type, str):
+                self._agent_instances[agent_id] = agent_type
+                agent_type = agent_id
         self.logger.info(f"Registered agent: {agent_id}")
         
         # Register agent with dashboard
@@ -103,43 +172,55 @@ class Atlas:
         Returns:
             The name of the agent that should handle the task
         """
-        self.logger.debug(f"Routing task of type: {task_type}")
-        
         task_type = task.get("type")
         
+        self.logger.debug("Routing task of type: %s", task_type)
+        
+        # Known task types go straight to their agent
+        agent_id = _ROUTE_TABLE.get(task_type)
+        if agent_id is not None:
+            return agent_id
+        
         # Use the LLM to make routing decisions for complex tasks
-        if task_type in ["complex", "unknown"]:
-            prompt = f"""
-            You are Atlas, the central coordinator for an accounting agent system.
-            You need to decide which specialized agent should handle this task:
-            
-            Task: {task}
-            
-            Available agents:
-            {', '.join(self.agents.keys())}
-            
-            Which agent should handle this task? Respond with just the agent name.
-            """
-            
+        if task_type in ("complex", "unknown"):
+            prompt = ROUTING_PROMPT_TEMPLATE.format(task=task, agents=self._agents_joined)
             response = self.llm.generate(prompt)
             agent_name = response.strip().lower()
             
             if agent_name in self.agents:
-                self.logger.info(f"LLM routed task to: {agent_name}")
+                self.logger.info("LLM routed task to: %s", agent_name)
                 return agent_name
             else:
                 self.logger.warning(f"LLM suggested invalid agent: {agent_name}")
                 # Fall back to default routing
         
-        # Route based on task type
-        if task_type in ["journal_entry", "categorize_transaction", "chart_of_accounts"]:
-            return "bookkeeping"
-        elif task_type in ["reconcile_transaction", "bank_reconciliation"]:
-            return "reconciliation"
-        else:
-            # Default to bookkeeping for unknown task types
-            self.logger.warning(f"Unknown task type: {task_type}, routing to bookkeeping")
-            return "bookkeeping"
+        # Default to bookkeeping for unknown task types
+        self.logger.warning(f"Unknown task type: {task_type}, routing to bookkeeping")
+        return "bookkeeping"
+    
+    def _get_agent(self, agent_id):
+        """
+        Get the instance of a registered agent, creating it on first use.
+        
+        Args:
+            agent_id: ID of a registered agent
+            
+        Returns:
+            The agent instance, or None if its type has no agent class
+        """
+        agent = self._agent_instances.get(agent_id)
+        if agent is not None:
+            return agent
+        
+        with self._agent_lock:
+            agent = self._agent_instances.get(agent_id)
+            if agent is None:
+                agent_class = AGENT_CLASSES.get(agent_id)
+                if agent_class is None:
+                    return None
+                agent = agent_class(llm=self.llm, vector_store=self.vector_store)
+                self._agent_instances[agent_id] = agent
+        return agent
     
     def execute_task(self, task):
         """Execute a task by routing it to the appropriate agent."""
@@ -156,7 +237,7 @@ class Atlas:
         
         # Route the task
         agent_id = self.route_task(task)
-        self.logger.debug(f"Routing task of type: {task_type}")
+        self.logger.debug("Routing task of type: %s", task_type)
         
         if agent_id not in self.agents:
             error_msg = f"Agent {agent_id} not registered"
@@ -169,25 +250,19 @@ class Atlas:
         
         try:
             # Send the task to the agent
-            self.logger.info(f"Sending task to {agent_id} agent")
+            self.logger.info("Sending task to %s agent", agent_id)
             self.dashboard.log_message("atlas", "INFO", f"Sending task {task_id} to {agent_id} agent")
             
-            # In a real implementation, you would have a way to get the agent instance
-            # For now, we'll create a new instance for demonstration
-            if agent_id == "bookkeeping":
-                from external_memory_system.agents.bookkeeping_agent import BookkeepingAgent
-                agent = BookkeepingAgent(llm=self.llm, vector_store=self.vector_store)
-            elif agent_id == "reconciliation":
-                from external_memory_system.agents.reconciliation_agent import ReconciliationAgent
-                agent = ReconciliationAgent(llm=self.llm, vector_store=self.vector_store)
-            else:
+            # Reuse the agent's instance across tasks
+            agent = self._get_agent(agent_id)
+            if agent is None:
                 error_msg = f"Unknown agent type: {agent_type}"
                 self.logger.error(error_msg)
                 self.dashboard.update_task(task_id, "error", {"error": error_msg})
                 return {"status": "error", "message": error_msg}
             
             # Log task details
-            self.logger.debug(f"Task details: {task}")
+            self.logger.debug("Task details: %s", task)
             
             # Execute the task
             result = agent.process_task(task)
@@ -195,49 +270,81 @@ class Atlas:
             # Update task status in dashboard
             self.dashboard.update_task(task_id, result.get("status", "completed"), result)
             
+            self._update_state(task, result, agent_id)
             return result
         except Exception as e:
             error_msg = f"Error executing task on {agent_id} agent: {str(e)}"
             self.logger.error(error_msg)
             self.dashboard.update_task(task_id, "error", {"error": str(e)})
-            return {"status": "error", "message": str(e)}
+            result = {"status": "error", "message": str(e)}
+            self._update_state(task, result, agent_id)
+            return result
+    
+    def execute_tasks(self, tasks: List[Dict]) -> List[Dict]:
+        """Execute several independent tasks concurrently.
+        
+        Args:
+            tasks: The tasks to execute
+            
+        Returns:
+            The results, in the same order as the tasks
+        """
+        if len(tasks) <= 1:
+            return [self.execute_task(task) for task in tasks]
+        
+        return list(_EXECUTOR.map(self.execute_task, tasks))
     
     def _update_state(self, task: Dict, result: Dict, agent_name: str):
         """Update the system state with task results."""
         # Implement state tracking logic here
         task_id = task.get("id", "unknown")
+        status = result.get("status", "unknown")
         
-        if "tasks" not in self.state:
-            self.state["tasks"] = {}
-        
-        self.state["tasks"][task_id] = {
-            "task": task,
-            "result": result,
-            "agent": agent_name,
-            "status": result.get("status", "unknown")
-        }
+        with self._state_lock:
+            tasks = self.state.setdefault("tasks", OrderedDict())
+            
+            # Move the task from its previous status count to the new one; a
+            # task rerun after leaving the recent window is counted again
+            previous = tasks.pop(task_id, None)
+            if previous is not None:
+                old_status = previous["status"]
+                if self.tasks_by_status[old_status] == 1:
+                    del self.tasks_by_status[old_status]
+                else:
+                    self.tasks_by_status[old_status] -= 1
+            self.tasks_by_status[status] = self.tasks_by_status.get(status, 0) + 1
+            
+            tasks[task_id] = {
+                "task": task,
+                "result": result,
+                "agent": agent_name,
+                "status": status
+            }
+            if len(tasks) > TASK_HISTORY_SIZE:
+                tasks.popitem(last=False)
     
     def get_system_status(self):
         """
         Get the current status of the entire system.
         
         Returns:
-            A dictionary containing system status information
+            A dictionary containing system status information, with a copy
+            of the state holding the TASK_HISTORY_SIZE most recent tasks
         """
+        with self._state_lock:
+            state = {key: dict(value) for key, value in self.state.items()}
+        
         return {
             "agents": list(self.agents.keys()),
-            "state": self.state,
+            "state": state,
             "tasks_completed": self.tasks_completed,
-            "tasks_by_status": self.tasks_by_status
+            "tasks_by_status": self._count_tasks_by_status()
         }
     
     def _count_tasks_by_status(self) -> Dict[str, int]:
         """Count tasks by their status."""
-        counts = {}
-        for task_id, task_info in self.state.get("tasks", {}).items():
-            status = task_info.get("status", "unknown")
-            counts[status] = counts.get(status, 0) + 1
-        return counts
+        with self._state_lock:
+            return dict(self.tasks_by_status)
     
     def generate_communication_report(self, time_period="day") -> Dict:
         """
@@ -253,7 +360,7 @@ class Atlas:
         # For now, return a placeholder
         return {
             "period": time_period,
-            "total_communications": len(self.state.get("tasks", {})),
+            "total_communications": sum(self._count_tasks_by_status().values()),
             "agents_involved": list(self.agents.keys()),
             "status": "Report generation not fully implemented yet"
         }
@@ -346,6 +453,23 @@ class Atlas:
                 "user_notified": True
             }
         
+    def process_receipt_workflows(self, receipts: List[Dict]) -> List[Dict]:
+        """Process several receipt workflows concurrently.
+        
+        The steps of one workflow depend on each other and run in order, but
+        separate receipts overlap their LLM, QuickBooks and dashboard waits.
+        
+        Args:
+            receipts: The receipt submission data, one per workflow
+            
+        Returns:
+            The workflow results, in the same order as the receipts
+        """
+        if len(receipts) <= 1:
+            return [self.process_receipt_workflow(receipt) for receipt in receipts]
+        
+        return list(_EXECUTOR.map(self.process_receipt_workflow, receipts))
+    
     def _review_bookkeeping_result(self, result: Dict) -> Dict:
         """Review the BookkeepingAgent's work.
         
@@ -425,8 +549,8 @@ class Atlas:
 
     def _generate_task_id(self) -> str:
         """Generate a unique task ID."""
-        import uuid
-        return str(uuid.uuid4())[:8]
+        # next() on a count is atomic, so no lock is needed across threads
+        return f"{_TASK_ID_PREFIX}{next(_TASK_COUNTER):08x}"
     
     def main():
         """Main function to demonstrate Atlas functionality."""
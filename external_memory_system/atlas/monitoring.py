@@ -6,6 +6,11 @@ import os
 import json
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class CommunicationMonitor:
     """
     Monitors and analyzes communications between Atlas and agents.
@@ -47,30 +52,13 @@ class CommunicationMonitor:
             with open(self.log_file, 'r') as f:
                 for line in f:
                     try:
-                        # Parse the log line
-                        # Example format: 2025-03-24 01:30:45,123 - Atlas - INFO - Sending task to bookkeeping agent
-                        parts = line.split(' - ', 3)
-                        if len(parts) < 4:
-                            continue
-                        
-                        timestamp_str = parts[0]
-                        component = parts[1]
-                        level = parts[2]
-                        message = parts[3].strip()
-                        
-                        # Parse the timestamp
-                        timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S,%f')
+                        entry = self.parse_line(line)
                         
-                        # Skip entries older than the cutoff
-                        if timestamp < cutoff_time:
+                        # Skip unparseable lines and entries older than the cutoff
+                        if entry is None or entry["timestamp"] < cutoff_time:
                             continue
                         
-                        log_entries.append({
-                            "timestamp": timestamp,
-                            "component": component,
-                            "level": level,
-                            "message": message
-                        })
+                        log_entries.append(entry)
                     except Exception as e:
                         self.logger.error(f"Error parsing log line: {e}")
                         continue
@@ -79,6 +67,31 @@ class CommunicationMonitor:
         
         return log_entries
     
+    def parse_line(self, line: str) -> Optional[Dict]:
+        """
+        Parse a single log line.
+        
+        Args:
+            line: The log line to parse
+            
+        Returns:
+            The parsed log entry, or None if the line is not a log entry
+            
+        Raises:
+            ValueError: If the timestamp cannot be parsed
+        """
+        # Example format: 2025-03-24 01:30:45,123 - Atlas - INFO - Sending task to bookkeeping agent
+        parts = line.split(' - ', 3)
+        if len(parts) < 4:
+            return None
+        
+        return {
+            "timestamp": datetime.strptime(parts[0], '%Y-%m-%d %H:%M:%S,%f'),
+            "component": parts[1],
+            "level": parts[2],
+            "message": parts[3].strip()
+        }
+    
     def generate_report(self, hours: int = 24) -> Dict:
         """
         Generate a report of communications for the specified time period.
@@ -210,10 +223,13 @@ class CommunicationMonitor:
         # Ensure directory exists
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
-        # Convert datetime objects to strings
-        report_json = json.dumps(report, default=str, indent=2)
+        # Convert datetime objects to strings; orjson encodes them natively
+        if orjson is not None:
+            report_json = orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2)
+        else:
+            report_json = json.dumps(report, default=str, indent=2).encode()
         
-        with open(filename, 'w') as f:
+        with open(filename, 'wb') as f:
             f.write(report_json)
         
         self.logger.info(f"Saved communication report to {filename}")
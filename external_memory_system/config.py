@@ -18,9 +18,23 @@ PINECONE_INDEX_NAME = os.getenv("PINECONE_INDEX_NAME")
 
 # Local LLM configuration
 OLLAMA_BASE_URL = "http://localhost:11434"
-DEFAULT_MODEL = "mistral:7b-instruct-q4_0"
+# Q4_K_M is about the size of q4_0 with better quality, and its k-quant
+# kernels decode faster on current llama.cpp builds; it needs `ollama pull`
+# of the q4_K_M tag
+DEFAULT_MODEL = "mistral:7b-instruct-q4_K_M"
 MODEL_TEMPERATURE = 0.7
 MODEL_MAX_TOKENS = 4096
+MODEL_KEEP_ALIVE = "30m"  # Keep the model (and its prompt cache) loaded between calls
+MODEL_MAX_PARALLEL = 4  # Concurrent requests per batch; match OLLAMA_NUM_PARALLEL
+
+# Number of tasks Atlas executes concurrently
+ATLAS_MAX_WORKERS = int(os.getenv("ATLAS_MAX_WORKERS", "8"))
+
+# Journal of CommunicationBus messages, off unless a path is set. The file
+# rotates past COMMUNICATION_JOURNAL_MAX_BYTES, keeping that many backups.
+COMMUNICATION_JOURNAL_PATH = os.getenv("COMMUNICATION_JOURNAL_PATH")
+COMMUNICATION_JOURNAL_MAX_BYTES = int(os.getenv("COMMUNICATION_JOURNAL_MAX_BYTES", str(10 * 1024 * 1024)))
+COMMUNICATION_JOURNAL_BACKUP_COUNT = int(os.getenv("COMMUNICATION_JOURNAL_BACKUP_COUNT", "5"))
 
 # Agent configuration
 AGENT_NAME = "AccountingAssistant"
@@ -86,81 +86,43 @@ def init_db():
 # Initialize database on startup
 init_db()
 
-# API Routes for agents to report activities
-@app.route('/api/agent/register', methods=['POST'])
-def register_agent():
+# Report handlers, shared by the single-report routes and the batch route.
+# Each applies one report to the database through the given cursor.
+def _register_agent(cursor, data, now):
     """Register a new agent or update existing agent."""
-    data = request.json
-    
-    if not data or not all(k in data for k in ['id', 'name', 'type']):
-        return jsonify({'error': 'Missing required fields'}), 400
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
     # Check if agent already exists
     cursor.execute("SELECT id FROM agents WHERE id = ?", (data['id'],))
     existing = cursor.fetchone()
     
-    now = datetime.now().isoformat()
-    
     if existing:
         # Update existing agent
         cursor.execute(
             "UPDATE agents SET name = ?, type = ?, status = ?, last_active = ? WHERE id = ?",
             (data['name'], data['type'], data.get('status', 'active'), now, data['id'])
         )
-        message = 'Agent updated'
+        return 'Agent updated'
     else:
         # Insert new agent
         cursor.execute(
             "INSERT INTO agents (id, name, type, status, last_active, created_at) VALUES (?, ?, ?, ?, ?, ?)",
             (data['id'], data['name'], data['type'], data.get('status', 'active'), now, now)
         )
-        message = 'Agent registered'
-    
-    conn.commit()
-    conn.close()
-    
-    return jsonify({'message': message, 'agent_id': data['id']}), 200
+        return 'Agent registered'
 
-@app.route('/api/task/create', methods=['POST'])
-def create_task():
+def _create_task(cursor, data, now):
     """Create a new task."""
-    data = request.json
-    
-    if not data or not all(k in data for k in ['id', 'agent_id', 'type']):
-        return jsonify({'error': 'Missing required fields'}), 400
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    now = datetime.now().isoformat()
-    
-    # Insert new task
+    # Insert new task; a task already created (Atlas and then the agent it
+    # routes to both report the same id) keeps its original row
     cursor.execute(
-        "INSERT INTO tasks (id, agent_id, type, status, description, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        "INSERT INTO tasks (id, agent_id, type, status, description, created_at) VALUES (?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT(id) DO NOTHING",
         (data['id'], data['agent_id'], data['type'], data.get('status', 'pending'), 
          data.get('description', ''), now)
     )
-    
-    conn.commit()
-    conn.close()
-    
-    return jsonify({'message': 'Task created', 'task_id': data['id']}), 200
+    return 'Task created'
 
-@app.route('/api/task/update', methods=['POST'])
-def update_task():
+def _update_task(cursor, data, now):
     """Update an existing task."""
-    data = request.json
-    
-    if not data or not all(k in data for k in ['id', 'status']):
-        return jsonify({'error': 'Missing required fields'}), 400
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    now = datetime.now().isoformat()
     completed_at = now if data['status'] in ['completed', 'error'] else None
     
     # Update task
@@ -174,25 +136,31 @@ def update_task():
         "UPDATE agents SET last_active = ? WHERE id = (SELECT agent_id FROM tasks WHERE id = ?)",
         (now, data['id'])
     )
+    return 'Task updated'
+
+def _report_task(cursor, data, now):
+    """Record a task together with its outcome."""
+    completed_at = now if data['status'] in ['completed', 'error'] else None
     
-    conn.commit()
-    conn.close()
+    # Insert task with its final status, or update it if it was already created
+    cursor.execute(
+        "INSERT INTO tasks (id, agent_id, type, status, description, created_at, completed_at, result) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT(id) DO UPDATE SET status = excluded.status, result = excluded.result, "
+        "completed_at = excluded.completed_at",
+        (data['id'], data['agent_id'], data['type'], data['status'],
+         data.get('description', ''), now, completed_at, data.get('result', ''))
+    )
     
-    return jsonify({'message': 'Task updated', 'task_id': data['id']}), 200
+    # Update agent last_active
+    cursor.execute(
+        "UPDATE agents SET last_active = ? WHERE id = ?",
+        (now, data['agent_id'])
+    )
+    return 'Task reported'
 
-@app.route('/api/log', methods=['POST'])
-def log_message():
+def _log_message(cursor, data, now):
     """Log a message from an agent."""
-    data = request.json
-    
-    if not data or not all(k in data for k in ['agent_id', 'level', 'message']):
-        return jsonify({'error': 'Missing required fields'}), 400
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    now = datetime.now().isoformat()
-    
     # Insert log
     cursor.execute(
         "INSERT INTO agent_logs (agent_id, level, message, timestamp) VALUES (?, ?, ?, ?)",
@@ -204,11 +172,139 @@ def log_message():
         "UPDATE agents SET last_active = ? WHERE id = ?",
         (now, data['agent_id'])
     )
+    return 'Log recorded'
+
+# Report route path -> (required fields, handler)
+REPORT_HANDLERS = {
+    '/api/agent/register': (('id', 'name', 'type'), _register_agent),
+    '/api/task/create': (('id', 'agent_id', 'type'), _create_task),
+    '/api/task/update': (('id', 'status'), _update_task),
+    '/api/task/report': (('id', 'agent_id', 'type', 'status'), _report_task),
+    '/api/log': (('agent_id', 'level', 'message'), _log_message)
+}
+
+def _apply_report(path, data):
+    """Apply a single report in its own transaction."""
+    required, handler = REPORT_HANDLERS[path]
+    
+    if not data or not all(k in data for k in required):
+        return None
+    
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    
+    message = handler(cursor, data, datetime.now().isoformat())
     
     conn.commit()
     conn.close()
     
-    return jsonify({'message': 'Log recorded'}), 200
+    return message
+
+# API Routes for agents to report activities
+@app.route('/api/agent/register', methods=['POST'])
+def register_agent():
+    """Register a new agent or update existing agent."""
+    data = request.json
+    message = _apply_report('/api/agent/register', data)
+    
+    if message is None:
+        return jsonify({'error': 'Missing required fields'}), 400
+    
+    return jsonify({'message': message, 'agent_id': data['id']}), 200
+
+@app.route('/api/task/create', methods=['POST'])
+def create_task():
+    """Create a new task."""
+    data = request.json
+    message = _apply_report('/api/task/create', data)
+    
+    if message is None:
+        return jsonify({'error': 'Missing required fields'}), 400
+    
+    return jsonify({'message': message, 'task_id': data['id']}), 200
+
+@app.route('/api/task/update', methods=['POST'])
+def update_task():
+    """Update an existing task."""
+    data = request.json
+    message = _apply_report('/api/task/update', data)
+    
+    if message is None:
+        return jsonify({'error': 'Missing required fields'}), 400
+    
+    return jsonify({'message': message, 'task_id': data['id']}), 200
+
+@app.route('/api/task/report', methods=['POST'])
+def report_task():
+    """Record a task together with its outcome."""
+    data = request.json
+    message = _apply_report('/api/task/report', data)
+    
+    if message is None:
+        return jsonify({'error': 'Missing required fields'}), 400
+    
+    return jsonify({'message': message, 'task_id': data['id']}), 200
+
+@app.route('/api/log', methods=['POST'])
+def log_message():
+    """Log a message from an agent."""
+    data = request.json
+    message = _apply_report('/api/log', data)
+    
+    if message is None:
+        return jsonify({'error': 'Missing required fields'}), 400
+    
+    return jsonify({'message': message}), 200
+
+@app.route('/api/batch', methods=['POST'])
+def batch_reports():
+    """Apply several reports, in order, in a single transaction.
+    
+    The body is {"events": [{"path": <report route>, "data": <its body>}, ...]}.
+    Events with an unknown path or missing fields are skipped and their
+    positions returned in "rejected". Each event is applied under its own
+    savepoint, so one that fails in the database is rolled back alone; its
+    position is returned in both "rejected" and "failed".
+    """
+    data = request.json
+    
+    if not data or not isinstance(data.get('events'), list):
+        return jsonify({'error': 'Missing required fields'}), 400
+    
+    # Transactions and savepoints are issued explicitly
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    cursor = conn.cursor()
+    
+    now = datetime.now().isoformat()
+    applied = 0
+    rejected = []
+    failed = []
+    
+    cursor.execute("BEGIN")
+    for i, event in enumerate(data['events']):
+        route = REPORT_HANDLERS.get(event.get('path')) if isinstance(event, dict) else None
+        payload = event.get('data') if route else None
+        
+        if not route or not payload or not all(k in payload for k in route[0]):
+            rejected.append(i)
+            continue
+        
+        cursor.execute("SAVEPOINT event")
+        try:
+            route[1](cursor, payload, now)
+        except sqlite3.Error as e:
+            cursor.execute("ROLLBACK TO event")
+            logger.error(f"Error applying batch event {i} ({event['path']}): {str(e)}")
+            rejected.append(i)
+            failed.append(i)
+        else:
+            applied += 1
+        cursor.execute("RELEASE event")
+    
+    cursor.execute("COMMIT")
+    conn.close()
+    
+    return jsonify({'message': 'Batch applied', 'applied': applied, 'rejected': rejected, 'failed': failed}), 200
 
 # Dashboard Routes
 @app.route('/')
@@ -1,22 +1,111 @@
 # external_memory_system/dashboard/client.py
 
+import abc
 import requests
+from requests.adapters import HTTPAdapter
+import atexit
 import logging
 import json
+import queue
+import threading
 from typing import Dict, Any, Optional
 import uuid
 
+# Payloads are encoded with orjson when it is installed
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        """Serialize an object to JSON bytes using orjson."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        """Serialize an object to JSON bytes using the standard library."""
+        return json.dumps(obj, default=str).encode()
+
+# One connection pool shared by every dashboard client in the process, so
+# agents reuse the same keep-alive connections instead of each opening their own
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
+def _task_report(task_id: str, agent_id: str, task_type: str, status: str,
+                 description: str = "", result: Optional[Dict] = None) -> Dict:
+    """Build the /api/task/report payload for a finished task."""
+    return {
+        "id": task_id,
+        "agent_id": agent_id,
+        "type": task_type,
+        "status": status,
+        "description": description,
+        "result": _dumps(result).decode() if result else ""
+    }
+
+def _coalesce_tasks(batch):
+    """Merge each task created and updated within a batch into one report.
+    
+    Args:
+        batch: List of (path, payload) reports in submission order
+        
+    Returns:
+        The batch with every /api/task/create followed by /api/task/update
+        for the same task replaced, at the create's position, by a single
+        /api/task/report carrying the latest status and result
+    """
+    merged = []
+    created = {}
+    for path, payload in batch:
+        if path == "/api/task/create":
+            created[payload["id"]] = len(merged)
+        elif path == "/api/task/update" and payload["id"] in created:
+            index = created[payload["id"]]
+            merged[index] = ("/api/task/report", {
+                **merged[index][1],
+                "status": payload["status"],
+                "result": payload.get("result", "")
+            })
+            continue
+        merged.append((path, payload))
+    return merged
+
+def _split_task_report(payload: Dict):
+    """Split a /api/task/report payload into the create and update reports older dashboards accept."""
+    return [
+        ("/api/task/create", {
+            "id": payload["id"],
+            "agent_id": payload["agent_id"],
+            "type": payload["type"],
+            "status": "pending",
+            "description": payload["description"]
+        }),
+        ("/api/task/update", {
+            "id": payload["id"],
+            "status": payload["status"],
+            "result": payload["result"]
+        })
+    ]
+
 class DashboardClient:
     """Client for agents to report activities to the dashboard."""
     
-    def __init__(self, dashboard_url: str = "http://localhost:5000") :
+    def __init__(self, dashboard_url: str = "http://localhost:5000", session: Optional[requests.Session] = None) :
         """Initialize the dashboard client.
         
         Args:
             dashboard_url: URL of the dashboard API
+            session: HTTP session to send requests with (defaults to the shared session)
         """
         self.dashboard_url = dashboard_url
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Reuse connections to the dashboard across calls and clients
+        self.session = session or _SESSION
+        self.headers = {"Content-Type": "application/json"}
+    
+    def _post(self, path: str, payload: Dict[str, Any]) -> requests.Response:
+        """POST a JSON payload to a dashboard API path."""
+        return self.session.post(f"{self.dashboard_url}{path}", data=_dumps(payload), headers=self.headers)
     
     def register_agent(self, agent_id: str, agent_name: str, agent_type: str) -> bool:
         """Register an agent with the dashboard.
@@ -30,9 +119,9 @@ class DashboardClient:
             True if registration was successful, False otherwise
         """
         try:
-            response = requests.post(
-                f"{self.dashboard_url}/api/agent/register",
-                json={
+            response = self._post(
+                "/api/agent/register",
+                {
                     "id": agent_id,
                     "name": agent_name,
                     "type": agent_type,
@@ -63,9 +152,9 @@ class DashboardClient:
             True if task creation was successful, False otherwise
         """
         try:
-            response = requests.post(
-                f"{self.dashboard_url}/api/task/create",
-                json={
+            response = self._post(
+                "/api/task/create",
+                {
                     "id": task_id,
                     "agent_id": agent_id,
                     "type": task_type,
@@ -96,12 +185,12 @@ class DashboardClient:
             True if update was successful, False otherwise
         """
         try:
-            response = requests.post(
-                f"{self.dashboard_url}/api/task/update",
-                json={
+            response = self._post(
+                "/api/task/update",
+                {
                     "id": task_id,
                     "status": status,
-                    "result": json.dumps(result) if result else ""
+                    "result": _dumps(result).decode() if result else ""
                 }
             )
             
@@ -115,6 +204,34 @@ class DashboardClient:
             self.logger.error(f"Error updating task: {str(e)}")
             return False
     
+    def report_task(self, task_id: str, agent_id: str, task_type: str, status: str,
+                    description: str = "", result: Optional[Dict] = None) -> bool:
+        """Record a task that has already finished, in place of create_task plus update_task.
+        
+        Args:
+            task_id: Unique identifier for the task
+            agent_id: ID of the agent that handled the task
+            task_type: Type of task (e.g., "journal_entry", "reconcile_transaction")
+            status: Final status (e.g., "completed", "error")
+            description: Optional description of the task
+            result: Optional result data
+            
+        Returns:
+            True if the report was successful, False otherwise
+        """
+        try:
+            response = self._post("/api/task/report", _task_report(task_id, agent_id, task_type, status, description, result))
+            
+            if response.status_code == 200:
+                self.logger.info(f"Task {task_id} reported successfully")
+                return True
+            else:
+                self.logger.error(f"Failed to report task: {response.text}")
+                return False
+        except Exception as e:
+            self.logger.error(f"Error reporting task: {str(e)}")
+            return False
+    
     def log_message(self, agent_id: str, level: str, message: str) -> bool:
         """Log a message to the dashboard.
         
@@ -127,9 +244,9 @@ class DashboardClient:
             True if logging was successful, False otherwise
         """
         try:
-            response = requests.post(
-                f"{self.dashboard_url}/api/log",
-                json={
+            response = self._post(
+                "/api/log",
+                {
                     "agent_id": agent_id,
                     "level": level,
                     "message": message
@@ -144,3 +261,287 @@ class DashboardClient:
         except Exception as e:
             self.logger.error(f"Error logging message: {str(e)}")
             return False
+
+
+
+class _QueuedDashboardClient(DashboardClient, abc.ABC):
+    """Dashboard client whose calls are queued and sent by a background thread.
+    
+    Subclasses queue items with _submit and send them in _send_batch. The
+    thread hands over up to batch_size items at a time, waiting up to
+    flush_interval for more before sending a partial batch.
+    """
+    
+    batch_size = 1
+    flush_interval = 0.0
+    
+    def __init__(self, dashboard_url: str, max_pending: int, session: Optional[requests.Session]) :
+        """Initialize the dashboard client and start its background thread.
+        
+        Args:
+            dashboard_url: URL of the dashboard API
+            max_pending: Maximum number of queued items before new ones are dropped
+            session: HTTP session to send requests with (defaults to the shared session)
+        """
+        super().__init__(dashboard_url, session)
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Send the items queued so far without waiting for a full batch.
+        
+        Args:
+            timeout: Seconds to wait for the items to be sent
+            
+        Returns:
+            True if the items were sent within the timeout, False otherwise
+        """
+        if not self._worker.is_alive():
+            return False
+        
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+    
+    def close(self, timeout: float = 5.0) -> None:
+        """Send the queued items and stop the background thread.
+        
+        Args:
+            timeout: Seconds to wait for the queue to drain
+        """
+        if not self._worker.is_alive():
+            return
+        
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            self.logger.warning("Dashboard queue still full at shutdown, dropping queued reports")
+            return
+        self._worker.join(timeout)
+    
+    def _submit(self, item) -> bool:
+        """Queue an item for the background thread.
+        
+        Returns:
+            True if the item was queued, False if the queue was full
+        """
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            self.logger.warning(f"Dashboard queue full, dropping {self._describe(item)}")
+            return False
+    
+    @abc.abstractmethod
+    def _describe(self, item) -> str:
+        """Describe a queued item for log messages."""
+    
+    @abc.abstractmethod
+    def _send_batch(self, batch) -> None:
+        """Send a batch of queued items to the dashboard."""
+    
+    def _run(self) -> None:
+        """Collect queued items into batches and send them until close() is called."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch = []
+            markers = []
+            
+            # Keep collecting until the batch is full, the interval passes,
+            # or a flush/close asks for it to go now
+            while True:
+                if item is None:
+                    stopping = True
+                    break
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                    break
+                
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    break
+            
+            if batch:
+                self._send_batch(batch)
+            for marker in markers:
+                marker.set()
+
+
+class BackgroundDashboardClient(_QueuedDashboardClient):
+    """Dashboard client that sends its reports from a background thread.
+    
+    Calls are queued and return immediately, so a slow or unreachable
+    dashboard never holds up the agent's task processing.
+    """
+    
+    def __init__(self, dashboard_url: str = "http://localhost:5000", max_pending: int = 1000,
+                 session: Optional[requests.Session] = None) :
+        """Initialize the dashboard client.
+        
+        Args:
+            dashboard_url: URL of the dashboard API
+            max_pending: Maximum number of queued calls before new ones are dropped
+            session: HTTP session to send requests with (defaults to the shared session)
+        """
+        super().__init__(dashboard_url, max_pending, session)
+    
+    def register_agent(self, agent_id: str, agent_name: str, agent_type: str) -> bool:
+        """Queue an agent registration (see DashboardClient.register_agent)."""
+        return self._submit((super().register_agent, (agent_id, agent_name, agent_type)))
+    
+    def create_task(self, task_id: str, agent_id: str, task_type: str, description: str = "") -> bool:
+        """Queue a task creation (see DashboardClient.create_task)."""
+        return self._submit((super().create_task, (task_id, agent_id, task_type, description)))
+    
+    def update_task(self, task_id: str, status: str, result: Optional[Dict] = None) -> bool:
+        """Queue a task update (see DashboardClient.update_task)."""
+        return self._submit((super().update_task, (task_id, status, result)))
+    
+    def report_task(self, task_id: str, agent_id: str, task_type: str, status: str,
+                    description: str = "", result: Optional[Dict] = None) -> bool:
+        """Queue a finished task report (see DashboardClient.report_task)."""
+        return self._submit((super().report_task, (task_id, agent_id, task_type, status, description, result)))
+    
+    def log_message(self, agent_id: str, level: str, message: str) -> bool:
+        """Queue a log message (see DashboardClient.log_message)."""
+        return self._submit((super().log_message, (agent_id, level, message)))
+    
+    def _describe(self, item) -> str:
+        """Describe a queued (method, args) call for log messages."""
+        return f"{item[0].__name__} call"
+    
+    def _send_batch(self, batch) -> None:
+        """Make each queued (method, args) call in turn."""
+        for method, args in batch:
+            method(*args)
+
+
+class BatchedDashboardClient(_QueuedDashboardClient):
+    """Dashboard client that sends its reports in batches.
+    
+    Calls are queued and return immediately; a background thread collects
+    them and sends each batch to the dashboard's /api/batch route in one
+    request. Against a dashboard without that route the reports are sent
+    one request each, as DashboardClient does.
+    
+    A task that is created and updated within the same batch is sent as a
+    single /api/task/report event, so short tasks cost one dashboard write.
+    """
+    
+    def __init__(self, dashboard_url: str = "http://localhost:5000", batch_size: int = 50,
+                 flush_interval: float = 0.25, max_pending: int = 1000,
+                 session: Optional[requests.Session] = None) :
+        """Initialize the dashboard client.
+        
+        Args:
+            dashboard_url: URL of the dashboard API
+            batch_size: Maximum number of reports sent in one request
+            flush_interval: Seconds to wait for more reports before sending a partial batch
+            max_pending: Maximum number of queued reports before new ones are dropped
+            session: HTTP session to send requests with (defaults to the shared session)
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._batch_supported = True
+        self._report_supported = True
+        super().__init__(dashboard_url, max_pending, session)
+    
+    def register_agent(self, agent_id: str, agent_name: str, agent_type: str) -> bool:
+        """Queue an agent registration (see DashboardClient.register_agent)."""
+        return self._submit(("/api/agent/register", {
+            "id": agent_id,
+            "name": agent_name,
+            "type": agent_type,
+            "status": "active"
+        }))
+    
+    def create_task(self, task_id: str, agent_id: str, task_type: str, description: str = "") -> bool:
+        """Queue a task creation (see DashboardClient.create_task)."""
+        return self._submit(("/api/task/create", {
+            "id": task_id,
+            "agent_id": agent_id,
+            "type": task_type,
+            "status": "pending",
+            "description": description
+        }))
+    
+    def update_task(self, task_id: str, status: str, result: Optional[Dict] = None) -> bool:
+        """Queue a task update (see DashboardClient.update_task)."""
+        return self._submit(("/api/task/update", {
+            "id": task_id,
+            "status": status,
+            "result": _dumps(result).decode() if result else ""
+        }))
+    
+    def report_task(self, task_id: str, agent_id: str, task_type: str, status: str,
+                    description: str = "", result: Optional[Dict] = None) -> bool:
+        """Queue a finished task report (see DashboardClient.report_task)."""
+        return self._submit(("/api/task/report", _task_report(task_id, agent_id, task_type, status, description, result)))
+    
+    def log_message(self, agent_id: str, level: str, message: str) -> bool:
+        """Queue a log message (see DashboardClient.log_message)."""
+        return self._submit(("/api/log", {
+            "agent_id": agent_id,
+            "level": level,
+            "message": message
+        }))
+    
+    def _describe(self, item) -> str:
+        """Describe a queued (path, payload) report for log messages."""
+        return f"report to {item[0]}"
+    
+    def _send_batch(self, batch) -> None:
+        """Send a batch of (path, payload) reports to the dashboard."""
+        if self._batch_supported:
+            events = _coalesce_tasks(batch) if self._report_supported else batch
+            try:
+                response = self._post("/api/batch", {
+                    "events": [{"path": path, "data": payload} for path, payload in events]
+                })
+                
+                if response.status_code == 200:
+                    # Dashboards that predate /api/task/report reject it as unknown (rather
+                    # than listing it as failed); resend those as create and update
+                    body = response.json()
+                    failed = set(body.get("failed", ()))
+                    retry = [events[i][1] for i in body.get("rejected", [])
+                             if i not in failed and events[i][0] == "/api/task/report"]
+                    if retry:
+                        self.logger.warning("Dashboard has no /api/task/report route, sending task creates and updates")
+                        self._report_supported = False
+                        self._send_batch([event for payload in retry for event in _split_task_report(payload)])
+                    return
+                if response.status_code == 404:
+                    self.logger.warning("Dashboard has no /api/batch route, sending reports individually")
+                    self._batch_supported = False
+                    self._report_supported = False
+                else:
+                    # Don't lose the whole batch to one bad report; send them one by one
+                    self.logger.error(f"Failed to send report batch, sending reports individually: {response.text}")
+            except Exception as e:
+                self.logger.error(f"Error sending report batch: {str(e)}")
+                return
+        
+        for path, payload in batch:
+            # Dashboards without /api/batch predate /api/task/report as well
+            if path == "/api/task/report" and not self._report_supported:
+                events = _split_task_report(payload)
+            else:
+                events = [(path, payload)]
+            for path, payload in events:
+                try:
+                    response = self._post(path, payload)
+                    if response.status_code != 200:
+                        self.logger.error(f"Failed to send report to {path}: {response.text}")
+                except Exception as e:
+                    self.logger.error(f"Error sending report to {path}: {str(e)}")
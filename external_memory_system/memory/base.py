@@ -2,6 +2,8 @@
 Base memory interfaces for the External Memory System.
 """
 
+import time
+import uuid
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -9,6 +11,9 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 class MemoryItem:
     """Base class for items stored in memory."""
     
+    # Many items are held at once, so they don't carry a per-instance __dict__
+    __slots__ = ("content", "metadata", "item_id", "source", "timestamp", "importance", "tags", "embedding")
+    
     def __init__(
         self,
         content: Any,
@@ -17,7 +22,8 @@ class MemoryItem:
         source: Optional[str] = None,
         timestamp: Optional[float] = None,
         importance: float = 0.5,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        embedding: Optional[List[float]] = None
     ):
         """
         Initialize a memory item.
@@ -30,10 +36,8 @@ class MemoryItem:
             timestamp: Creation time of the memory item
             importance: Importance score (0.0 to 1.0)
             tags: List of tags for categorization
+            embedding: Vector embedding of the content, if already computed
         """
-        import time
-        import uuid
-        
         self.content = content
         self.metadata = metadata or {}
         self.item_id = item_id or str(uuid.uuid4())
@@ -41,6 +45,7 @@ class MemoryItem:
         self.timestamp = timestamp or time.time()
         self.importance = max(0.0, min(1.0, importance))  # Clamp between 0 and 1
         self.tags = tags or []
+        self.embedding = embedding
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the memory item to a dictionary."""
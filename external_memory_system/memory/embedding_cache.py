@@ -0,0 +1,125 @@
+"""
+LRU cache of text embeddings shared across the process.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+
+class EmbeddingCache:
+    """Thread-safe LRU cache of embeddings keyed by the SHA-256 of the text.
+
+    Cached vectors are returned as stored, so callers must not modify them.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached embeddings
+            ttl_seconds: Seconds an embedding stays valid (None for no expiry)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Get the cache key for a text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, text: str) -> Optional[List[float]]:
+        """
+        Get the cached embedding of a text.
+
+        Args:
+            text: The embedded text
+
+        Returns:
+            The embedding, or None on a miss
+        """
+        key = self.key(text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, embedding = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return embedding
+
+    def put(self, text: str, embedding: List[float]):
+        """
+        Store the embedding of a text, evicting the least recently used beyond max_size.
+
+        Args:
+            text: The embedded text
+            embedding: Its embedding
+        """
+        key = self.key(text)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def embed_with_cache(
+        self,
+        texts: List[str],
+        embed_batch: Callable[[List[str]], Optional[List[List[float]]]]
+    ) -> Optional[List[List[float]]]:
+        """
+        Embed texts, calling embed_batch only for those not already cached.
+
+        All-zero vectors, which the model adapters return when a request
+        fails, are passed through but not cached.
+
+        Args:
+            texts: The texts to embed
+            embed_batch: Function embedding a list of texts in one request
+
+        Returns:
+            The embeddings, in the same order as the texts, or None if
+            embed_batch failed
+        """
+        embeddings = {}
+        missing = []
+        for text in texts:
+            if text in embeddings:
+                continue
+            cached = self.get(text)
+            if cached is None:
+                embeddings[text] = None
+                missing.append(text)
+            else:
+                embeddings[text] = cached
+
+        if missing:
+            fresh = embed_batch(missing)
+            if fresh is None:
+                return None
+
+            for text, embedding in zip(missing, fresh):
+                embeddings[text] = embedding
+                if any(embedding):
+                    self.put(text, embedding)
+
+        return [embeddings[text] for text in texts]
+
+    def clear(self):
+        """Remove all cached embeddings."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every store in the process
+embedding_cache = EmbeddingCache()
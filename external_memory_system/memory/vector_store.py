@@ -2,20 +2,39 @@
 
 import pinecone
 from typing import List, Dict, Any, Optional
+import heapq
+import math
+import os
 import uuid
 import json
 import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
 from ..config import PINECONE_API_KEY, PINECONE_ENVIRONMENT, PINECONE_INDEX_NAME
 from ..models.local_llm import LocalLLM
 
+# Rank in-memory similarity searches with a FAISS inner-product index when
+# faiss is installed and USE_VEC_INDEX is set
+USE_VEC_INDEX = os.getenv("USE_VEC_INDEX", "").lower() in ("1", "true", "yes")
+
 class PineconeVectorStore:
     """Interface for interacting with Pinecone vector database."""
     
-    def __init__(self, namespace: str = "accounting"):
+    def __init__(self, namespace: str = "accounting", default_filter: Optional[Dict[str, Any]] = None):
         """Initialize the Pinecone vector store.
         
         Args:
             namespace: Namespace to use in Pinecone
+            default_filter: Metadata filter applied to searches that don't pass
+                their own, e.g. {"agent": name} for a store owned by one agent
         """
         # Initialize Pinecone
         pinecone.init(
@@ -27,6 +46,9 @@ class PineconeVectorStore:
         self.index = pinecone.Index(PINECONE_INDEX_NAME)
         self.namespace = namespace
         
+        # Built once and shared by every search instead of per query
+        self.default_filter = dict(default_filter) if default_filter else None
+        
         # Initialize local LLM for embeddings
         self.llm = LocalLLM()
         
@@ -95,11 +117,14 @@ class PineconeVectorStore:
         Args:
             query: Query text to search for
             top_k: Number of results to return
-            filter: Optional metadata filter
+            filter: Optional metadata filter (defaults to default_filter)
             
         Returns:
             List of matching items with scores
         """
+        if filter is None:
+            filter = self.default_filter
+        
         # Generate embedding for query
         query_embedding = self.llm.embed(query)
         
@@ -206,6 +231,10 @@ class InMemoryVectorStore:
     def __init__(self):
         self.vectors = {}
         
+        # Normalized vectors stacked for ranking; rebuilt after changes
+        self._index = None
+        self._index_ids = []
+        
     def add_vectors(self, vectors, texts, metadatas=None):
         if metadatas is None:
             metadatas = [{} for _ in texts]
@@ -216,15 +245,87 @@ class InMemoryVectorStore:
                 "text": text,
                 "metadata": metadata
             }
+        self._index = None
         
         return [str(i) for i in range(len(vectors))]
     
+    def build_index(self):
+        """Stack the stored vectors, normalized, into the search index.
+        
+        Uses a FAISS IndexFlatIP when enabled, otherwise a float32 numpy
+        matrix, otherwise a list of normalized vectors. Zero vectors have no
+        direction to compare, so they are left out of the index.
+        """
+        ids = list(self.vectors)
+        vectors = [self.vectors[id]["vector"] for id in ids]
+        
+        if np is None:
+            normalized = [(id, _normalize(vector)) for id, vector in zip(ids, vectors)]
+            normalized = [(id, vector) for id, vector in normalized if any(vector)]
+            self._index_ids = [id for id, _ in normalized]
+            self._index = [vector for _, vector in normalized]
+            return
+        
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+        norms = np.linalg.norm(matrix, axis=1)
+        nonzero = norms > 0
+        self._index_ids = [ids[i] for i in np.flatnonzero(nonzero)]
+        matrix = np.ascontiguousarray(matrix[nonzero] / norms[nonzero, None])
+        
+        if USE_VEC_INDEX and faiss is not None:
+            self._index = faiss.IndexFlatIP(matrix.shape[1])
+            self._index.add(matrix)
+        else:
+            self._index = matrix
+    
     def similarity_search(self, query_vector, k=5):
-        # Simple implementation - in a real scenario you'd use cosine similarity
+        """Find the stored texts most similar to a query vector.
+        
+        Args:
+            query_vector: The query embedding
+            k: Number of results to return
+            
+        Returns:
+            Up to k (id, text, metadata) tuples, most similar first
+        """
+        if not self.vectors or k <= 0:
+            return []
+        
+        if self._index is None:
+            self.build_index()
+        k = min(k, len(self._index_ids))
+        if k == 0:
+            return []
+        
+        if np is None:
+            query = _normalize(query_vector)
+            scores = [sum(a * b for a, b in zip(query, vector)) for vector in self._index]
+            positions = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+        else:
+            query = np.asarray(query_vector, dtype=np.float32).reshape(1, -1)
+            norm = np.linalg.norm(query)
+            if norm:
+                query = query / norm
+            
+            if faiss is not None and isinstance(self._index, faiss.Index):
+                _, found = self._index.search(query, k)
+                positions = [int(p) for p in found[0] if p >= 0]
+            else:
+                scores = self._index @ query[0]
+                positions = np.argpartition(-scores, k - 1)[:k]
+                positions = positions[np.argsort(-scores[positions])].tolist()
+        
         results = []
-        for id, data in self.vectors.items():
+        for position in positions:
+            id = self._index_ids[position]
+            data = self.vectors[id]
             results.append((id, data["text"], data["metadata"]))
         
-        # Return up to k results
-        return results[:k]
+        return results
+
+
+def _normalize(vector):
+    """Scale a vector to unit length (zero vectors are returned unchanged)."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else list(vector)
 
@@ -128,6 +128,40 @@ class ChatGPTModel(BaseModel):
             # Return a zero vector as fallback
             return [0.0] * 1536
     
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for several texts in a single request.
+        
+        Args:
+            texts: The texts to embed
+            
+        Returns:
+            The embedding vectors, in the same order as the texts
+        """
+        if not self.session:
+            self.initialize()
+        
+        try:
+            response = self.session.post(
+                "https://api.openai.com/v1/embeddings",
+                json={
+                    "model": "text-embedding-3-large",
+                    "input": texts
+                },
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            result = response.json()
+            
+            # Results carry the index of the input they belong to
+            data = sorted(result["data"], key=lambda d: d["index"])
+            return [d["embedding"] for d in data]
+        
+        except Exception as e:
+            print(f"Error generating embeddings: {e}")
+            # Return zero vectors as fallback
+            return [[0.0] * 1536 for _ in texts]
+    
     def close(self) -> None:
         """Close the model connection and release resources."""
         if self.session:
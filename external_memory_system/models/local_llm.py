@@ -1,16 +1,41 @@
 """Integration with local LLM using Ollama."""
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import random
 import time
 import logging
-from typing import Dict, List, Any, Optional
-from external_memory_system.config import OLLAMA_BASE_URL, DEFAULT_MODEL, MODEL_TEMPERATURE, MODEL_MAX_TOKENS
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional
+from external_memory_system.config import (
+    OLLAMA_BASE_URL, DEFAULT_MODEL, MODEL_TEMPERATURE, MODEL_MAX_TOKENS, MODEL_KEEP_ALIVE, MODEL_MAX_PARALLEL
+)
+
+# Request and response bodies go through orjson when it is installed
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        """Serialize an object to JSON bytes using orjson."""
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        """Serialize an object to JSON bytes using the standard library."""
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
 
 class LocalLLM:
     """Integration with local LLM using Ollama."""
     
+    # Shared by all instances so calls reuse keep-alive connections to Ollama
+    _session = requests.Session()
+    _session.mount("http://", HTTPAdapter(pool_maxsize=16, pool_block=False))
+    _session.mount("https://", HTTPAdapter(pool_maxsize=16, pool_block=False))
+    
     def __init__(self, model_name: str = DEFAULT_MODEL):
         """Initialize the LLM.
         
@@ -21,26 +46,60 @@ class LocalLLM:
         self.api_url = f"{OLLAMA_BASE_URL}/api/generate"
         self.headers = {"Content-Type": "application/json"}
         self.logger = logging.getLogger(self.__class__.__name__)
+    
+    def preload(self) -> bool:
+        """Load the model into Ollama ahead of the first request.
+        
+        A request without a prompt makes Ollama load the model and return
+        without generating, so the first real call doesn't pay the load time.
         
-    def generate(self, prompt: str) -> str:
-        """Generate a response using the LLM."""
+        Returns:
+            True if the model was loaded, False otherwise
+        """
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.api_url,
-                json={
+                data=_dumps({
                     "model": self.model_name,
-                    "prompt": prompt,
-                    "temperature": MODEL_TEMPERATURE,
-                    "max_tokens": MODEL_MAX_TOKENS
-                },
+                    "keep_alive": MODEL_KEEP_ALIVE
+                }),
+                headers=self.headers
+            )
+            
+            if response.status_code == 200:
+                self.logger.info(f"Model {self.model_name} preloaded")
+                return True
+            else:
+                self.logger.warning(f"Failed to preload model {self.model_name}: {response.text}")
+                return False
+        except Exception as e:
+            self.logger.warning(f"Error preloading model {self.model_name}: {str(e)}")
+            return False
+        
+    def generate(self, prompt: str, format: Optional[str] = None) -> str:
+        """Generate a response using the LLM.
+        
+        Ollama reuses the evaluated tokens of the previous prompt up to the
+        first difference, so callers should put fixed instructions first and
+        per-request details last. keep_alive stops the model (and that cache)
+        from being unloaded between calls.
+        
+        Args:
+            prompt: The input prompt
+            format: Output format to enforce ("json"), or None for free text
+        """
+        try:
+            response = self._session.post(
+                self.api_url,
+                data=_dumps(self._payload(prompt, format, stream=False)),
                 headers=self.headers
             )
             
             try:
                 # Try to parse as regular JSON first
-                result = response.json()
+                result = _loads(response.content)
                 return result.get('response', prompt + " [No valid response]")
-            except requests.exceptions.JSONDecodeError as e:
+            except ValueError as e:
                 self.logger.warning(f"JSON decode error: {str(e)}")
                 # If JSON parsing fails, return the raw text
                 return response.text
@@ -48,6 +107,75 @@ class LocalLLM:
         except Exception as e:
             self.logger.error(f"Error generating response: {str(e)}")
             return f"Error: {str(e)}"
+    
+    def stream(self, prompt: str, format: Optional[str] = None) -> Iterator[str]:
+        """Generate a response using the LLM, yielding text as it is produced.
+        
+        Ollama streams one JSON object per line, each carrying the next piece
+        of the response, until an object with "done" set.
+        
+        Args:
+            prompt: The input prompt
+            format: Output format to enforce ("json"), or None for free text
+            
+        Yields:
+            Pieces of the response, in order
+        """
+        try:
+            with self._session.post(
+                self.api_url,
+                data=_dumps(self._payload(prompt, format, stream=True)),
+                headers=self.headers,
+                stream=True
+            ) as response:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    
+                    chunk = _loads(line)
+                    if "error" in chunk:
+                        self.logger.error(f"Error streaming response: {chunk['error']}")
+                        return
+                    
+                    if chunk.get("response"):
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        return
+        except Exception as e:
+            self.logger.error(f"Error streaming response: {str(e)}")
+    
+    def _payload(self, prompt: str, format: Optional[str], stream: bool) -> Dict[str, Any]:
+        """Build the /api/generate request body."""
+        payload = {
+            "model": self.model_name,
+            "prompt": prompt,
+            "stream": stream,
+            "temperature": MODEL_TEMPERATURE,
+            "max_tokens": MODEL_MAX_TOKENS,
+            "keep_alive": MODEL_KEEP_ALIVE
+        }
+        if format:
+            payload["format"] = format
+        return payload
+    
+    def generate_batch(self, prompts: List[str]) -> List[str]:
+        """Generate responses for several independent prompts.
+        
+        Ollama has no multi-prompt endpoint, but it schedules concurrent
+        requests into one batch (up to OLLAMA_NUM_PARALLEL), so the prompts
+        are sent in parallel rather than one after another.
+        
+        Args:
+            prompts: The prompts to send
+            
+        Returns:
+            The responses, in the same order as the prompts
+        """
+        if len(prompts) <= 1:
+            return [self.generate(prompt) for prompt in prompts]
+        
+        with ThreadPoolExecutor(max_workers=min(MODEL_MAX_PARALLEL, len(prompts))) as executor:
+            return list(executor.map(self.generate, prompts))
 
 
 class MockLLM:
@@ -63,11 +191,12 @@ class MockLLM:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info(f"Initialized MockLLM with model: {model_name}")
         
-    def generate(self, prompt: str) -> str:
+    def generate(self, prompt: str, format: Optional[str] = None) -> str:
         """Generate a mock response based on the prompt.
         
         Args:
             prompt: The input prompt
+            format: Output format to enforce ("json"), or None for free text
             
         Returns:
             A mock response
@@ -89,5 +218,37 @@ class MockLLM:
         else:
             response_text = f"I've processed your request regarding: {prompt[:50]}..."
             
-        self.logger.debug(f"MockLLM generated response for prompt: {prompt[:50]}...")
+        if format == "json":
+            response_text = json.dumps({"response": response_text})
+            
+        self.logger.debug("MockLLM generated response for prompt: %.50s...", prompt)
         return response_text
+    
+    def stream(self, prompt: str, format: Optional[str] = None) -> Iterator[str]:
+        """Generate a mock response, yielding it a word at a time.
+        
+        Args:
+            prompt: The input prompt
+            format: Output format to enforce ("json"), or None for free text
+            
+        Yields:
+            Pieces of the mock response, in order
+        """
+        words = self.generate(prompt, format).split(" ")
+        for i, word in enumerate(words):
+            yield word if i == len(words) - 1 else word + " "
+    
+    def generate_batch(self, prompts: List[str]) -> List[str]:
+        """Generate mock responses for several prompts concurrently.
+        
+        Args:
+            prompts: The input prompts
+            
+        Returns:
+            The mock responses, in the same order as the prompts
+        """
+        if len(prompts) <= 1:
+            return [self.generate(prompt) for prompt in prompts]
+        
+        with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+            return list(executor.map(self.generate, prompts))
@@ -5,7 +5,7 @@ Integration module for connecting local Ollama models with Pinecone vector stora
 import os
 import requests
 import json
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 
 class OllamaEmbedding:
     """Class for generating embeddings using local Ollama models."""
@@ -68,7 +68,7 @@ class LocalLLMClient:
     def __init__(
         self,
         base_url: str = "http://localhost:11434",
-        model: str = "mistral:7b-instruct-q4_0",
+        model: str = "mistral:7b-instruct-q4_K_M",
         temperature: float = 0.7,
         max_tokens: int = 2048
     ):
@@ -120,6 +120,46 @@ class LocalLLMClient:
         except Exception as e:
             print(f"Exception during text generation: {e}")
             return None
+    
+    def stream(self, prompt: str) -> Iterator[str]:
+        """
+        Generate text using the local LLM, yielding it as it is produced.
+        
+        Args:
+            prompt: Prompt for generation
+            
+        Yields:
+            Pieces of the generated text, in order
+        """
+        try:
+            payload = {
+                "model": self.model,
+                "prompt": prompt,
+                "stream": True,
+                "temperature": self.temperature,
+                "max_tokens": self.max_tokens
+            }
+            
+            with requests.post(
+                self.api_endpoint,
+                headers={"Content-Type": "application/json"},
+                data=json.dumps(payload),
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    print(f"Error generating text: {response.status_code} - {response.text}")
+                    return
+                
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("response"):
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        return
+        except Exception as e:
+            print(f"Exception during text generation: {e}")
 
 
 class PineconeOllamaIntegration:
@@ -179,13 +219,14 @@ class PineconeOllamaIntegration:
             print(f"Error adding to Pinecone: {e}")
             return None
     
-    def query_with_local_embedding(self, query: str, limit: int = 5) -> List[Tuple[Any, float]]:
+    def query_with_local_embedding(self, query: str, limit: int = 5, rerank: bool = False) -> List[Tuple[Any, float]]:
         """
         Query memory using embeddings from local model.
         
         Args:
             query: Query text
             limit: Maximum number of results
+            rerank: Rerank a wider candidate set and keep the best `limit`
             
         Returns:
             List of (item, score) tuples
@@ -197,17 +238,9 @@ class PineconeOllamaIntegration:
             print("Failed to generate embedding")
             return []
         
-        # Override the _get_embedding_for_query method temporarily
-        original_method = self.pinecone_store._get_embedding_for_query
-        self.pinecone_store._get_embedding_for_query = lambda _: embedding
-        
-        # Perform search
-        try:
-            results = self.pinecone_store.search(query, limit)
-            return results
-        finally:
-            # Restore original method
-            self.pinecone_store._get_embedding_for_query = original_method
+        # Search with the local embedding; these results bypass the store's
+        # search cache, which holds results for its own embeddings
+        return self.pinecone_store.search(query, limit, rerank=rerank, embedding=embedding)
     
     def generate_with_context(self, query: str, limit: int = 3) -> str:
         """
@@ -220,12 +253,40 @@ class PineconeOllamaIntegration:
         Returns:
             Generated response
         """
-        # Retrieve relevant context
-        context_items = self.query_with_local_embedding(query, limit)
+        response = self.llm_client.generate(self._context_prompt(query, limit))
+        return response or "No response generated."
+    
+    def stream_with_context(self, query: str, limit: int = 3) -> Iterator[str]:
+        """
+        Generate response with context from memory, yielding it as it is produced.
+        
+        Args:
+            query: Query text
+            limit: Maximum number of context items
+            
+        Yields:
+            Pieces of the generated response, in order
+        """
+        yield from self.llm_client.stream(self._context_prompt(query, limit))
+    
+    def _context_prompt(self, query: str, limit: int) -> str:
+        """
+        Build the generation prompt for a query from relevant memory.
+        
+        Args:
+            query: Query text
+            limit: Maximum number of context items
+            
+        Returns:
+            The prompt, or the query itself if no context was found
+        """
+        # Retrieve relevant context, reranking a wider candidate set so only
+        # the most relevant items go into the prompt
+        context_items = self.query_with_local_embedding(query, limit, rerank=True)
         
         if not context_items:
             # No context found, generate without context
-            return self.llm_client.generate(query) or "No response generated."
+            return query
         
         # Format context for prompt
         context_text = "\n\n".join([
@@ -243,6 +304,4 @@ Question: {query}
 
 Answer:"""
         
-        # Generate response
-        response = self.llm_client.generate(prompt)
-        return response or "No response generated."
+        return prompt
@@ -0,0 +1,25 @@
+"""
+Process-wide embedding model shared by the vector stores.
+"""
+
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def get_embedder():
+    """
+    Get the shared embedding model, creating it on first use.
+
+    Every vector store, whatever its namespace, embeds through this one
+    instance, so agents share its HTTP session instead of each opening
+    their own. A failed construction (e.g. no API key) is not cached, so
+    the next call tries again.
+
+    Returns:
+        The initialized embedding model
+    """
+    from external_memory_system.models.chatgpt import ChatGPTModel
+
+    model = ChatGPTModel()
+    model.initialize()
+    return model
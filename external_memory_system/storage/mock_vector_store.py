@@ -1,5 +1,6 @@
 # external_memory_system/storage/mock_vector_store.py
 
+import itertools
 from typing import List, Dict, Any, Optional
 from external_memory_system.storage.pinecone_store import PineconeVectorStore
 
@@ -23,13 +24,19 @@ class MockVectorStore(PineconeVectorStore):
         self.metadata = {}
         print(f"Initialized MockVectorStore with namespace: {namespace}")
     
-    def add_texts(self, texts: List[str], metadata: Optional[Dict[str, Any]] = None) -> List[str]:
+    def add_texts(
+        self,
+        texts: List[str],
+        metadata: Optional[Dict[str, Any]] = None,
+        metadatas: Optional[List[Dict[str, Any]]] = None
+    ) -> List[str]:
         """
         Add texts to the vector store.
         
         Args:
             texts: List of text strings to add
-            metadata: Optional metadata to associate with the texts
+            metadata: Optional metadata to associate with all of the texts
+            metadatas: Optional per-text metadata, overriding metadata
             
         Returns:
             List of IDs for the added texts
@@ -38,8 +45,9 @@ class MockVectorStore(PineconeVectorStore):
         for i, text in enumerate(texts):
             text_id = f"{self.namespace}_{len(self.vectors) + i}"
             self.vectors[text_id] = text
-            if metadata:
-                self.metadata[text_id] = metadata
+            text_metadata = metadatas[i] if metadatas else metadata
+            if text_metadata:
+                self.metadata[text_id] = text_metadata
             ids.append(text_id)
         
         print(f"Added {len(texts)} texts to MockVectorStore")
@@ -58,7 +66,7 @@ class MockVectorStore(PineconeVectorStore):
         """
         # For mock purposes, just return the first k items
         results = []
-        for text_id, text in list(self.vectors.items())[:k]:
+        for text_id, text in itertools.islice(self.vectors.items(), k):
             result = {
                 "id": text_id,
                 "text": text,
@@ -2,13 +2,95 @@
 Pinecone vector store implementation for the External Memory System.
 """
 
+import hashlib
+import itertools
+import logging
+import math
 import os
+import re
+import threading
 import time
 import uuid
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pinecone
 from external_memory_system.memory.base import BaseMemoryStore, MemoryItem, SemanticMemory
+from external_memory_system.memory.embedding_cache import embedding_cache
+from external_memory_system.storage.embedder_singleton import get_embedder
+
+logger = logging.getLogger(__name__)
+
+# Cross-encoder used to rerank search candidates when sentence-transformers
+# is installed; loaded on first use
+RERANK_MODEL = "BAAI/bge-reranker-base"
+_reranker = None
+
+
+class _QueryCache:
+    """Thread-safe LRU cache of query results with an optional TTL.
+
+    Entries are tagged with the store version they were computed at and
+    are treated as misses once the store has been written to since.
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached results
+            ttl_seconds: Seconds a result stays valid (None for no expiry)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Any, version: int) -> Optional[List]:
+        """
+        Get a cached result.
+
+        Args:
+            key: The cache key
+            version: The current store version
+
+        Returns:
+            A copy of the cached result, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            entry_version, stored_at, value = entry
+            if entry_version != version or (
+                    self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds):
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return list(value)
+
+    def put(self, key: Any, version: int, value: List):
+        """
+        Store a result, evicting the least recently used beyond max_size.
+
+        Args:
+            key: The cache key
+            version: The store version the result was computed at
+            value: The result to cache
+        """
+        with self._lock:
+            self._entries[key] = (version, time.monotonic(), list(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
 
 
 class PineconeVectorStore(SemanticMemory):
@@ -23,7 +105,10 @@ class PineconeVectorStore(SemanticMemory):
             dimension: int = 1536,
             metric: str = "cosine",
             api_key_env: str = "PINECONE_API_KEY",
-            environment_env: str = "PINECONE_ENVIRONMENT"
+            environment_env: str = "PINECONE_ENVIRONMENT",
+            max_cached_items: int = 10_000,
+            cache_bytes_budget: int = 256 * 1024 * 1024,
+            search_cache_ttl: float = 300.0
     ):
         """
         Initialize the Pinecone vector store.
@@ -37,6 +122,9 @@ class PineconeVectorStore(SemanticMemory):
             metric: Distance metric to use
             api_key_env: Name of environment variable containing API key
             environment_env: Name of environment variable containing environment
+            max_cached_items: Maximum number of items kept in the local cache
+            cache_bytes_budget: Approximate local cache size that triggers a warning
+            search_cache_ttl: Seconds a cached search result stays valid
         """
         super().__init__()
 
@@ -66,11 +154,23 @@ class PineconeVectorStore(SemanticMemory):
                 metric=self.metric
             )
 
-        # Connect to index
+        # Connect to index once; every operation reuses this handle
         self.index = pinecone.Index(self.index_name)
 
-        # Local cache for memory items
-        self.items = {}
+        # Local LRU cache for memory items; everything is still in Pinecone,
+        # so evicted items are simply fetched again when needed
+        self.items = OrderedDict()
+        self.max_cached_items = max_cached_items
+        self.cache_bytes_budget = cache_bytes_budget
+        self.items_bytes = 0
+        self._item_sizes = {}
+        self._over_budget = False
+
+        # Memoized search and get_related results, tagged with the
+        # items_version they were computed at so any write invalidates them
+        self.items_version = 0
+        self._search_cache = _QueryCache(ttl_seconds=search_cache_ttl)
+        self._related_cache = _QueryCache()
 
     def add(self, item: MemoryItem) -> str:
         """
@@ -105,7 +205,8 @@ class PineconeVectorStore(SemanticMemory):
         )
 
         # Store in local cache
-        self.items[item.item_id] = item
+        self._cache_item(item)
+        self.items_version += 1
 
         return item.item_id
 
@@ -121,6 +222,7 @@ class PineconeVectorStore(SemanticMemory):
         """
         # Check local cache first
         if item_id in self.items:
+            self.items.move_to_end(item_id)
             return self.items[item_id]
 
         # Query Pinecone
@@ -142,7 +244,7 @@ class PineconeVectorStore(SemanticMemory):
             )
 
             # Update local cache
-            self.items[item_id] = item
+            self._cache_item(item)
 
             return item
 
@@ -158,8 +260,8 @@ class PineconeVectorStore(SemanticMemory):
         Returns:
             True if the update was successful, False otherwise
         """
-        # Check if item exists
-        if not item.item_id or item.item_id not in self.items:
+        # Check if item exists (refetching it if it was evicted from the cache)
+        if not item.item_id or self.get(item.item_id) is None:
             return False
 
         # Get embedding for the content
@@ -181,7 +283,8 @@ class PineconeVectorStore(SemanticMemory):
         )
 
         # Update local cache
-        self.items[item.item_id] = item
+        self._cache_item(item)
+        self.items_version += 1
 
         return True
 
@@ -195,71 +298,168 @@ class PineconeVectorStore(SemanticMemory):
         Returns:
             True if the deletion was successful, False otherwise
         """
-        # Check if item exists
-        if item_id not in self.items:
+        # Check if item exists (refetching it if it was evicted from the cache)
+        if self.get(item_id) is None:
             return False
 
         # Delete from Pinecone
         self.index.delete(ids=[item_id], namespace=self.namespace)
 
         # Delete from local cache
-        del self.items[item_id]
+        self._uncache_item(item_id)
+        self.items_version += 1
 
         return True
 
-    def search(self, query: str, limit: int = 10) -> List[Tuple[MemoryItem, float]]:
+    def search(
+            self,
+            query: str,
+            limit: int = 10,
+            rerank: bool = False,
+            rerank_candidates: int = 4,
+            min_score: Optional[float] = None,
+            embedding: Optional[List[float]] = None
+    ) -> List[Tuple[MemoryItem, float]]:
         """
         Search for items in memory.
 
         Args:
             query: The search query
             limit: Maximum number of results
+            rerank: Fetch extra candidates and rerank them against the query
+            rerank_candidates: Candidates fetched per result when reranking
+            min_score: Drop reranked results scoring below this
+            embedding: Query embedding to search with instead of embedding
+                the query (see search_batch)
 
         Returns:
-            List of (item, score) tuples
+            List of (item, score) tuples; scores are rerank scores when reranking
         """
-        # Get embedding for query
-        # Note: This requires access to a model for embedding
-        # You'll need to modify this to use your embedding model
-        embedding = self._get_embedding_for_query(query)
+        embeddings = None if embedding is None else [embedding]
+        if not rerank:
+            return self.search_batch([query], limit, embeddings)[0]
 
-        if embedding is None:
+        candidates = self.search_batch([query], limit * rerank_candidates, embeddings)[0]
+        return self._rerank(query, candidates, limit, min_score)
+
+    def _rerank(
+            self,
+            query: str,
+            candidates: List[Tuple[MemoryItem, float]],
+            limit: int,
+            min_score: Optional[float] = None
+    ) -> List[Tuple[MemoryItem, float]]:
+        """
+        Rerank search candidates by their relevance to the query.
+
+        Uses the cross-encoder when sentence-transformers is installed,
+        otherwise BM25 over the candidates' content.
+
+        Args:
+            query: The search query
+            candidates: The (item, score) tuples to rerank
+            limit: Maximum number of results
+            min_score: Drop results scoring below this
+
+        Returns:
+            The best (item, rerank score) tuples, highest first
+        """
+        if not candidates:
             return []
 
-        # Query Pinecone
+        documents = [str(item.content) for item, _ in candidates]
+        reranker = _get_reranker()
+        if reranker is not None:
+            # Score all pairs in one batched forward pass
+            scores = [float(score) for score in reranker.predict([(query, doc) for doc in documents])]
+        else:
+            scores = _bm25_scores(query, documents)
+
+        reranked = sorted(
+            ((item, score) for (item, _), score in zip(candidates, scores)
+             if min_score is None or score >= min_score),
+            key=lambda pair: pair[1],
+            reverse=True
+        )
+        return reranked[:limit]
+
+    def search_batch(
+            self,
+            queries: List[str],
+            limit: int = 10,
+            embeddings: Optional[List[List[float]]] = None
+    ) -> List[List[Tuple[MemoryItem, float]]]:
+        """
+        Search for items matching each of several queries in one round-trip.
+
+        Args:
+            queries: The search queries
+            limit: Maximum number of results per query
+            embeddings: Embeddings to search with, one per query, instead of
+                embedding the queries with the store's embedder; results
+                for these are neither read from nor stored in the cache
+
+        Returns:
+            One list of (item, score) tuples per query, in the same order
+        """
+        if embeddings is not None:
+            return self._query_embeddings(embeddings, limit)
+
+        results_by_query = {}
+        pending = []
+
+        # Repeated queries skip both the embedding call and Pinecone
+        for query in queries:
+            cache_key = (self.namespace, limit, hashlib.sha1(query.encode()).hexdigest())
+            cached = self._search_cache.get(cache_key, self.items_version)
+            if cached is not None:
+                results_by_query[query] = cached
+            elif query not in pending:
+                pending.append(query)
+
+        if pending:
+            # Get embeddings for all uncached queries in one call
+            # Note: This requires access to a model for embedding
+            # You'll need to modify this to use your embedding model
+            embeddings = self._get_embeddings_for_queries(pending)
+
+            if embeddings is None:
+                for query in pending:
+                    results_by_query[query] = []
+            else:
+                for query, items in zip(pending, self._query_embeddings(embeddings, limit)):
+                    cache_key = (self.namespace, limit, hashlib.sha1(query.encode()).hexdigest())
+                    self._search_cache.put(cache_key, self.items_version, items)
+                    results_by_query[query] = items
+
+        return [list(results_by_query[query]) for query in queries]
+
+    def _query_embeddings(self, embeddings: List[List[float]], limit: int) -> List[List[Tuple[MemoryItem, float]]]:
+        """
+        Query Pinecone once for several embeddings.
+
+        Args:
+            embeddings: The query embeddings
+            limit: Maximum number of results per embedding
+
+        Returns:
+            One list of (item, score) tuples per embedding, in the same order
+        """
+        # Match values are not needed to build the results, so leave them
+        # out of the response
         results = self.index.query(
-            vector=embedding,
+            queries=embeddings,
             top_k=limit,
             namespace=self.namespace,
             include_metadata=True,
-            include_values=True
+            include_values=False
         )
 
         # Convert results to memory items
-        items = []
-        for match in results.matches:
-            item_id = match.id
-            score = match.score
-
-            # Get or create memory item
-            if item_id in self.items:
-                item = self.items[item_id]
-            else:
-                item = MemoryItem(
-                    content=match.metadata.get("content", ""),
-                    metadata={
-                        "source": match.metadata.get("source", "unknown"),
-                        "importance": float(match.metadata.get("importance", 0.5))
-                    },
-                    item_id=item_id,
-                    timestamp=float(match.metadata.get("timestamp", time.time())),
-                    embedding=match.values
-                )
-                self.items[item_id] = item
-
-            items.append((item, score))
-
-        return items
+        return [
+            [(self._item_from_match(match), match.score) for match in result.matches]
+            for result in results.results
+        ]
 
     def semantic_search(self, query: str, limit: int = 10) -> List[Tuple[MemoryItem, float]]:
         """
@@ -284,20 +484,25 @@ class PineconeVectorStore(SemanticMemory):
         Returns:
             The embedding vector
         """
-        try:
-            from external_memory_system.models import ChatGPTModel
+        embeddings = self._get_embeddings_for_queries([query])
+        return embeddings[0] if embeddings else None
 
-            # Create model instance
-            model = ChatGPTModel()
-            model.initialize()
+    def _get_embeddings_for_queries(self, queries: List[str]) -> Optional[List[List[float]]]:
+        """
+        Get embeddings for several queries in a single request.
 
-            # Get embedding
-            embedding = model.embed(query)
+        Queries embedded before are served from the process-wide embedding
+        cache; only the rest are sent to the model.
 
-            # Close model
-            model.close()
+        Args:
+            queries: The query texts
 
-            return embedding
+        Returns:
+            The embedding vectors, in the same order as the queries
+        """
+        try:
+            # Get embeddings from the model shared by all stores
+            return embedding_cache.embed_with_cache(queries, lambda texts: get_embedder().embed_batch(texts))
 
         except Exception as e:
             print(f"Error generating embedding: {e}")
@@ -308,127 +513,286 @@ class PineconeVectorStore(SemanticMemory):
         # Pinecone client doesn't require explicit closing
         pass
 
+    def clear(self) -> bool:
+        """
+        Clear all items from memory.
 
-def clear(self) -> bool:
-    """
-    Clear all items from memory.
+        Returns:
+            True if the operation was successful, False otherwise
+        """
+        try:
+            # Delete all vectors in the namespace
+            self.index.delete(delete_all=True, namespace=self.namespace)
 
-    Returns:
-        True if the operation was successful, False otherwise
-    """
-    try:
-        # Delete all vectors in the namespace
-        self.index.delete(delete_all=True, namespace=self.namespace)
+            # Clear local cache
+            self.items.clear()
+            self._item_sizes.clear()
+            self.items_bytes = 0
+            self._over_budget = False
+            self.items_version += 1
 
-        # Clear local cache
-        self.items = {}
+            return True
 
-        return True
+        except Exception as e:
+            print(f"Error clearing Pinecone store: {e}")
+            return False
 
-    except Exception as e:
-        print(f"Error clearing Pinecone store: {e}")
-        return False
+    def get_related(self, item_id: str, limit: int = 10) -> List[Tuple[MemoryItem, float]]:
+        """
+        Get items related to a specific item.
 
+        Args:
+            item_id: The ID of the reference item
+            limit: Maximum number of results
 
-def get_related(self, item_id: str, limit: int = 10) -> List[Tuple[MemoryItem, float]]:
-    """
-    Get items related to a specific item.
+        Returns:
+            List of (item, score) tuples
+        """
+        return self.get_related_batch([item_id], limit)[item_id]
 
-    Args:
-        item_id: The ID of the reference item
-        limit: Maximum number of results
+    def get_related_batch(self, item_ids: List[str], limit: int = 10) -> Dict[str, List[Tuple[MemoryItem, float]]]:
+        """
+        Get items related to each of several items in one round-trip.
 
-    Returns:
-        List of (item, score) tuples
-    """
-    # Get the item
-    item = self.get(item_id)
-
-    if not item or not item.embedding:
-        return []
-
-    # Query Pinecone using the item's embedding
-    results = self.index.query(
-        vector=item.embedding,
-        top_k=limit + 1,  # Add 1 to account for the item itself
-        namespace=self.namespace,
-        include_metadata=True,
-        include_values=True
-    )
-
-    # Convert results to memory items, excluding the query item itself
-    items = []
-    for match in results.matches:
-        if match.id != item_id:  # Skip the query item
-            match_item_id = match.id
-            score = match.score
-
-            # Get or create memory item
-            if match_item_id in self.items:
-                match_item = self.items[match_item_id]
+        Args:
+            item_ids: The IDs of the reference items
+            limit: Maximum number of results per item
+
+        Returns:
+            Dictionary mapping each reference ID to its list of (item, score) tuples
+        """
+        related = {}
+        pending = []
+
+        # Reuse previous results while nothing has been written since; each
+        # repeated ID is looked up once
+        for item_id in dict.fromkeys(item_ids):
+            cached = self._related_cache.get((item_id, limit), self.items_version)
+            if cached is not None:
+                related[item_id] = cached
             else:
-                match_item = MemoryItem(
-                    content=match.metadata.get("content", ""),
-                    metadata={
-                        "source": match.metadata.get("source", "unknown"),
-                        "importance": float(match.metadata.get("importance", 0.5))
-                    },
-                    item_id=match_item_id,
-                    timestamp=float(match.metadata.get("timestamp", time.time())),
-                    embedding=match.values
-                )
-                self.items[match_item_id] = match_item
+                pending.append(item_id)
 
-            items.append((match_item, score))
+        if not pending:
+            return related
 
-    return items
+        # Look up the reference embeddings, fetching any we don't hold locally
+        embeddings = self._get_embeddings(pending)
+        query_ids = [item_id for item_id in pending if embeddings.get(item_id)]
+        for item_id in pending:
+            if not embeddings.get(item_id):
+                related[item_id] = []
 
+        if not query_ids:
+            return {item_id: related[item_id] for item_id in item_ids}
 
-def list(self, limit: int = 100) -> List[MemoryItem]:
-    """
-    List all items in memory.
+        # Query Pinecone once for all reference embeddings; match values are
+        # not needed to build the results, so leave them out of the response
+        results = self.index.query(
+            queries=[embeddings[item_id] for item_id in query_ids],
+            top_k=limit + 1,  # Add 1 to account for the item itself
+            namespace=self.namespace,
+            include_metadata=True,
+            include_values=False
+        )
 
-    Args:
-        limit: Maximum number of items to return
+        for item_id, result in zip(query_ids, results.results):
+            # Convert results to memory items, excluding the query item itself
+            items = [
+                (self._item_from_match(match), match.score)
+                for match in result.matches
+                if match.id != item_id
+            ][:limit]
 
-    Returns:
-        List of memory items
-    """
-    # This is a bit tricky with Pinecone as it doesn't have a direct "list all" operation
-    # We'll use the local cache for this, which might not be complete
+            self._related_cache.put((item_id, limit), self.items_version, items)
+            related[item_id] = items
 
-    # If local cache is empty or has fewer items than limit, try to fetch some items
-    if len(self.items) < limit:
-        try:
-            # Create a dummy query that should match many items
-            # This is not ideal but a workaround for Pinecone's lack of "list all" functionality
-            results = self.index.query(
-                vector=[0.0] * self.dimension,  # Zero vector
-                top_k=limit,
-                namespace=self.namespace,
-                include_metadata=True,
-                include_values=True
-            )
+        return {item_id: related[item_id] for item_id in item_ids}
+
+    def _get_embeddings(self, item_ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Get the embeddings for several items, fetching missing ones in one call.
+
+        Args:
+            item_ids: The IDs of the items
+
+        Returns:
+            Dictionary mapping item IDs to embeddings; unknown IDs are omitted
+        """
+        embeddings = {}
+        missing = []
+
+        for item_id in item_ids:
+            item = self.items.get(item_id)
+            if item is not None and item.embedding:
+                embeddings[item_id] = item.embedding
+            else:
+                missing.append(item_id)
+
+        if missing:
+            result = self.index.fetch(ids=missing, namespace=self.namespace)
+
+            for item_id, vector in result.vectors.items():
+                item = self.items.get(item_id)
+                if item is None:
+                    item = self._item_from_match(vector)
+                # Items built from value-less query matches gain their embedding here
+                item.embedding = vector.values
+                self._cache_item(item)
+                embeddings[item_id] = vector.values
+
+        return embeddings
+
+    def _item_from_match(self, match) -> MemoryItem:
+        """
+        Get the cached memory item for a Pinecone match, creating it if needed.
+
+        Args:
+            match: A Pinecone query match or fetched vector
+
+        Returns:
+            The memory item
+        """
+        if match.id in self.items:
+            self.items.move_to_end(match.id)
+            return self.items[match.id]
+
+        item = MemoryItem(
+            content=match.metadata.get("content", ""),
+            metadata={
+                "source": match.metadata.get("source", "unknown"),
+                "importance": float(match.metadata.get("importance", 0.5))
+            },
+            item_id=match.id,
+            timestamp=float(match.metadata.get("timestamp", time.time())),
+            embedding=getattr(match, "values", None) or None
+        )
+        self._cache_item(item)
+
+        return item
+
+    def _cache_item(self, item: MemoryItem):
+        """
+        Store an item in the local cache as most recently used, evicting the
+        least recently used items beyond max_cached_items.
+
+        Args:
+            item: The memory item to cache
+        """
+        self._uncache_item(item.item_id)
+
+        size = len(str(item.content)) + 8 * len(getattr(item, "embedding", None) or ())
+        self.items[item.item_id] = item
+        self._item_sizes[item.item_id] = size
+        self.items_bytes += size
+
+        while len(self.items) > self.max_cached_items:
+            self._uncache_item(next(iter(self.items)))
+
+        if self.items_bytes > self.cache_bytes_budget:
+            if not self._over_budget:
+                logger.warning(
+                    f"Pinecone item cache is ~{self.items_bytes / 1024 / 1024:.1f} MB "
+                    f"({len(self.items)} items), over its {self.cache_bytes_budget / 1024 / 1024:.1f} MB budget")
+                self._over_budget = True
+        else:
+            self._over_budget = False
+
+    def _uncache_item(self, item_id: str):
+        """
+        Remove an item from the local cache if present.
+
+        Args:
+            item_id: The ID of the item to remove
+        """
+        if self.items.pop(item_id, None) is not None:
+            self.items_bytes -= self._item_sizes.pop(item_id)
+
+    def list(self, limit: int = 100) -> List[MemoryItem]:
+        """
+        List all items in memory.
+
+        Args:
+            limit: Maximum number of items to return
+
+        Returns:
+            List of memory items
+        """
+        # This is a bit tricky with Pinecone as it doesn't have a direct "list all" operation
+        # We'll use the local cache for this, which might not be complete
+
+        # If local cache is empty or has fewer items than limit, try to fetch some items
+        if len(self.items) < limit:
+            try:
+                # Create a dummy query that should match many items
+                # This is not ideal but a workaround for Pinecone's lack of "list all" functionality
+                results = self.index.query(
+                    vector=[0.0] * self.dimension,  # Zero vector
+                    top_k=limit,
+                    namespace=self.namespace,
+                    include_metadata=True,
+                    include_values=True
+                )
+
+                # Add results to local cache
+                for match in results.matches:
+                    self._item_from_match(match)
+
+            except Exception as e:
+                print(f"Error listing items from Pinecone: {e}")
+
+        # Return items from local cache, limited to the requested number
+        return list(itertools.islice(self.items.values(), limit))
 
-            # Add results to local cache
-            for match in results.matches:
-                item_id = match.id
-
-                if item_id not in self.items:
-                    item = MemoryItem(
-                        content=match.metadata.get("content", ""),
-                        metadata={
-                            "source": match.metadata.get("source", "unknown"),
-                            "importance": float(match.metadata.get("importance", 0.5))
-                        },
-                        item_id=item_id,
-                        timestamp=float(match.metadata.get("timestamp", time.time())),
-                        embedding=match.values
-                    )
-                    self.items[item_id] = item
 
+def _get_reranker():
+    """Load the cross-encoder reranker, or return None if it isn't available."""
+    global _reranker
+
+    if _reranker is None:
+        try:
+            from sentence_transformers import CrossEncoder
+            _reranker = CrossEncoder(RERANK_MODEL)
+        except ImportError:
+            _reranker = False
         except Exception as e:
-            print(f"Error listing items from Pinecone: {e}")
+            logger.warning(f"Could not load reranker {RERANK_MODEL}: {e}")
+            _reranker = False
+
+    return _reranker or None
+
+
+def _bm25_scores(query: str, documents: List[str], k1: float = 1.5, b: float = 0.75) -> List[float]:
+    """
+    Score documents against a query with BM25, using the documents as the corpus.
+
+    Args:
+        query: The query text
+        documents: The documents to score
+        k1: Term frequency saturation
+        b: Length normalization
 
-    # Return items from local cache, limited to the requested number
-    return list(self.items.values())[:limit]
+    Returns:
+        One score per document
+    """
+    tokenized = [re.findall(r"\w+", doc.lower()) for doc in documents]
+    query_terms = set(re.findall(r"\w+", query.lower()))
+    avg_length = sum(len(tokens) for tokens in tokenized) / len(tokenized) or 1.0
+
+    document_frequency = {
+        term: sum(1 for tokens in tokenized if term in tokens)
+        for term in query_terms
+    }
+
+    scores = []
+    for tokens in tokenized:
+        score = 0.0
+        for term in query_terms:
+            frequency = tokens.count(term)
+            if not frequency:
+                continue
+            idf = math.log(1 + (len(tokenized) - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+            score += idf * frequency * (k1 + 1) / (frequency + k1 * (1 - b + b * len(tokens) / avg_length))
+        scores.append(score)
+
+    return scores
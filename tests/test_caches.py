@@ -0,0 +1,103 @@
+"""Test the embedding cache and the Pinecone query result cache."""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add the src directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from external_memory_system.memory import embedding_cache as embedding_cache_module
+from external_memory_system.memory.embedding_cache import EmbeddingCache
+
+class Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+def test_embedding_cache_evicts_least_recently_used():
+    cache = EmbeddingCache(max_size=2)
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    assert cache.get("a") == [1.0]
+    
+    cache.put("c", [3.0])
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == [1.0]
+    assert cache.get("c") == [3.0]
+
+def test_embedding_cache_expires_entries(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(embedding_cache_module, "time", SimpleNamespace(monotonic=clock))
+    cache = EmbeddingCache(ttl_seconds=10)
+    cache.put("a", [1.0])
+    
+    clock.now += 5
+    assert cache.get("a") == [1.0]
+    clock.now += 10
+    assert cache.get("a") is None
+
+def test_embed_with_cache_embeds_each_missing_text_once():
+    cache = EmbeddingCache()
+    cache.put("cached", [9.0])
+    calls = []
+    
+    def embed_batch(texts):
+        calls.append(list(texts))
+        return [[float(len(text))] if text != "failed" else [0.0] for text in texts]
+    
+    result = cache.embed_with_cache(["new", "cached", "new", "failed"], embed_batch)
+    
+    assert result == [[3.0], [9.0], [3.0], [0.0]]
+    assert calls == [["new", "failed"]]
+    
+    # Embeddings of failed requests (all zeros) are not cached
+    assert cache.get("new") == [3.0]
+    assert cache.get("failed") is None
+
+def test_embed_with_cache_returns_none_when_embedding_fails():
+    cache = EmbeddingCache()
+    
+    assert cache.embed_with_cache(["a"], lambda texts: None) is None
+    assert cache.get("a") is None
+
+def test_query_cache_is_invalidated_by_writes_and_returns_copies():
+    pytest.importorskip("pinecone")
+    from external_memory_system.storage.pinecone_store import _QueryCache
+    
+    cache = _QueryCache(max_size=2)
+    cache.put("q", 1, ["x"])
+    
+    result = cache.get("q", 1)
+    result.append("y")
+    assert cache.get("q", 1) == ["x"]
+    
+    # A newer store version makes the entry a miss and drops it
+    assert cache.get("q", 2) is None
+    assert cache.get("q", 1) is None
+
+def test_query_cache_evicts_and_expires(monkeypatch):
+    pytest.importorskip("pinecone")
+    from external_memory_system.storage import pinecone_store
+    
+    clock = Clock()
+    monkeypatch.setattr(pinecone_store, "time", SimpleNamespace(monotonic=clock))
+    cache = pinecone_store._QueryCache(max_size=2, ttl_seconds=10)
+    cache.put("a", 1, [1])
+    cache.put("b", 1, [2])
+    assert cache.get("a", 1) == [1]
+    cache.put("c", 1, [3])
+    
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) == [1]
+    
+    clock.now += 11
+    assert cache.get("a", 1) is None
+    assert cache.get("c", 1) is None
@@ -0,0 +1,161 @@
+"""Test the CommunicationBus message store, indexes and journal."""
+
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+import pytest
+
+# Add the src directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from external_memory_system.atlas.communication import CommunicationBus, Message, TIME_BUCKET_SECONDS
+
+SENDERS = ["atlas", "bookkeeping", "reconciliation"]
+TYPES = ["task", "result", "error"]
+
+def _send_random(bus, rng, count, start=1_000_000.0):
+    """Send count messages with roughly increasing, sometimes out-of-order timestamps."""
+    sent = []
+    timestamp = start
+    for i in range(count):
+        timestamp += rng.choice([1, 30, 900, TIME_BUCKET_SECONDS, -20])
+        message = Message(rng.choice(SENDERS), rng.choice(SENDERS), {"i": i}, rng.choice(TYPES))
+        message.timestamp = timestamp
+        bus.send_message(message)
+        sent.append(message)
+    return sent
+
+def _expected_report(messages, start_time, end_time):
+    """Count messages in a period the way generate_report does."""
+    selected = [m for m in messages if start_time <= m.timestamp <= end_time]
+    return (
+        len(selected),
+        dict(Counter(m.message_type for m in selected)),
+        {f"{s} -> {r}": n for (s, r), n in Counter((m.sender, m.receiver) for m in selected).items()}
+    )
+
+def _report_tuple(report):
+    return report["total_messages"], report["message_types"], report["communication_pairs"]
+
+@pytest.mark.parametrize("max_messages", [0, 1, 7, 100])
+def test_get_messages_matches_filter_over_window(max_messages):
+    """Column store, time buckets and pair index agree with a plain filter of the window."""
+    rng = random.Random(max_messages)
+    bus = CommunicationBus(max_messages=max_messages, journal_path=None)
+    try:
+        sent = _send_random(bus, rng, 500)
+        window = sent[len(sent) - max_messages:] if max_messages else []
+        last = sent[-1].timestamp
+        
+        for _ in range(200):
+            criteria = {
+                "sender": rng.choice([None, *SENDERS]),
+                "receiver": rng.choice([None, *SENDERS]),
+                "message_type": rng.choice([None, *TYPES]),
+                "start_time": rng.choice([None, last - 5 * TIME_BUCKET_SECONDS, last - 100]),
+                "end_time": rng.choice([None, last - TIME_BUCKET_SECONDS, last])
+            }
+            expected = [
+                m.message_id for m in window
+                if (not criteria["sender"] or m.sender == criteria["sender"])
+                and (not criteria["receiver"] or m.receiver == criteria["receiver"])
+                and (not criteria["message_type"] or m.message_type == criteria["message_type"])
+                and (not criteria["start_time"] or m.timestamp >= criteria["start_time"])
+                and (not criteria["end_time"] or m.timestamp <= criteria["end_time"])
+            ]
+            assert [m["id"] for m in bus.get_messages(**criteria)] == expected, criteria
+    finally:
+        bus.close()
+
+@pytest.mark.parametrize("max_messages", [1, 7, 100, 10_000])
+def test_report_counts_match_window(max_messages):
+    """Per-bucket running counts match a brute-force count of the window."""
+    rng = random.Random(max_messages)
+    bus = CommunicationBus(max_messages=max_messages, journal_path=None)
+    try:
+        sent = []
+        for _ in range(20):
+            sent += _send_random(bus, rng, 50, start=sent[-1].timestamp if sent else 1_000_000.0)
+            window = sent[-max_messages:]
+            last = sent[-1].timestamp
+            start_time = rng.choice([window[0].timestamp, last - 5 * TIME_BUCKET_SECONDS, last - 100])
+            end_time = rng.choice([last, last - 500])
+            if start_time <= bus._evicted_until:
+                continue
+            report = bus.generate_report(start_time, end_time)
+            assert _report_tuple(report) == _expected_report(window, start_time, end_time)
+    finally:
+        bus.close()
+
+@pytest.mark.parametrize("max_bytes,backup_count", [(0, 0), (4000, 1000)])
+def test_report_counts_from_journal(tmp_path, max_bytes, backup_count):
+    """Reports reaching past the window are counted from the (rotated) journal."""
+    rng = random.Random(max_bytes)
+    path = str(tmp_path / "communications.jsonl")
+    bus = CommunicationBus(max_messages=3, journal_path=path,
+                           journal_max_bytes=max_bytes, journal_backup_count=backup_count)
+    try:
+        sent = []
+        for _ in range(20):
+            sent += _send_random(bus, rng, 100, start=sent[-1].timestamp if sent else 1_000_000.0)
+            last = sent[-1].timestamp
+            start_time = rng.choice([0.5, last - 20_000, last - 5 * TIME_BUCKET_SECONDS, last - 100])
+            end_time = rng.choice([last, last - 500])
+            report = bus.generate_report(start_time, end_time)
+            assert _report_tuple(report) == _expected_report(sent, start_time, end_time)
+    finally:
+        bus.close()
+    
+    if max_bytes:
+        assert os.path.exists(f"{path}.1")
+
+def test_journal_rotation_keeps_backup_count(tmp_path):
+    path = str(tmp_path / "communications.jsonl")
+    bus = CommunicationBus(max_messages=3, journal_path=path, journal_max_bytes=2000, journal_backup_count=2)
+    try:
+        sent = _send_random(bus, random.Random(1), 500)
+        report = bus.generate_report(0.5, sent[-1].timestamp)
+    finally:
+        bus.close()
+    
+    assert sorted(os.listdir(tmp_path)) == ["communications.jsonl", "communications.jsonl.1", "communications.jsonl.2"]
+    assert 0 < report["total_messages"] < len(sent)
+    assert os.path.getsize(path) <= 2000
+
+def test_journal_is_off_by_default():
+    bus = CommunicationBus()
+    try:
+        assert bus._journal is None
+    finally:
+        bus.close()
+
+def test_journal_path_is_opened_by_one_bus(tmp_path):
+    path = str(tmp_path / "communications.jsonl")
+    bus = CommunicationBus(journal_path=path)
+    try:
+        with pytest.raises(ValueError):
+            CommunicationBus(journal_path=path)
+    finally:
+        bus.close()
+    
+    # The path is free again once the first bus is closed
+    CommunicationBus(journal_path=path).close()
+
+def test_journal_after_close_and_unreadable_lines(tmp_path):
+    path = str(tmp_path / "communications.jsonl")
+    bus = CommunicationBus(max_messages=1, journal_path=path)
+    sent = _send_random(bus, random.Random(2), 10, start=time.time() - 100_000)
+    bus.close()
+    
+    # A torn line, then a message sent after close
+    with open(path, "ab") as journal:
+        journal.write(b'{"id": "torn\n')
+    late = Message("atlas", "bookkeeping", {}, "task")
+    bus.send_message(late)
+    
+    report = bus.generate_report(0.5, time.time() + 3600)
+    assert report["total_messages"] == len(sent) + 1
+    assert b'"atlas"' in open(path, "rb").read().splitlines()[-1]
@@ -0,0 +1,167 @@
+"""Test the batched dashboard client and the dashboard's /api/batch route."""
+
+import json
+import os
+import sqlite3
+import sys
+
+import pytest
+
+# Add the src directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from external_memory_system.dashboard.client import BatchedDashboardClient, _coalesce_tasks
+
+class FakeResponse:
+    """Just enough of requests.Response for the dashboard clients."""
+    
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self._body = body or {}
+        self.text = json.dumps(self._body)
+    
+    def json(self):
+        return self._body
+
+class FakeSession:
+    """Records posted reports and answers them with a handler."""
+    
+    def __init__(self, handler):
+        self.handler = handler
+        self.posts = []
+    
+    def post(self, url, data=None, headers=None):
+        path = url[len("http://dashboard"):]
+        payload = json.loads(data)
+        self.posts.append((path, payload))
+        return self.handler(path, payload)
+
+def _paths(posts):
+    """List the report paths sent, with batches expanded to their events."""
+    paths = []
+    for path, payload in posts:
+        if path == "/api/batch":
+            paths.append(("batch", [event["path"] for event in payload["events"]]))
+        else:
+            paths.append(path)
+    return paths
+
+def _send_tasks(handler):
+    """Send a short task and a log message through a batched client."""
+    session = FakeSession(handler)
+    client = BatchedDashboardClient("http://dashboard", flush_interval=1.0, session=session)
+    try:
+        client.create_task("t1", "atlas", "journal_entry", "routing")
+        client.log_message("atlas", "INFO", "hello")
+        client.update_task("t1", "completed", {"x": 1})
+        assert client.flush()
+    finally:
+        client.close()
+    return client, session
+
+def test_coalesce_tasks():
+    batch = [
+        ("/api/task/create", {"id": "t1", "agent_id": "a", "type": "je", "status": "pending", "description": "d"}),
+        ("/api/log", {"agent_id": "a", "level": "INFO", "message": "m"}),
+        ("/api/task/update", {"id": "t2", "status": "completed", "result": ""}),
+        ("/api/task/update", {"id": "t1", "status": "pending", "result": "1"}),
+        ("/api/task/update", {"id": "t1", "status": "completed", "result": "2"})
+    ]
+    
+    assert _coalesce_tasks(batch) == [
+        ("/api/task/report", {"id": "t1", "agent_id": "a", "type": "je", "status": "completed",
+                              "description": "d", "result": "2"}),
+        batch[1],
+        batch[2]
+    ]
+
+def test_batch_sends_task_report():
+    def handler(path, payload):
+        return FakeResponse(200, {"applied": len(payload["events"]), "rejected": [], "failed": []})
+    
+    client, session = _send_tasks(handler)
+    
+    assert _paths(session.posts) == [("batch", ["/api/task/report", "/api/log"])]
+    assert client._report_supported
+
+def test_batch_without_report_route_resends_create_and_update():
+    def handler(path, payload):
+        rejected = [i for i, event in enumerate(payload["events"]) if event["path"] == "/api/task/report"]
+        return FakeResponse(200, {"applied": len(payload["events"]) - len(rejected), "rejected": rejected})
+    
+    client, session = _send_tasks(handler)
+    
+    assert _paths(session.posts) == [
+        ("batch", ["/api/task/report", "/api/log"]),
+        ("batch", ["/api/task/create", "/api/task/update"])
+    ]
+    assert not client._report_supported
+
+def test_failed_report_is_not_resent():
+    def handler(path, payload):
+        return FakeResponse(200, {"applied": 1, "rejected": [0], "failed": [0]})
+    
+    client, session = _send_tasks(handler)
+    
+    assert _paths(session.posts) == [("batch", ["/api/task/report", "/api/log"])]
+    assert client._report_supported
+
+def test_dashboard_without_batch_route_gets_individual_reports():
+    def handler(path, payload):
+        return FakeResponse(404 if path == "/api/batch" else 200)
+    
+    client, session = _send_tasks(handler)
+    
+    assert _paths(session.posts) == [
+        ("batch", ["/api/task/report", "/api/log"]),
+        "/api/task/create", "/api/log", "/api/task/update"
+    ]
+    assert not client._batch_supported
+
+def test_batch_server_error_sends_reports_individually():
+    def handler(path, payload):
+        return FakeResponse(500 if path == "/api/batch" else 200)
+    
+    client, session = _send_tasks(handler)
+    
+    assert _paths(session.posts) == [
+        ("batch", ["/api/task/report", "/api/log"]),
+        "/api/task/create", "/api/log", "/api/task/update"
+    ]
+    assert client._batch_supported
+
+def test_batch_route_applies_duplicate_ids(tmp_path, monkeypatch):
+    """Repeated creates and reports for one task id update a single row."""
+    pytest.importorskip("flask")
+    monkeypatch.chdir(tmp_path)
+    from external_memory_system.dashboard import app as dashboard_app
+    
+    monkeypatch.setattr(dashboard_app, "DB_PATH", str(tmp_path / "agent_activities.db"))
+    dashboard_app.init_db()
+    client = dashboard_app.app.test_client()
+    
+    events = [
+        {"path": "/api/agent/register", "data": {"id": "atlas", "name": "Atlas", "type": "coordinator"}},
+        {"path": "/api/task/create", "data": {"id": "t1", "agent_id": "atlas", "type": "je", "description": "routing"}},
+        {"path": "/api/task/create", "data": {"id": "t1", "agent_id": "bookkeeping", "type": "je"}},
+        {"path": "/api/task/update", "data": {"id": "t1", "status": "completed", "result": "1"}},
+        {"path": "/api/task/report", "data": {"id": "t2", "agent_id": "atlas", "type": "je", "status": "pending"}},
+        {"path": "/api/task/report", "data": {"id": "t2", "agent_id": "atlas", "type": "je", "status": "error"}},
+        {"path": "/api/agent/register", "data": {"id": "bad", "name": None, "type": "x"}},
+        {"path": "/api/unknown", "data": {}}
+    ]
+    response = client.post("/api/batch", json={"events": events})
+    
+    assert response.status_code == 200
+    assert response.get_json()["applied"] == 6
+    assert response.get_json()["rejected"] == [6, 7]
+    assert response.get_json()["failed"] == [6]
+    
+    conn = sqlite3.connect(dashboard_app.DB_PATH)
+    try:
+        rows = conn.execute("SELECT id, agent_id, status, description FROM tasks ORDER BY id").fetchall()
+        agents = conn.execute("SELECT id FROM agents").fetchall()
+    finally:
+        conn.close()
+    assert rows == [("t1", "atlas", "completed", "routing"), ("t2", "atlas", "error", "")]
+    assert agents == [("atlas",)]